@@ -16,7 +16,7 @@ import argparse
 import subprocess
 import difflib
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional
 
 # Add the 'setup' directory to the Python import path
 setup_dir = Path(__file__).parent / "setup"
@@ -110,27 +110,41 @@ def setup_global_environment(args: argparse.Namespace):
     log_dir = args.install_dir / "logs" if not args.dry_run else None
     setup_logging("superclaude_hub", log_dir=log_dir, console_level=level)
 
-    # Log startup context
     logger = get_logger()
+
+    # Machine-readable output owns stdout; log lines go to stderr
+    if logger and getattr(args, "json", False):
+        logger.set_console_stream(sys.stderr)
+
+    # Log startup context
     if logger:
         logger.debug(f"SuperClaude.py called with operation: {getattr(args, 'operation', 'None')}")
         logger.debug(f"Arguments: {vars(args)}")
 
 
 def get_operation_modules() -> Dict[str, str]:
-    """Return supported operations and their descriptions"""
+    """
+    Return supported operations and their descriptions
+
+    This table is static on purpose: listing operations (for --help or the
+    no-argument overview) must not import any operation module. Each
+    operation's own arguments are registered by its module, which is only
+    imported when that operation is selected.
+    """
     return {
         "install": "Install SuperClaude framework components",
         "update": "Update existing SuperClaude installation",
         "uninstall": "Remove SuperClaude installation",
-        "backup": "Backup and restore operations"
+        "backup": "Backup and restore operations",
+        "mcp-bench": "Measure MCP server cold-start latency"
     }
 
 
 def load_operation_module(name: str):
     """Try to dynamically import an operation module"""
     try:
-        return __import__(f"setup.operations.{name}", fromlist=[name])
+        module_name = name.replace("-", "_")
+        return __import__(f"setup.operations.{module_name}", fromlist=[module_name])
     except ImportError as e:
         logger = get_logger()
         if logger:
@@ -138,10 +152,52 @@ def load_operation_module(name: str):
         return None
 
 
-def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]:
-    """Register subcommand parsers and map operation names to their run functions"""
+def get_selected_operation(argv: List[str]) -> Optional[str]:
+    """
+    Find the operation named on the command line without importing it
+
+    Uses a throwaway parser with only the global flags, so global options
+    before the operation (e.g. --install-dir PATH) are skipped the same way
+    the real parser skips them.
+
+    Args:
+        argv: Command line arguments (without program name)
+
+    Returns:
+        Operation name, or None if no known operation was given
+    """
+    selector = argparse.ArgumentParser(add_help=False, parents=[create_global_parser()])
+    selector.add_argument("operation", nargs="?")
+
+    try:
+        args, _ = selector.parse_known_args(argv)
+    except SystemExit:
+        return None  # Let the real parser report the problem
+
+    return args.operation if args.operation in get_operation_modules() else None
+
+
+def register_operation_parsers(subparsers, global_parser, selected: Optional[str] = None) -> Dict[str, Callable]:
+    """
+    Register subcommand parsers and map operation names to their run functions
+
+    Only the selected operation's module is imported; every other
+    operation gets a placeholder parser carrying just its description.
+
+    Args:
+        subparsers: Subparsers action of the main parser
+        global_parser: Parser holding the global flags
+        selected: Operation chosen on the command line (None for none)
+
+    Returns:
+        Dict of operation name to run function (None for legacy fallback)
+    """
     operations = {}
     for name, desc in get_operation_modules().items():
+        if name != selected:
+            subparsers.add_parser(name, help=desc, parents=[global_parser])
+            continue
+
         module = load_operation_module(name)
         if module and hasattr(module, 'register_parser') and hasattr(module, 'run'):
             module.register_parser(subparsers, global_parser)
@@ -187,7 +243,8 @@ def main() -> int:
     """Main entry point"""
     try:
         parser, subparsers, global_parser = create_parser()
-        operations = register_operation_parsers(subparsers, global_parser)
+        selected = get_selected_operation(sys.argv[1:])
+        operations = register_operation_parsers(subparsers, global_parser, selected)
         args = parser.parse_args()
 
         # No operation provided? Show help manually unless in quiet mode
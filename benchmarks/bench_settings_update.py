@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Benchmark SettingsManager.update_settings end to end on a multi-MB settings.json
+
+Generates a settings fixture shaped like a heavily customized user config
+(large permission lists, many hooks, nested env blocks) and times the
+public entry points - parse, merge, diff and the atomic write included -
+rather than _deep_merge on its own.
+
+Each scenario also runs against a baseline on the same fixture: the
+previous implementation, which handed every caller a deepcopy of the cached
+document and deep-copied base at every level of _deep_merge. Both write
+with atomic_write_json, so the comparison isolates the copying.
+
+Usage:
+    python benchmarks/bench_settings_update.py
+    python benchmarks/bench_settings_update.py --size-mb 8 --runs 10
+"""
+
+import argparse
+import copy
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.core import settings_manager  # noqa: E402
+from setup.core.file_manager import atomic_write_json  # noqa: E402
+from setup.core.settings_manager import SettingsManager  # noqa: E402
+
+
+class BaselineSettings:
+    """
+    The copy-heavy settings path this benchmark compares against
+
+    Caches the parsed document while the file's stat is unchanged, but
+    returns a deepcopy on every load, and merges with a _deep_merge that
+    deep-copies base at every level. Every update is written.
+    """
+
+    def __init__(self, settings_file: Path):
+        self.settings_file = settings_file
+        self._data = None
+        self._stat = None
+
+    def forget_cache(self) -> None:
+        self._data = None
+        self._stat = None
+
+    def _stat_key(self):
+        st = os.stat(self.settings_file)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def load_settings(self) -> Dict[str, Any]:
+        current_stat = self._stat_key()
+        if self._data is None or self._stat != current_stat:
+            with open(self.settings_file, 'r', encoding='utf-8') as f:
+                self._data = json.load(f)
+            self._stat = current_stat
+        return copy.deepcopy(self._data)
+
+    def _deep_merge(self, base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+        result = copy.deepcopy(base)
+        for key, value in overlay.items():
+            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+                result[key] = self._deep_merge(result[key], value)
+            else:
+                result[key] = copy.deepcopy(value)
+        return result
+
+    def update_settings(self, modifications: Dict[str, Any]) -> None:
+        merged = self._deep_merge(self.load_settings(), modifications)
+        atomic_write_json(self.settings_file, merged)
+        self._data = merged
+        self._stat = self._stat_key()
+
+    def get_setting(self, key_path: str, default: Any = None) -> Any:
+        value = self.load_settings()
+        try:
+            for key in key_path.split('.'):
+                value = value[key]
+            return value
+        except (KeyError, TypeError):
+            return default
+
+
+def build_fixture(size_mb: float) -> Dict[str, Any]:
+    """
+    Build a settings document of roughly the requested serialized size
+
+    Args:
+        size_mb: Target size of the indented JSON in megabytes
+
+    Returns:
+        Settings dict
+    """
+    settings: Dict[str, Any] = {
+        "permissions": {"allow": [], "deny": []},
+        "hooks": {},
+        "env": {},
+        "model": "sonnet"
+    }
+
+    target = int(size_mb * 1024 * 1024)
+    size = 0
+    i = 0
+    while size < target:
+        rule = f"Bash(./scripts/task_{i:06d}.sh --profile=ci --retries=3 --log-dir=/var/log/project/{i % 97})"
+        settings["permissions"]["allow"].append(rule)
+        settings["hooks"][f"PreToolUse_{i}"] = [{
+            "matcher": f"Tool{i % 31}",
+            "hooks": [{"type": "command", "command": f"python3 ~/.claude/hooks/check_{i}.py", "timeout": 30}]
+        }]
+        settings["env"][f"PROJECT_VAR_{i}"] = {"value": "x" * 40, "scope": ["dev", "ci", "prod"]}
+        size += len(rule) + 230 + 120
+        i += 1
+
+    return settings
+
+
+def time_call(fn: Callable[[], None], runs: int) -> List[float]:
+    """Time fn over several runs, in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def forget_cache() -> None:
+    """Drop the process-wide parsed-document cache so the next call parses again"""
+    settings_manager._documents.clear()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=8.0, help="Fixture size in MB (default: 8)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per scenario (default: 5)")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="sc-settings-bench-"))
+    try:
+        settings_file = work_dir / "settings.json"
+        fixture = build_fixture(args.size_mb)
+        settings_file.write_text(json.dumps(fixture, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Fixture: {settings_file.stat().st_size / (1024 * 1024):.1f} MB, "
+              f"{len(fixture['permissions']['allow'])} permission rules, {args.runs} runs per scenario")
+
+        manager = SettingsManager(work_dir)
+        baseline = BaselineSettings(settings_file)
+        counter = iter(range(10 ** 9))
+
+        def cold_update():
+            forget_cache()
+            manager.update_settings({"superclaude": {"run": next(counter)}}, create_backup=False)
+
+        def cold_update_baseline():
+            baseline.forget_cache()
+            baseline.update_settings({"superclaude": {"run": next(counter)}})
+
+        def warm_update():
+            manager.update_settings({"superclaude": {"run": next(counter)}}, create_backup=False)
+
+        def warm_update_baseline():
+            baseline.update_settings({"superclaude": {"run": next(counter)}})
+
+        def noop_update():
+            manager.update_settings({"model": "sonnet"}, create_backup=False)
+
+        def noop_update_baseline():
+            baseline.update_settings({"model": "sonnet"})
+
+        def session_updates():
+            with manager.session():
+                for key in ("hooks", "env", "permissions"):
+                    manager.update_settings({key: {f"superclaude_{next(counter)}": True}}, create_backup=False)
+
+        def session_updates_baseline():
+            for key in ("hooks", "env", "permissions"):
+                baseline.update_settings({key: {f"superclaude_{next(counter)}": True}})
+
+        def read_setting():
+            manager.get_setting("hooks.PreToolUse_0")
+
+        def read_setting_baseline():
+            baseline.get_setting("hooks.PreToolUse_0")
+
+        scenarios = [
+            ("update_settings, cold cache (parse + merge + write)", cold_update, cold_update_baseline),
+            ("update_settings, warm cache (merge + write)", warm_update, warm_update_baseline),
+            ("update_settings, no-op (write skipped)", noop_update, noop_update_baseline),
+            ("3x update_settings in one session (one write)", session_updates, session_updates_baseline),
+            ("get_setting, warm cache", read_setting, read_setting_baseline),
+        ]
+
+        # Warm both caches for the warm scenarios
+        manager.load_settings()
+        baseline.load_settings()
+        width = max(len(name) for name, _, _ in scenarios)
+        print(f"{'median of runs':<{width}}  {'current':>12}  {'baseline':>12}  {'speedup':>8}")
+        for name, fn, baseline_fn in scenarios:
+            current = statistics.median(time_call(fn, args.runs))
+            # The new path keeps its cache current; the baseline re-parses
+            # after the new path's writes, so resync it outside the timing
+            baseline.load_settings()
+            previous = statistics.median(time_call(baseline_fn, args.runs))
+            manager.load_settings()
+            print(f"{name:<{width}}  {current:9.2f} ms  {previous:9.2f} ms  "
+                  f"{previous / current if current else float('inf'):7.1f}x")
+    finally:
+        forget_cache()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,14 @@
 """Base classes for SuperClaude installation system"""
 
-from .component import Component
-from .installer import Installer
+from ..utils.lazy import lazy_exports
 
-__all__ = ['Component', 'Installer']
\ No newline at end of file
+# Public name -> defining submodule. Submodules are imported on first use,
+# so importing one module of this package does not load all of them.
+_EXPORTS = {
+    'Component': 'component',
+    'Installer': 'installer'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -5,11 +5,21 @@ Abstract base class for installable components
 from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple, Optional, Any
 from pathlib import Path
-import json
 
 
 class Component(ABC):
-    """Base class for all installable components"""
+    """
+    Base class for all installable components
+    
+    Subclasses declare METADATA and DEPENDENCIES as class attributes so the
+    component registry can describe them without creating an instance.
+    """
+    
+    # name, version, description and category of the component
+    METADATA: Dict[str, str] = {}
+    
+    # Names of components that must be installed first
+    DEPENDENCIES: List[str] = []
     
     def __init__(self, install_dir: Optional[Path] = None):
         """
@@ -25,10 +35,9 @@ class Component(ABC):
         self._files_to_install = None
         self._settings_modifications = None
     
-    @abstractmethod
     def get_metadata(self) -> Dict[str, str]:
         """
-        Return component metadata
+        Return component metadata (default: the METADATA class attribute)
         
         Returns:
             Dict containing:
@@ -37,7 +46,7 @@ class Component(ABC):
                 - description: Component description
                 - category: Component category (core, command, integration, etc.)
         """
-        pass
+        return dict(self.METADATA)
     
     @abstractmethod
     def validate_prerequisites(self) -> Tuple[bool, List[str]]:
@@ -92,15 +101,14 @@ class Component(ABC):
         """
         pass
     
-    @abstractmethod
     def get_dependencies(self) -> List[str]:
         """
-        Return list of component dependencies
+        Return list of component dependencies (default: the DEPENDENCIES class attribute)
         
         Returns:
             List of component names this component depends on
         """
-        pass
+        return list(self.DEPENDENCIES)
     
     def update(self, config: Dict[str, Any]) -> bool:
         """
@@ -124,16 +132,19 @@ class Component(ABC):
         Returns:
             Version string if installed, None otherwise
         """
-        settings_file = self.install_dir / "settings.json"
-        if settings_file.exists():
-            try:
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                component_name = self.get_metadata()['name']
-                return settings.get('components', {}).get(component_name, {}).get('version')
-            except Exception:
-                pass
-        return None
+        from ..core.settings_manager import SettingsManager
+        
+        try:
+            settings_manager = SettingsManager(self.install_dir)
+            component_name = self.get_metadata()['name']
+            
+            # Components register in metadata; older installs used settings.json
+            version = settings_manager.get_component_version(component_name)
+            if version is None:
+                version = settings_manager.get_setting(f"components.{component_name}.version")
+            return version
+        except Exception:
+            return None
     
     def is_installed(self) -> bool:
         """
@@ -164,6 +175,127 @@ class Component(ABC):
         
         return len(errors) == 0, errors
     
+    def remove_installed_files(self, file_manager) -> Tuple[int, List[Path]]:
+        """
+        Remove the files this component installed, as recorded in the install manifest
+        
+        Files the component would install today are removed as well, which
+        covers installations made before the manifest recorded owners. The
+        installation directory itself is never scanned.
+        
+        Args:
+            file_manager: FileManager to remove files with
+            
+        Returns:
+            Tuple of (number of files removed, files that could not be removed)
+        """
+        from ..core.manifest import InstallManifest
+        
+        manifest = InstallManifest(self.install_dir)
+        files = manifest.files_for(self.get_metadata()["name"])
+        files += [target for _, target in self.get_files_to_install()]
+        
+        previous_manifest = file_manager.manifest
+        file_manager.manifest = manifest
+        try:
+            removed, failed = file_manager.remove_files(files)
+        finally:
+            file_manager.manifest = previous_manifest
+        
+        if not file_manager.dry_run:
+            manifest.save()
+        
+        return removed, failed
+    
+    def configure_file_manager(self, config: Dict[str, Any]) -> None:
+        """
+        Point self.file_manager at the installer's shared state
+        
+        Shares the install manifest so unchanged files are not copied again,
+        stages changed files until the installer commits the transaction, and
+        journals each step so an interrupted install can be resumed.
+        
+        Args:
+            config: Installation configuration from the installer
+        """
+        self.file_manager.manifest = config.get("manifest")
+        self.file_manager.staging = config.get("staging")
+        self.file_manager.copy_mode = config.get("copy_mode", "auto")
+        self.file_manager.journal = config.get("journal")
+    
+    def link_or_copy(self, config: Dict[str, Any], files: List[Tuple[Path, Path]],
+                     kind: str) -> Optional[Tuple[Optional[Path], int]]:
+        """
+        Install files by linking them from the shared store, or by copying them
+        
+        Links when config names a store_dir and the store entry can be used,
+        otherwise copies each file through self.file_manager.
+        
+        Args:
+            config: Installation configuration from the installer
+            files: (source, target) pairs as returned by get_files_to_install
+            kind: What the files are, for log messages (e.g. "framework")
+            
+        Returns:
+            Tuple of (store entry path or None when copied, number of files
+            left unchanged), or None if some files could not be copied
+        """
+        from ..core.framework_store import FrameworkStoreError
+        
+        store_dir = config.get("store_dir")
+        if store_dir:
+            try:
+                entry, linked_count = self.link_files_from_store(Path(store_dir), files)
+                if self.file_manager.manifest is not None:
+                    for _, target in files:
+                        self.file_manager.manifest.claim(target)
+                return entry, len(files) - linked_count
+            except FrameworkStoreError as e:
+                self.logger.warning(f"{e} - copying {kind} files instead")
+        
+        skipped_before = len(self.file_manager.skipped_files)
+        success_count = 0
+        for source, target in files:
+            self.logger.debug(f"Copying {source.name} to {target}")
+            
+            if self.file_manager.copy_file(source, target):
+                success_count += 1
+                self.logger.debug(f"Successfully copied {source.name}")
+            else:
+                self.logger.error(f"Failed to copy {source.name}")
+        
+        if success_count != len(files):
+            self.logger.error(f"Only {success_count}/{len(files)} {kind} files copied successfully")
+            return None
+        
+        return None, len(self.file_manager.skipped_files) - skipped_before
+    
+    def link_files_from_store(self, store_dir: Path, files: List[Tuple[Path, Path]]) -> Tuple[Path, int]:
+        """
+        Publish files to a shared framework store and link the installation to it
+        
+        Args:
+            store_dir: Root of the shared store (e.g. /opt/superclaude)
+            files: (source, target) pairs as returned by get_files_to_install
+            
+        Returns:
+            Tuple of (store entry path, number of targets that were relinked)
+            
+        Raises:
+            FrameworkStoreError: If the store entry is missing and cannot be published
+        """
+        from ..core.framework_store import FrameworkStore
+        
+        store = FrameworkStore(store_dir)
+        metadata = self.get_metadata()
+        entry = store.publish(
+            metadata["name"], metadata["version"], {source.name: source for source, _ in files}
+        )
+        changed = store.link_into(
+            self.install_dir, metadata["name"], entry, [(source.name, target) for source, target in files]
+        )
+        return entry, changed
+    
     def get_size_estimate(self) -> int:
         """
         Estimate installed size in bytes
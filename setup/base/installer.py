@@ -2,34 +2,46 @@
 Base installer logic for SuperClaude installation system
 """
 
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any, Iterator
 from pathlib import Path
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
 import shutil
-import tempfile
+import threading
 from datetime import datetime
 from .component import Component
+from ..core.manifest import InstallManifest
+from ..core.staging import StagedInstall
+from ..core.journal import InstallJournal
+from ..core.backup_store import BackupStore
+from ..core.settings_manager import SettingsManager
 
 
 class Installer:
     """Main installer orchestrator"""
     
-    def __init__(self, install_dir: Optional[Path] = None, dry_run: bool = False):
+    def __init__(self, install_dir: Optional[Path] = None, dry_run: bool = False, max_workers: int = 4):
         """
         Initialize installer
         
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            max_workers: Maximum number of components installed concurrently
+                         within one dependency level (1 = serial)
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
         self.components: Dict[str, Component] = {}
         self.installed_components: Set[str] = set()
+        self.updated_components: Set[str] = set()
         self.failed_components: Set[str] = set()
         self.skipped_components: Set[str] = set()
+        self.component_errors: Dict[str, List[str]] = {}
         self.backup_path: Optional[Path] = None
+        self._results_lock = threading.Lock()
         
     def register_component(self, component: Component) -> None:
         """
@@ -92,6 +104,41 @@ class Installer:
             
         return resolved
     
+    def get_installation_levels(self, component_names: List[str]) -> List[List[str]]:
+        """
+        Group components by dependency level
+        
+        Args:
+            component_names: List of component names to install
+            
+        Returns:
+            List of lists, where each inner list contains components whose
+            dependencies are all satisfied by earlier levels
+            
+        Raises:
+            ValueError: If circular dependencies detected or unknown component
+        """
+        ordered = self.resolve_dependencies(component_names)
+        
+        levels = []
+        placed: Set[str] = set()
+        remaining = list(ordered)
+        
+        while remaining:
+            current_level = [
+                name for name in remaining
+                if set(self.components[name].get_dependencies()) <= placed
+            ]
+            
+            if not current_level:
+                raise ValueError("Circular dependency detected in installation order calculation")
+            
+            levels.append(current_level)
+            placed.update(current_level)
+            remaining = [name for name in remaining if name not in placed]
+        
+        return levels
+    
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
         Validate system requirements for all registered components
@@ -126,54 +173,22 @@ class Installer:
         Create backup of existing installation
         
         Returns:
-            Path to backup archive or None if no existing installation
+            Path to backup snapshot manifest or None if no existing installation
         """
         if not self.install_dir.exists():
             return None
             
         if self.dry_run:
-            return self.install_dir / "backup_dryrun.tar.gz"
+            return self.install_dir / "backups" / "snapshots" / "backup_dryrun.json"
             
-        # Create backup directory
-        backup_dir = self.install_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
-        
-        # Create timestamped backup
+        # Snapshot into the deduplicating store - only changed files are read and stored
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"superclaude_backup_{timestamp}"
-        backup_path = backup_dir / f"{backup_name}.tar.gz"
-        
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_backup = Path(temp_dir) / backup_name
-            
-            # Ensure temp backup directory exists
-            temp_backup.mkdir(parents=True, exist_ok=True)
-            
-            # Copy all files except backups directory
-            for item in self.install_dir.iterdir():
-                if item.name != "backups":
-                    try:
-                        if item.is_file():
-                            shutil.copy2(item, temp_backup / item.name)
-                        elif item.is_dir():
-                            shutil.copytree(item, temp_backup / item.name)
-                    except Exception as e:
-                        # Log warning but continue backup process
-                        print(f"Warning: Could not backup {item.name}: {e}")
-            
-            # Create archive only if there are files to backup
-            if any(temp_backup.iterdir()):
-                shutil.make_archive(
-                    backup_path.with_suffix(''),
-                    'gztar',
-                    temp_dir,
-                    backup_name
-                )
-            else:
-                # Create empty backup file to indicate backup was attempted
-                backup_path.touch()
-                print(f"Warning: No files to backup, created empty backup marker: {backup_path.name}")
+        store = BackupStore(self.install_dir / "backups")
+        backup_path, stats = store.create_snapshot(self.install_dir, backup_name)
+        
+        if stats["files"] == 0:
+            print(f"Warning: No files to backup, created empty snapshot: {backup_path.name}")
         
         self.backup_path = backup_path
         return backup_path
@@ -204,7 +219,7 @@ class Installer:
             print(f"Prerequisites failed for {component_name}:")
             for error in errors:
                 print(f"  - {error}")
-            self.failed_components.add(component_name)
+            self._record_failure(component_name, errors)
             return False
         
         # Perform installation
@@ -213,25 +228,133 @@ class Installer:
                 print(f"[DRY RUN] Would install {component_name}")
                 success = True
             else:
-                success = component.install(config)
+                with self._component_owner(config, component_name):
+                    success = component.install(config)
                 
             if success:
-                self.installed_components.add(component_name)
+                with self._results_lock:
+                    self.installed_components.add(component_name)
                 # Component handles its own metadata registration
             else:
-                self.failed_components.add(component_name)
+                self._record_failure(component_name, ["Component installation returned failure"])
                 
             return success
             
         except Exception as e:
             print(f"Error installing {component_name}: {e}")
-            self.failed_components.add(component_name)
+            self._record_failure(component_name, [str(e)])
             return False
     
+    def update_component(self, component_name: str, config: Dict[str, Any]) -> bool:
+        """
+        Update a single installed component
+        
+        Args:
+            component_name: Name of component to update
+            config: Update configuration
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if component_name not in self.components:
+            raise ValueError(f"Unknown component: {component_name}")
+            
+        component = self.components[component_name]
+        
+        # Skip if already updated
+        if component_name in self.updated_components:
+            return True
+        
+        try:
+            if self.dry_run:
+                print(f"[DRY RUN] Would update {component_name}")
+                success = True
+            else:
+                with self._component_owner(config, component_name):
+                    success = component.update(config)
+                
+            if success:
+                with self._results_lock:
+                    self.updated_components.add(component_name)
+            else:
+                self._record_failure(component_name, ["Component update returned failure"])
+                
+            return success
+            
+        except Exception as e:
+            print(f"Error updating {component_name}: {e}")
+            self._record_failure(component_name, [str(e)])
+            return False
+    
+    def _record_failure(self, component_name: str, errors: List[str]) -> None:
+        """Record a failed component together with its error messages"""
+        with self._results_lock:
+            self.failed_components.add(component_name)
+            self.component_errors.setdefault(component_name, []).extend(errors)
+    
+    def _install_level(self, level: List[str], config: Dict[str, Any], update: bool = False) -> bool:
+        """
+        Install one dependency level, running its components concurrently
+        
+        Args:
+            level: Component names with no dependencies on each other
+            config: Installation configuration
+            update: If True, update components instead of installing them
+            
+        Returns:
+            True if every component in the level succeeded, False otherwise
+        """
+        worker = self.update_component if update else self.install_component
+        verb = "Updating" if update else "Installing"
+        done = "updated" if update else "installed"
+        
+        runnable = []
+        for name in level:
+            blocked_by = [
+                dep for dep in self.components[name].get_dependencies()
+                if dep in self.failed_components or dep in self.skipped_components
+            ]
+            if blocked_by:
+                print(f"\nSkipping {name}: dependency failed ({', '.join(blocked_by)})")
+                with self._results_lock:
+                    self.skipped_components.add(name)
+                    self.component_errors.setdefault(name, []).append(
+                        f"Skipped because dependency failed: {', '.join(blocked_by)}"
+                    )
+            else:
+                runnable.append(name)
+        
+        all_success = len(runnable) == len(level)
+        
+        # Single component or serial mode - no pool overhead
+        if len(runnable) <= 1 or self.max_workers == 1:
+            for name in runnable:
+                print(f"\n{verb} {name}...")
+                if not worker(name, config):
+                    all_success = False
+            return all_success
+        
+        print(f"\n{verb} {', '.join(runnable)} in parallel...")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(runnable))) as pool:
+            futures = {pool.submit(worker, name, config): name for name in runnable}
+            for future in as_completed(futures):
+                name = futures[future]
+                if future.result():
+                    print(f"  ✓ {name} {done}")
+                else:
+                    print(f"  ✗ {name} failed")
+                    all_success = False
+        
+        return all_success
+    
     def install_components(self, component_names: List[str], config: Optional[Dict[str, Any]] = None) -> bool:
         """
         Install multiple components in dependency order
         
+        Components in the same dependency level are installed concurrently
+        (bounded by max_workers); a component is skipped if any of its
+        dependencies failed.
+        
         Args:
             component_names: List of component names to install
             config: Installation configuration
@@ -239,35 +362,52 @@ class Installer:
         Returns:
             True if all successful, False if any failed
         """
-        config = config or {}
+        # Checked before the journal and staging directories are created in it
+        had_installation = self.install_dir.exists()
+        config = self._prepare_config(config, journal=True)
         
-        # Resolve dependencies
+        # Resolve dependencies into parallelizable levels
         try:
-            ordered_names = self.resolve_dependencies(component_names)
+            levels = self.get_installation_levels(component_names)
         except ValueError as e:
             print(f"Dependency resolution error: {e}")
             return False
         
+        journal = config.get("journal")
+        if journal is not None:
+            staging = config.get("staging")
+            journal.start(component_names, staging.txn_dir.name if staging is not None else None)
+        
         # Validate system requirements
         success, errors = self.validate_system_requirements()
         if not success:
             print("System requirements not met:")
             for error in errors:
                 print(f"  - {error}")
+            if journal is not None:
+                journal.finish(False)
             return False
         
         # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
-            print("Creating backup of existing installation...")
-            self.create_backup()
+        self._backup_step(config, journal, had_installation)
         
-        # Install each component
+        # Install each dependency level; metadata and settings are written once at the end
         all_success = True
-        for name in ordered_names:
-            print(f"\nInstalling {name}...")
-            if not self.install_component(name, config):
+        with self._settings_session(journal):
+            for level in levels:
+                if not self._install_level(level, config):
+                    all_success = False
+                    # Continue installing other components even if one fails
+                if journal is not None:
+                    journal.sync()
+            
+            if not self._commit_staging(config):
                 all_success = False
-                # Continue installing other components even if one fails
+        
+        self._save_manifest(config)
+        
+        if journal is not None:
+            journal.finish(all_success)
         
         # Post-installation validation
         if all_success and not self.dry_run:
@@ -275,6 +415,221 @@ class Installer:
         
         return all_success
     
+    def update_components(self, component_names: List[str], config: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Update multiple components in dependency order
+        
+        Args:
+            component_names: List of component names to update
+            config: Update configuration
+            
+        Returns:
+            True if all successful, False if any failed
+        """
+        config = self._prepare_config(config)
+        
+        # Only update the requested components, but keep dependency order
+        try:
+            levels = [
+                [name for name in level if name in component_names]
+                for level in self.get_installation_levels(component_names)
+            ]
+        except ValueError as e:
+            print(f"Dependency resolution error: {e}")
+            return False
+        
+        if config.get("backup", True) and self.install_dir.exists() and not self.dry_run:
+            print("Creating backup of existing installation...")
+            self.create_backup()
+        
+        all_success = True
+        with self._settings_session():
+            for level in levels:
+                if level and not self._install_level(level, config, update=True):
+                    all_success = False
+            
+            if not self._commit_staging(config):
+                all_success = False
+        
+        self._save_manifest(config)
+        
+        return all_success
+    
+    def _prepare_config(self, config: Optional[Dict[str, Any]], journal: bool = False) -> Dict[str, Any]:
+        """
+        Copy configuration and attach the shared file manifest, staging transaction
+        and (for installs) the operation journal
+        
+        Args:
+            config: Caller supplied configuration
+            journal: Journal this run so it can be resumed; with config["resume"]
+                     the journal of an interrupted run is loaded and continued
+            
+        Returns:
+            Configuration dict used for this run
+        """
+        config = dict(config or {})
+        
+        resume_txn = None
+        if journal and not self.dry_run and "journal" not in config:
+            install_journal = InstallJournal(self.install_dir)
+            if config.get("resume"):
+                if install_journal.load():
+                    resume_txn = install_journal.staging_name
+                    print("Resuming interrupted installation")
+                else:
+                    print("No interrupted installation to resume, installing from scratch")
+            elif install_journal.exists():
+                print("Discarding the journal of an unfinished installation (use --resume to continue one)")
+            config["journal"] = install_journal
+        
+        if config.get("incremental", True) and not self.dry_run and "manifest" not in config:
+            config["manifest"] = InstallManifest(self.install_dir)
+        
+        if config.get("staged", True) and not self.dry_run and "staging" not in config:
+            # Undo any commit a previous run did not finish before staging anew;
+            # a resumed run keeps the staged files of the run it continues
+            recovered = StagedInstall.recover(self.install_dir, keep=resume_txn)
+            if recovered:
+                print(f"Rolled back {recovered} interrupted installation(s)")
+            if resume_txn and not (self.install_dir / StagedInstall.STAGING_DIR / resume_txn).is_dir():
+                resume_txn = None
+            config["staging"] = StagedInstall(self.install_dir, resume_txn)
+        
+        return config
+    
+    def _backup_step(self, config: Dict[str, Any], journal, had_installation: bool) -> None:
+        """
+        Back up the existing installation as a journaled step
+        
+        The outcome (snapshot taken, or nothing to back up) is journaled, so
+        a resumed run skips the step only if the interrupted run finished it
+        and never snapshots its own half-installed files as "the original".
+        
+        Args:
+            config: Installation configuration
+            journal: Optional InstallJournal of this run
+            had_installation: Whether the install directory existed before this run
+        """
+        done = journal.completed("backup", "install") if journal is not None else None
+        if done is not None:
+            if done.get("snapshot"):
+                self.backup_path = Path(done["snapshot"])
+                print(f"Keeping backup from the interrupted installation: {self.backup_path.name}")
+            return
+        
+        seq = journal.begin("backup", "install") if journal is not None else None
+        snapshot = None
+        if config.get("backup", True) and had_installation and not self.dry_run:
+            print("Creating backup of existing installation...")
+            snapshot = self.create_backup()
+        
+        if journal is not None:
+            journal.complete(seq, "backup", "install", snapshot=str(snapshot) if snapshot else None)
+            journal.sync()
+    
+    @contextmanager
+    def _settings_session(self, journal=None) -> Iterator[None]:
+        """
+        Batch every component's settings/metadata writes into one flush
+        
+        Args:
+            journal: Optional InstallJournal recording the flush as a metadata step
+        """
+        if self.dry_run:
+            yield
+            return
+        
+        with SettingsManager(self.install_dir).session():
+            yield
+            # Still inside the session: the flush happens on leaving it
+            seq = journal.begin("metadata", "settings") if journal is not None else None
+        
+        if journal is not None:
+            journal.complete(seq, "metadata", "settings")
+    
+    @contextmanager
+    def _component_owner(self, config: Dict[str, Any], component_name: str) -> Iterator[None]:
+        """Attribute files staged and recorded in the manifest while running a component to it"""
+        with ExitStack() as stack:
+            for tracker in (config.get("staging"), config.get("manifest")):
+                if tracker is not None:
+                    stack.enter_context(tracker.owned_by(component_name))
+            yield
+    
+    def _commit_staging(self, config: Dict[str, Any]) -> bool:
+        """
+        Switch staged files of successful components into the install directory
+        
+        Files staged by failed components are discarded, leaving their
+        previously installed versions untouched; their manifest records and
+        metadata registrations are reverted too. Runs inside the settings
+        session, so nothing is flushed for rolled-back components.
+        
+        Args:
+            config: Run configuration holding the staging transaction
+            
+        Returns:
+            True if the commit succeeded (or nothing was staged), False otherwise
+        """
+        staging = config.get("staging")
+        if staging is None:
+            return True
+        
+        try:
+            succeeded = self.installed_components | self.updated_components
+            if not staging.commit(owners=succeeded):
+                for name in succeeded:
+                    self._record_failure(name, ["Could not switch staged files into place (rolled back)"])
+                with self._results_lock:
+                    self.installed_components.clear()
+                    self.updated_components.clear()
+                self._revert_components(config, succeeded | self.failed_components, everything=True)
+                return False
+            
+            # Failed components' staged files were discarded - so are their records
+            self._revert_components(config, set(self.failed_components))
+            return True
+        finally:
+            staging.cleanup()
+    
+    def _revert_components(self, config: Dict[str, Any], components: Set[str],
+                           everything: bool = False) -> None:
+        """
+        Forget what components whose staged files were discarded recorded
+        
+        Must run inside the settings session, before its flush.
+        
+        Args:
+            config: Run configuration holding the manifest
+            components: Rolled-back component names
+            everything: The whole commit was rolled back - discard every
+                        pending settings and metadata change of this run
+        """
+        manifest = config.get("manifest")
+        if manifest is not None and components:
+            manifest.revert(components)
+        
+        if self.dry_run or not (components or everything):
+            return
+        settings_manager = SettingsManager(self.install_dir)
+        if everything:
+            settings_manager.discard_pending()
+        else:
+            settings_manager.discard_pending(components)
+    
+    def _save_manifest(self, config: Dict[str, Any]) -> None:
+        """Persist the file manifest once all components have run"""
+        manifest = config.get("manifest")
+        if manifest is None:
+            return
+        
+        try:
+            manifest.save()
+        except Exception as e:
+            # Missing manifest only means the next run re-hashes installed files
+            print(f"Warning: Could not save install manifest: {e}")
+    
     def uninstall_component(self, component_name: str) -> bool:
         """
         Uninstall a single component
@@ -306,64 +661,58 @@ class Installer:
         """Update settings.json with component registration"""
         if self.dry_run:
             return
-            
-        settings_file = self.install_dir / "settings.json"
-        settings = {}
         
-        if settings_file.exists():
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-        
-        # Update components registry
-        if 'components' not in settings:
-            settings['components'] = {}
+        settings_manager = SettingsManager(self.install_dir)
+        with settings_manager.settings_lock():
+            settings = settings_manager.load_settings()
             
-        metadata = component.get_metadata()
-        settings['components'][metadata['name']] = {
-            'version': metadata['version'],
-            'installed_at': datetime.now().isoformat(),
-            'category': metadata.get('category', 'unknown')
-        }
-        
-        # Update framework.components array for operation compatibility
-        if 'framework' not in settings:
-            settings['framework'] = {}
-        if 'components' not in settings['framework']:
-            settings['framework']['components'] = []
-        
-        # Add component to framework.components if not already present
-        component_name = metadata['name']
-        if component_name not in settings['framework']['components']:
-            settings['framework']['components'].append(component_name)
-        
-        # Save settings
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=2)
+            # Update components registry
+            if 'components' not in settings:
+                settings['components'] = {}
+                
+            metadata = component.get_metadata()
+            settings['components'][metadata['name']] = {
+                'version': metadata['version'],
+                'installed_at': datetime.now().isoformat(),
+                'category': metadata.get('category', 'unknown')
+            }
+            
+            # Update framework.components array for operation compatibility
+            if 'framework' not in settings:
+                settings['framework'] = {}
+            if 'components' not in settings['framework']:
+                settings['framework']['components'] = []
+            
+            # Add component to framework.components if not already present
+            component_name = metadata['name']
+            if component_name not in settings['framework']['components']:
+                settings['framework']['components'].append(component_name)
+            
+            # Save settings
+            settings_manager.save_settings(settings, create_backup=False)
     
     def _remove_from_settings_registry(self, component_name: str) -> None:
         """Remove component from settings.json registry"""
         if self.dry_run:
             return
+        
+        settings_manager = SettingsManager(self.install_dir)
+        with settings_manager.settings_lock():
+            if not settings_manager.settings_file.exists():
+                return
             
-        settings_file = self.install_dir / "settings.json"
-        if not settings_file.exists():
-            return
+            settings = settings_manager.load_settings()
             
-        with open(settings_file, 'r') as f:
-            settings = json.load(f)
-        
-        # Remove from components registry
-        if 'components' in settings and component_name in settings['components']:
-            del settings['components'][component_name]
-        
-        # Remove from framework.components array for operation compatibility
-        if 'framework' in settings and 'components' in settings['framework']:
-            if component_name in settings['framework']['components']:
-                settings['framework']['components'].remove(component_name)
+            # Remove from components registry
+            if 'components' in settings and component_name in settings['components']:
+                del settings['components'][component_name]
+            
+            # Remove from framework.components array for operation compatibility
+            if 'framework' in settings and 'components' in settings['framework']:
+                if component_name in settings['framework']['components']:
+                    settings['framework']['components'].remove(component_name)
             
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=2)
+            settings_manager.save_settings(settings, create_backup=False)
     
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
@@ -387,6 +736,23 @@ class Installer:
         else:
             print("\nSome components failed validation. Check errors above.")
     
+    def get_update_summary(self) -> Dict[str, Any]:
+        """
+        Get summary of update results
+        
+        Returns:
+            Dict with update statistics and results
+        """
+        return {
+            'updated': list(self.updated_components),
+            'failed': list(self.failed_components),
+            'skipped': list(self.skipped_components),
+            'errors': {name: list(errors) for name, errors in self.component_errors.items()},
+            'backup_path': str(self.backup_path) if self.backup_path else None,
+            'install_dir': str(self.install_dir),
+            'dry_run': self.dry_run
+        }
+    
     def get_installation_summary(self) -> Dict[str, Any]:
         """
         Get summary of installation results
@@ -398,6 +764,7 @@ class Installer:
             'installed': list(self.installed_components),
             'failed': list(self.failed_components),
             'skipped': list(self.skipped_components),
+            'errors': {name: list(errors) for name, errors in self.component_errors.items()},
             'backup_path': str(self.backup_path) if self.backup_path else None,
             'install_dir': str(self.install_dir),
             'dry_run': self.dry_run
@@ -8,6 +8,7 @@ from pathlib import Path
 from ..base.component import Component
 from ..core.file_manager import FileManager
 from ..core.settings_manager import SettingsManager
+from ..core.framework_store import FrameworkStore
 from ..utils.security import SecurityValidator
 from ..utils.logger import get_logger
 
@@ -15,6 +16,15 @@ from ..utils.logger import get_logger
 class CommandsComponent(Component):
     """SuperClaude slash commands component"""
     
+    METADATA = {
+        "name": "commands",
+        "version": "3.0.0",
+        "description": "SuperClaude slash command definitions",
+        "category": "commands"
+    }
+    
+    DEPENDENCIES = ["core"]
+    
     def __init__(self, install_dir: Path = None):
         """Initialize commands component"""
         super().__init__(install_dir)
@@ -25,15 +35,6 @@ class CommandsComponent(Component):
         # Dynamically discover command files to install
         self.command_files = self._discover_command_files()
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "commands",
-            "version": "3.0.0",
-            "description": "SuperClaude slash command definitions",
-            "category": "commands"
-        }
-    
     def validate_prerequisites(self) -> Tuple[bool, List[str]]:
         """Check prerequisites"""
         errors = []
@@ -103,6 +104,8 @@ class CommandsComponent(Component):
         try:
             self.logger.info("Installing SuperClaude command definitions...")
             
+            self.configure_file_manager(config)
+            
             # Check for and migrate existing commands from old location
             self._migrate_existing_commands()
             
@@ -132,35 +135,29 @@ class CommandsComponent(Component):
                 self.logger.error(f"Could not create commands directory: {commands_dir}")
                 return False
             
-            # Copy command files
-            success_count = 0
-            for source, target in files_to_install:
-                self.logger.debug(f"Copying {source.name} to {target}")
-                
-                if self.file_manager.copy_file(source, target):
-                    success_count += 1
-                    self.logger.debug(f"Successfully copied {source.name}")
-                else:
-                    self.logger.error(f"Failed to copy {source.name}")
-            
-            if success_count != len(files_to_install):
-                self.logger.error(f"Only {success_count}/{len(files_to_install)} command files copied successfully")
+            # Link from the shared store if one is configured, else copy
+            installed = self.link_or_copy(config, files_to_install, "command")
+            if installed is None:
                 return False
+            store_entry, skipped_count = installed
             
             # Update metadata
             try:
                 # Add component registration to metadata
-                self.settings_manager.add_component_registration("commands", {
+                registration = {
                     "version": "3.0.0",
                     "category": "commands",
                     "files_count": len(self.command_files)
-                })
+                }
+                if store_entry is not None:
+                    registration["store"] = str(store_entry)
+                self.settings_manager.add_component_registration("commands", registration)
                 self.logger.info("Updated metadata with commands component registration")
             except Exception as e:
                 self.logger.error(f"Failed to update metadata: {e}")
                 return False
             
-            self.logger.success(f"Commands component installed successfully ({success_count} command files)")
+            self.logger.success(f"Commands component installed successfully ({len(files_to_install)} command files, {skipped_count} unchanged)")
             return True
             
         except Exception as e:
@@ -172,17 +169,11 @@ class CommandsComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude commands component...")
             
-            # Remove command files from sc subdirectory
+            # Remove command files recorded in the install manifest
             commands_dir = self.install_dir / "commands" / "sc"
-            removed_count = 0
-            
-            for filename in self.command_files:
-                file_path = commands_dir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
-                else:
-                    self.logger.warning(f"Could not remove {filename}")
+            removed_count, failed = self.remove_installed_files(self.file_manager)
+            for file_path in failed:
+                self.logger.warning(f"Could not remove {file_path.name}")
             
             # Also check and remove any old commands in root commands directory
             old_commands_dir = self.install_dir / "commands"
@@ -220,6 +211,9 @@ class CommandsComponent(Component):
             except Exception as e:
                 self.logger.warning(f"Could not remove commands directory: {e}")
             
+            # Drop the link to the shared framework store, if any
+            FrameworkStore.unlink_from(self.install_dir, "commands")
+            
             # Update metadata to remove commands component
             try:
                 if self.settings_manager.is_component_installed("commands"):
@@ -235,10 +229,6 @@ class CommandsComponent(Component):
             self.logger.exception(f"Unexpected error during commands uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update commands component"""
         try:
@@ -258,7 +248,8 @@ class CommandsComponent(Component):
             commands_dir = self.install_dir / "commands" / "sc"
             backup_files = []
             
-            if commands_dir.exists():
+            # A staged update never touches the live files, so no copies are needed
+            if commands_dir.exists() and config.get("staging") is None:
                 for filename in self.command_files:
                     file_path = commands_dir / filename
                     if file_path.exists():
@@ -324,6 +315,14 @@ class CommandsComponent(Component):
             if installed_version != expected_version:
                 errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
+        # Linked installs must point at an intact store entry
+        registration = self.settings_manager.get_installed_components().get("commands", {})
+        if registration.get("store"):
+            errors.extend(FrameworkStore.validate_link(
+                self.install_dir, "commands",
+                [(source.name, target) for source, target in self.get_files_to_install()]
+            ))
+        
         return len(errors) == 0, errors
     
     def _discover_command_files(self) -> List[str]:
@@ -452,8 +451,8 @@ class CommandsComponent(Component):
                     new_file_path = new_commands_dir / filename
                     
                     try:
-                        # Copy file to new location
-                        if self.file_manager.copy_file(old_file_path, new_file_path):
+                        # Copy file to new location (directly - the old copy is removed right away)
+                        if self.file_manager.copy_file(old_file_path, new_file_path, direct=True):
                             # Remove old file
                             if self.file_manager.remove_file(old_file_path):
                                 migrated_count += 1
@@ -10,6 +10,7 @@ import shutil
 from ..base.component import Component
 from ..core.file_manager import FileManager
 from ..core.settings_manager import SettingsManager
+from ..core.framework_store import FrameworkStore
 from ..utils.security import SecurityValidator
 from ..utils.logger import get_logger
 
@@ -17,6 +18,15 @@ from ..utils.logger import get_logger
 class CoreComponent(Component):
     """Core SuperClaude framework files component"""
     
+    METADATA = {
+        "name": "core",
+        "version": "3.0.0",
+        "description": "SuperClaude framework documentation and core files",
+        "category": "core"
+    }
+    
+    DEPENDENCIES = []
+    
     def __init__(self, install_dir: Path = None):
         """Initialize core component"""
         super().__init__(install_dir)
@@ -27,15 +37,6 @@ class CoreComponent(Component):
         # Dynamically discover framework files to install
         self.framework_files = self._discover_framework_files()
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "core",
-            "version": "3.0.0",
-            "description": "SuperClaude framework documentation and core files",
-            "category": "core"
-        }
-    
     def validate_prerequisites(self) -> Tuple[bool, List[str]]:
         """Check prerequisites for core component"""
         errors = []
@@ -110,6 +111,8 @@ class CoreComponent(Component):
         try:
             self.logger.info("Installing SuperClaude core framework files...")
             
+            self.configure_file_manager(config)
+            
             # Validate installation
             success, errors = self.validate_prerequisites()
             if not success:
@@ -135,36 +138,28 @@ class CoreComponent(Component):
                 self.logger.error(f"Could not create install directory: {self.install_dir}")
                 return False
             
-            # Copy framework files
-            success_count = 0
-            for source, target in files_to_install:
-                self.logger.debug(f"Copying {source.name} to {target}")
-                
-                if self.file_manager.copy_file(source, target):
-                    success_count += 1
-                    self.logger.debug(f"Successfully copied {source.name}")
-                else:
-                    self.logger.error(f"Failed to copy {source.name}")
-            
-            if success_count != len(files_to_install):
-                self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
+            # Link from the shared store if one is configured, else copy
+            installed = self.link_or_copy(config, files_to_install, "framework")
+            if installed is None:
                 return False
+            store_entry, skipped_count = installed
             
             # Create or update metadata
             try:
                 metadata_mods = self.get_metadata_modifications()
                 # Update metadata directly
-                existing_metadata = self.settings_manager.load_metadata()
-                merged_metadata = self.settings_manager._deep_merge(existing_metadata, metadata_mods)
-                self.settings_manager.save_metadata(merged_metadata)
+                self.settings_manager.update_metadata(metadata_mods)
                 self.logger.info("Updated metadata with framework configuration")
                 
                 # Add component registration to metadata
-                self.settings_manager.add_component_registration("core", {
+                registration = {
                     "version": "3.0.0",
                     "category": "core",
                     "files_count": len(self.framework_files)
-                })
+                }
+                if store_entry is not None:
+                    registration["store"] = str(store_entry)
+                self.settings_manager.add_component_registration("core", registration)
                 self.logger.info("Updated metadata with core component registration")
                 
                 # Migrate any existing SuperClaude data from settings.json
@@ -181,7 +176,7 @@ class CoreComponent(Component):
                 if not self.file_manager.ensure_directory(dir_path):
                     self.logger.warning(f"Could not create directory: {dir_path}")
             
-            self.logger.success(f"Core component installed successfully ({success_count} files)")
+            self.logger.success(f"Core component installed successfully ({len(files_to_install)} files, {skipped_count} unchanged)")
             return True
             
         except Exception as e:
@@ -193,15 +188,13 @@ class CoreComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude core component...")
             
-            # Remove framework files
-            removed_count = 0
-            for filename in self.framework_files:
-                file_path = self.install_dir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
-                else:
-                    self.logger.warning(f"Could not remove {filename}")
+            # Remove framework files recorded in the install manifest
+            removed_count, failed = self.remove_installed_files(self.file_manager)
+            for file_path in failed:
+                self.logger.warning(f"Could not remove {file_path.name}")
+            
+            # Drop the link to the shared framework store, if any
+            FrameworkStore.unlink_from(self.install_dir, "core")
             
             # Update metadata to remove core component
             try:
@@ -218,10 +211,6 @@ class CoreComponent(Component):
             self.logger.exception(f"Unexpected error during core uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get component dependencies (core has none)"""
-        return []
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update core component"""
         try:
@@ -238,10 +227,11 @@ class CoreComponent(Component):
             self.logger.info(f"Updating core component from {current_version} to {target_version}")
             
             # Create backup of existing files
+            # (a staged update never touches the live files, so no copies are needed)
             backup_files = []
             for filename in self.framework_files:
                 file_path = self.install_dir / filename
-                if file_path.exists():
+                if file_path.exists() and config.get("staging") is None:
                     backup_path = self.file_manager.backup_file(file_path)
                     if backup_path:
                         backup_files.append(backup_path)
@@ -298,6 +288,14 @@ class CoreComponent(Component):
             if installed_version != expected_version:
                 errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
+        # Linked installs must point at an intact store entry
+        registration = self.settings_manager.get_installed_components().get("core", {})
+        if registration.get("store"):
+            errors.extend(FrameworkStore.validate_link(
+                self.install_dir, "core",
+                [(source.name, target) for source, target in self.get_files_to_install()]
+            ))
+        
         # Check metadata structure
         try:
             framework_config = self.settings_manager.get_metadata_setting("framework")
@@ -15,6 +15,15 @@ from ..utils.logger import get_logger
 class HooksComponent(Component):
     """Claude Code hooks integration component"""
     
+    METADATA = {
+        "name": "hooks",
+        "version": "3.0.0",
+        "description": "Claude Code hooks integration (future-ready)",
+        "category": "integration"
+    }
+    
+    DEPENDENCIES = ["core"]
+    
     def __init__(self, install_dir: Path = None):
         """Initialize hooks component"""
         super().__init__(install_dir)
@@ -31,15 +40,6 @@ class HooksComponent(Component):
             "performance_monitor.py"
         ]
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "hooks",
-            "version": "3.0.0",
-            "description": "Claude Code hooks integration (future-ready)",
-            "category": "integration"
-        }
-    
     def validate_prerequisites(self) -> Tuple[bool, List[str]]:
         """Check prerequisites"""
         errors = []
@@ -115,6 +115,8 @@ class HooksComponent(Component):
         try:
             self.logger.info("Installing SuperClaude hooks component...")
             
+            self.configure_file_manager(config)
+            
             # This component is future-ready - hooks aren't implemented yet
             source_dir = self._get_source_dir()
             if not source_dir.exists():
@@ -248,14 +250,11 @@ def placeholder_hook():
             
             # Remove hook files and placeholder
             hooks_dir = self.install_dir / "hooks"
-            removed_count = 0
             
-            # Remove actual hook files
-            for filename in self.hook_files:
-                file_path = hooks_dir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
+            # Remove actual hook files recorded in the install manifest
+            removed_count, failed = self.remove_installed_files(self.file_manager)
+            for file_path in failed:
+                self.logger.warning(f"Could not remove {file_path.name}")
             
             # Remove placeholder file
             placeholder_path = hooks_dir / "PLACEHOLDER.py"
@@ -279,10 +278,11 @@ def placeholder_hook():
                     self.settings_manager.remove_component_registration("hooks")
                     
                     # Also remove hooks configuration section if it exists
-                    settings = self.settings_manager.load_settings()
-                    if "hooks" in settings:
-                        del settings["hooks"]
-                        self.settings_manager.save_settings(settings)
+                    with self.settings_manager.settings_lock():
+                        settings = self.settings_manager.load_settings()
+                        if "hooks" in settings:
+                            del settings["hooks"]
+                            self.settings_manager.save_settings(settings)
                     
                     self.logger.info("Removed hooks component and configuration from settings.json")
             except Exception as e:
@@ -295,10 +295,6 @@ def placeholder_hook():
             self.logger.exception(f"Unexpected error during hooks uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update hooks component"""
         try:
@@ -318,7 +314,8 @@ def placeholder_hook():
             hooks_dir = self.install_dir / "hooks"
             backup_files = []
             
-            if hooks_dir.exists():
+            # A staged update never touches the live files, so no copies are needed
+            if hooks_dir.exists() and config.get("staging") is None:
                 for filename in self.hook_files + ["PLACEHOLDER.py"]:
                     file_path = hooks_dir / filename
                     if file_path.exists():
@@ -2,14 +2,22 @@
 MCP component for MCP server integration
 """
 
+import os
+import re
+import shlex
 import subprocess
 import sys
 import json
-from typing import Dict, List, Tuple, Any
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Any, Optional, Callable
 from pathlib import Path
 
 from ..base.component import Component
 from ..core.settings_manager import SettingsManager
+from ..core.probe import get_probe_engine
+from ..core.mcp_config import MCPConfigFile
 from ..utils.logger import get_logger
 from ..utils.ui import confirm, display_info, display_warning
 
@@ -17,12 +25,33 @@ from ..utils.ui import confirm, display_info, display_warning
 class MCPComponent(Component):
     """MCP servers integration component"""
     
+    METADATA = {
+        "name": "mcp",
+        "version": "3.0.0",
+        "description": "MCP server integration (Context7, Sequential, Magic, Playwright)",
+        "category": "integration"
+    }
+    
+    DEPENDENCIES = ["core"]
+    
+    # Concurrent package pre-fetches when config has no "jobs". Servers are
+    # registered one at a time: `claude mcp add/remove` rewrite the whole
+    # user config file, so concurrent invocations lose each other's change.
+    # Only the config backend batches every registration into one write.
+    MAX_PARALLEL_SERVERS = 4
+    
     def __init__(self, install_dir: Path = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
         self.logger = get_logger()
         self.settings_manager = SettingsManager(self.install_dir)
         
+        # Snapshot of `claude mcp list` (server name -> command), see _get_mcp_state
+        self._mcp_state: Optional[Dict[str, str]] = None
+        self._mcp_state_loaded = False
+        self._state_lock = threading.Lock()
+        self.mcp_backend = "cli"
+        
         # Define MCP servers to install
         self.mcp_servers = {
             "sequential-thinking": {
@@ -57,77 +86,47 @@ class MCPComponent(Component):
             }
         }
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "mcp",
-            "version": "3.0.0",
-            "description": "MCP server integration (Context7, Sequential, Magic, Playwright)",
-            "category": "integration"
-        }
-    
     def validate_prerequisites(self) -> Tuple[bool, List[str]]:
         """Check prerequisites"""
         errors = []
         
+        # Probe node, claude and npm concurrently
+        node_cmd = ("node", "--version")
+        claude_cmd = ("claude", "--version")
+        npm_cmd = ("npm", "--version")
+        probes = get_probe_engine().run([node_cmd, claude_cmd, npm_cmd])
+        
         # Check if Node.js is available
-        try:
-            result = subprocess.run(
-                ["node", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
-            if result.returncode != 0:
-                errors.append("Node.js not found - required for MCP servers")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Node.js {version}")
-                
-                # Check version (require 18+)
-                try:
-                    version_num = int(version.lstrip('v').split('.')[0])
-                    if version_num < 18:
-                        errors.append(f"Node.js version {version} found, but version 18+ required")
-                except:
-                    self.logger.warning(f"Could not parse Node.js version: {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        result = probes[node_cmd]
+        if not result.ok:
             errors.append("Node.js not found - required for MCP servers")
+        else:
+            version = result.stdout.strip()
+            self.logger.debug(f"Found Node.js {version}")
+            
+            # Check version (require 18+)
+            try:
+                version_num = int(version.lstrip('v').split('.')[0])
+                if version_num < 18:
+                    errors.append(f"Node.js version {version} found, but version 18+ required")
+            except:
+                self.logger.warning(f"Could not parse Node.js version: {version}")
         
         # Check if Claude CLI is available
-        try:
-            result = subprocess.run(
-                ["claude", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
-            if result.returncode != 0:
-                errors.append("Claude CLI not found - required for MCP server management")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Claude CLI {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        result = probes[claude_cmd]
+        if not result.ok:
             errors.append("Claude CLI not found - required for MCP server management")
+        else:
+            version = result.stdout.strip()
+            self.logger.debug(f"Found Claude CLI {version}")
         
         # Check if npm is available
-        try:
-            result = subprocess.run(
-                ["npm", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
-            if result.returncode != 0:
-                errors.append("npm not found - required for MCP server installation")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found npm {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        result = probes[npm_cmd]
+        if not result.ok:
             errors.append("npm not found - required for MCP server installation")
+        else:
+            version = result.stdout.strip()
+            self.logger.debug(f"Found npm {version}")
         
         return len(errors) == 0, errors
     
@@ -157,8 +156,60 @@ class MCPComponent(Component):
         # Return empty dict as we don't modify Claude Code settings
         return {}
     
-    def _check_mcp_server_installed(self, server_name: str) -> bool:
-        """Check if MCP server is already installed"""
+    @staticmethod
+    def _parse_mcp_list(output: str) -> Dict[str, str]:
+        """
+        Parse `claude mcp list` output into a server name -> command map
+        
+        Lines look like "name: command" optionally followed by a health
+        suffix such as " - ✓ Connected"; anything else is ignored.
+        
+        Args:
+            output: stdout of `claude mcp list`
+            
+        Returns:
+            Dict of server name to command
+        """
+        servers = {}
+        for line in output.splitlines():
+            match = re.match(r'^([\w.@/-]+):\s+(.*)$', line.strip())
+            if match:
+                command = re.sub(r'\s+-\s+[✓✗⏸⚠].*$', '', match.group(2)).strip()
+                servers[match.group(1)] = command
+        return servers
+    
+    def _get_mcp_state(self, refresh: bool = False) -> Optional[Dict[str, str]]:
+        """
+        Get registered MCP servers from one `claude mcp list` snapshot
+        
+        The snapshot is taken once and reused for the whole operation;
+        successful adds and removes update it in place, failed ones
+        invalidate it so the next lookup lists again.
+        
+        Args:
+            refresh: Discard the snapshot and list again
+            
+        Returns:
+            Dict of server name to command, or None if the CLI could not be queried
+        """
+        with self._state_lock:
+            if refresh or not self._mcp_state_loaded:
+                self._mcp_state = self._list_mcp_servers()
+                self._mcp_state_loaded = True
+            return dict(self._mcp_state) if self._mcp_state is not None else None
+    
+    def _list_mcp_servers(self) -> Optional[Dict[str, str]]:
+        """Read registered servers from the active backend (None on failure)"""
+        if self.mcp_backend == "config":
+            try:
+                return {
+                    name: MCPConfigFile.entry_command(entry)
+                    for name, entry in MCPConfigFile().list_servers().items()
+                }
+            except ValueError as e:
+                self.logger.warning(f"Could not read MCP config: {e}")
+                return None
+        
         try:
             result = subprocess.run(
                 ["claude", "mcp", "list"], 
@@ -170,57 +221,95 @@ class MCPComponent(Component):
             
             if result.returncode != 0:
                 self.logger.warning(f"Could not list MCP servers: {result.stderr}")
-                return False
+                return None
             
-            # Parse output to check if server is installed
-            output = result.stdout.lower()
-            return server_name.lower() in output
+            return self._parse_mcp_list(result.stdout)
             
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
             self.logger.warning(f"Error checking MCP server status: {e}")
-            return False
+            return None
+    
+    def _record_mcp_change(self, server_name: str, command: Optional[str]) -> None:
+        """
+        Apply a successful add (command) or remove (None) to the snapshot
+        
+        Args:
+            server_name: Server that changed
+            command: New command, or None if the server was removed
+        """
+        with self._state_lock:
+            if self._mcp_state is None:
+                return
+            if command is None:
+                self._mcp_state.pop(server_name, None)
+            else:
+                self._mcp_state[server_name] = command
+    
+    def _use_backend(self, backend: str) -> None:
+        """
+        Select how servers are registered and start a fresh state snapshot
+        
+        Args:
+            backend: "cli" (claude mcp add/remove) or "config" (write the
+                     user MCP config file directly)
+        """
+        self.mcp_backend = backend
+        self._invalidate_mcp_state()
+    
+    def _invalidate_mcp_state(self) -> None:
+        """Force the next state lookup to list servers again"""
+        with self._state_lock:
+            self._mcp_state_loaded = False
+    
+    def _check_mcp_server_installed(self, server_name: str) -> bool:
+        """Check if MCP server is already installed"""
+        state = self._get_mcp_state()
+        return state is not None and server_name in state
     
     def _install_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> bool:
         """Install a single MCP server"""
         server_name = server_info["name"]
-        npm_package = server_info["npm_package"]
         
         # Get the command to use - either specified in server_info or default to npx format
-        command = server_info.get("command", f"npx {npm_package}")
+        command = self._server_command(server_info, config)
+        # Documented form: claude mcp add [-s scope] <name> -e K=V -- <command> [args...]
+        # (-e takes any number of values, so the name must come before it)
+        add_args = ["-s", "user", server_name]
+        for key, value in self._server_env(config).items():
+            add_args += ["-e", f"{key}={value}"]
+        add_args += ["--", *shlex.split(command)]
+        
+        journal = config.get("journal")
         
         try:
             self.logger.info(f"Installing MCP server: {server_name}")
             
+            # Resumed run: the interrupted run already added this server
+            done = journal.completed("mcp-add", server_name) if journal is not None else None
+            if done is not None and done.get("command") == command:
+                self.logger.info(f"MCP server {server_name} already added by the interrupted installation")
+                self._record_mcp_change(server_name, command)
+                return True
+            
             # Check if already installed
             if self._check_mcp_server_installed(server_name):
                 self.logger.info(f"MCP server {server_name} already installed")
                 return True
             
             # Handle API key requirements
-            if "api_key_env" in server_info:
-                api_key_env = server_info["api_key_env"]
-                api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
-                
-                if not config.get("dry_run", False):
-                    display_info(f"MCP server '{server_name}' requires an API key")
-                    display_info(f"Environment variable: {api_key_env}")
-                    display_info(f"Description: {api_key_desc}")
-                    
-                    # Check if API key is already set
-                    import os
-                    if not os.getenv(api_key_env):
-                        display_warning(f"API key {api_key_env} not found in environment")
-                        self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
+            self._announce_api_key(server_info, config)
             
             # Install using Claude CLI
             if config.get("dry_run", False):
-                self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {command}")
+                self.logger.info(f"Would install MCP server (user scope): claude mcp add {shlex.join(add_args)}")
                 return True
             
-            self.logger.debug(f"Running: claude mcp add -s user {server_name} {command}")
+            self.logger.debug(f"Running: claude mcp add {shlex.join(add_args)}")
+            
+            seq = journal.begin("mcp-add", server_name, command=command) if journal is not None else None
             
             result = subprocess.run(
-                ["claude", "mcp", "add", "-s", "user", server_name, command],
+                ["claude", "mcp", "add", *add_args],
                 capture_output=True,
                 text=True,
                 timeout=120,  # 2 minutes timeout for installation
@@ -228,20 +317,237 @@ class MCPComponent(Component):
             )
             
             if result.returncode == 0:
+                self._record_mcp_change(server_name, command)
+                if journal is not None:
+                    journal.complete(seq, "mcp-add", server_name, command=command)
                 self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
                 return True
             else:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown error"
                 self.logger.error(f"Failed to install MCP server {server_name}: {error_msg}")
+                self._invalidate_mcp_state()
                 return False
                 
         except subprocess.TimeoutExpired:
             self.logger.error(f"Timeout installing MCP server {server_name}")
+            self._invalidate_mcp_state()
             return False
         except Exception as e:
             self.logger.error(f"Error installing MCP server {server_name}: {e}")
+            self._invalidate_mcp_state()
             return False
     
+    def _package_tarball(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> Optional[Path]:
+        """
+        Find a server's package tarball in the local package directory
+        
+        Tarballs use `npm pack` naming: "@scope/name" becomes
+        "scope-name-<version>.tgz". The highest version wins.
+        
+        Args:
+            server_info: Server definition
+            config: Installation configuration
+            
+        Returns:
+            Tarball path, or None if no package directory is configured or no tarball matches
+        """
+        package_dir = config.get("mcp_package_dir")
+        if not package_dir:
+            return None
+        
+        base = server_info["npm_package"].lstrip("@").replace("/", "-")
+        candidates = [
+            path for path in Path(package_dir).glob(f"{base}-*.tgz")
+            if re.match(r'^\d+\.\d+', path.name[len(base) + 1:])
+        ]
+        if not candidates:
+            return None
+        
+        def version_key(path: Path) -> List[int]:
+            return [int(part) for part in re.findall(r'\d+', path.name[len(base) + 1:])]
+        
+        return max(candidates, key=version_key).resolve()
+    
+    @staticmethod
+    def _tarball_bin(tarball: Path, npm_package: str) -> str:
+        """
+        Get the executable name a package tarball provides
+        
+        Args:
+            tarball: npm package tarball
+            npm_package: Package name (fallback bin name without scope)
+            
+        Returns:
+            Bin name to pass to npx
+        """
+        default = npm_package.split("/")[-1]
+        try:
+            with tarfile.open(tarball, "r:gz") as tar:
+                package = json.load(tar.extractfile("package/package.json"))
+        except (tarfile.TarError, KeyError, ValueError, OSError):
+            return default
+        
+        bins = package.get("bin")
+        if isinstance(bins, dict) and bins:
+            return default if default in bins else next(iter(bins))
+        return default
+    
+    def _server_command(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> str:
+        """Get the command a server is registered with (local tarball when one is configured)"""
+        tarball = self._package_tarball(server_info, config)
+        if tarball is not None:
+            # npx treats a bare path as the command itself, so name the bin explicitly
+            bin_name = self._tarball_bin(tarball, server_info["npm_package"])
+            return f"npx --package={tarball} {bin_name}"
+        return server_info.get("command", f"npx {server_info['npm_package']}")
+    
+    def _server_env(self, config: Dict[str, Any]) -> Dict[str, str]:
+        """Get environment registered with every server (points npx at the shared npm cache)"""
+        npm_cache = config.get("npm_cache")
+        if npm_cache:
+            return {"npm_config_cache": str(Path(npm_cache).resolve())}
+        return {}
+    
+    def _prefetch_packages(self, config: Dict[str, Any]) -> None:
+        """
+        Install every server package into the npm/npx cache ahead of time
+        
+        Runs `npm exec --package <pkg> -- node --version` per server, which
+        populates the same npx cache the registered `npx <pkg>` command
+        uses, so the first Claude session starts the servers without a
+        download. With a package directory the local tarballs are used and
+        npm runs --offline. Failures only produce warnings.
+        
+        Args:
+            config: Installation configuration
+        """
+        self.logger.info("Pre-fetching MCP server packages...")
+        
+        def prefetch(server_name: str) -> bool:
+            server_info = self.mcp_servers[server_name]
+            tarball = self._package_tarball(server_info, config)
+            if config.get("mcp_package_dir") and tarball is None:
+                self.logger.warning(f"No tarball for {server_info['npm_package']} in {config['mcp_package_dir']}")
+                return False
+            
+            cmd = ["npm", "exec", "--yes", f"--package={tarball or server_info['npm_package']}"]
+            if config.get("npm_cache"):
+                cmd.append(f"--cache={Path(config['npm_cache']).resolve()}")
+            if tarball is not None:
+                cmd.append("--offline")
+            cmd += ["--", "node", "--version"]
+            
+            if config.get("dry_run", False):
+                self.logger.info(f"Would run: {' '.join(cmd)}")
+                return True
+            
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=300,
+                    shell=(sys.platform == "win32")
+                )
+            except subprocess.TimeoutExpired:
+                self.logger.warning(f"Timeout pre-fetching {server_info['npm_package']}")
+                return False
+            
+            if result.returncode != 0:
+                error_msg = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "Unknown error"
+                self.logger.warning(f"Could not pre-fetch {server_info['npm_package']}: {error_msg}")
+                return False
+            return True
+        
+        results = self._run_parallel(
+            prefetch,
+            list(self.mcp_servers),
+            "pre-fetched",
+            config.get("jobs", self.MAX_PARALLEL_SERVERS)
+        )
+        failed = [name for name, ok in results.items() if not ok]
+        if failed:
+            self.logger.warning(f"MCP servers will download on first use: {', '.join(failed)}")
+    
+    def _announce_api_key(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> None:
+        """Tell the user about a server's API key and warn if it is not set"""
+        if "api_key_env" not in server_info or config.get("dry_run", False):
+            return
+        
+        server_name = server_info["name"]
+        api_key_env = server_info["api_key_env"]
+        api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
+        
+        display_info(f"MCP server '{server_name}' requires an API key")
+        display_info(f"Environment variable: {api_key_env}")
+        display_info(f"Description: {api_key_desc}")
+        
+        # Check if API key is already set
+        if not os.getenv(api_key_env):
+            display_warning(f"API key {api_key_env} not found in environment")
+            self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
+    
+    def _write_servers_direct(self, config: Dict[str, Any], replace: bool) -> Optional[Dict[str, bool]]:
+        """
+        Register every server with one write to the user MCP config file
+        
+        Args:
+            config: Installation configuration
+            replace: Overwrite servers that are already registered
+            
+        Returns:
+            Per-server results, or None if the file could not be written
+            (the caller then falls back to the claude CLI)
+        """
+        mcp_config = MCPConfigFile()
+        entries = {}
+        for server_name, server_info in self.mcp_servers.items():
+            self._announce_api_key(server_info, config)
+            command = self._server_command(server_info, config)
+            entries[server_name] = MCPConfigFile.server_entry(command, self._server_env(config))
+        
+        if config.get("dry_run", False):
+            self.logger.info(f"Would write {len(entries)} MCP servers to {mcp_config.config_file}")
+            return {name: True for name in entries}
+        
+        try:
+            added, _ = mcp_config.update_servers(add=entries, replace=replace)
+        except (ValueError, TimeoutError, OSError) as e:
+            self.logger.warning(f"Could not write {mcp_config.config_file} ({e}), falling back to claude CLI")
+            return None
+        
+        for server_name, entry in entries.items():
+            if server_name in added:
+                self._record_mcp_change(server_name, MCPConfigFile.entry_command(entry))
+                self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
+            else:
+                self.logger.info(f"MCP server {server_name} already installed")
+        
+        return {name: True for name in entries}
+    
+    def _remove_servers_direct(self) -> Optional[Dict[str, bool]]:
+        """
+        Remove every server with one write to the user MCP config file
+        
+        Returns:
+            Per-server results, or None if the file could not be written
+        """
+        mcp_config = MCPConfigFile()
+        try:
+            _, removed = mcp_config.update_servers(remove=self.mcp_servers.keys())
+        except (ValueError, TimeoutError, OSError) as e:
+            self.logger.warning(f"Could not write {mcp_config.config_file} ({e}), falling back to claude CLI")
+            return None
+        
+        for server_name in self.mcp_servers:
+            if server_name in removed:
+                self._record_mcp_change(server_name, None)
+                self.logger.success(f"Successfully uninstalled MCP server: {server_name}")
+            else:
+                self.logger.info(f"MCP server {server_name} not installed")
+        
+        return {name: True for name in self.mcp_servers}
+    
     def _uninstall_mcp_server(self, server_name: str) -> bool:
         """Uninstall a single MCP server"""
         try:
@@ -263,20 +569,87 @@ class MCPComponent(Component):
             )
             
             if result.returncode == 0:
+                self._record_mcp_change(server_name, None)
                 self.logger.success(f"Successfully uninstalled MCP server: {server_name}")
                 return True
             else:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown error"
                 self.logger.error(f"Failed to uninstall MCP server {server_name}: {error_msg}")
+                self._invalidate_mcp_state()
                 return False
                 
         except subprocess.TimeoutExpired:
             self.logger.error(f"Timeout uninstalling MCP server {server_name}")
+            self._invalidate_mcp_state()
             return False
         except Exception as e:
             self.logger.error(f"Error uninstalling MCP server {server_name}: {e}")
+            self._invalidate_mcp_state()
+            return False
+    
+    def _run_parallel(self, worker: Callable[[str], bool], server_names: List[str],
+                      label: str, jobs: int) -> Dict[str, bool]:
+        """
+        Run a per-server operation over a bounded worker pool
+        
+        Results are reported as each server finishes rather than in
+        registry order.
+        
+        Args:
+            worker: Function taking a server name and returning success
+            server_names: Servers to process
+            label: Past-tense verb for progress lines (e.g. "installed")
+            jobs: Maximum concurrent workers
+            
+        Returns:
+            Dict of server name to success
+        """
+        results: Dict[str, bool] = {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(server_names) or 1))) as pool:
+            futures = {pool.submit(self._run_guarded, worker, name): name for name in server_names}
+            for future in as_completed(futures):
+                self._report_progress(results, futures[future], future.result(), len(server_names), label)
+        
+        return results
+    
+    def _run_sequential(self, worker: Callable[[str], bool], server_names: List[str],
+                        label: str) -> Dict[str, bool]:
+        """
+        Run a per-server operation one server at a time
+        
+        Used for `claude mcp add/remove`: each invocation rewrites the whole
+        user config file, so running them concurrently loses changes.
+        
+        Args:
+            worker: Function taking a server name and returning success
+            server_names: Servers to process
+            label: Past-tense verb for progress lines (e.g. "installed")
+            
+        Returns:
+            Dict of server name to success
+        """
+        results: Dict[str, bool] = {}
+        for server_name in server_names:
+            ok = self._run_guarded(worker, server_name)
+            self._report_progress(results, server_name, ok, len(server_names), label)
+        return results
+    
+    def _run_guarded(self, worker: Callable[[str], bool], server_name: str) -> bool:
+        """Run a per-server worker, turning an exception into a failure"""
+        try:
+            return worker(server_name)
+        except Exception as e:
+            self.logger.error(f"Error processing MCP server {server_name}: {e}")
             return False
     
+    def _report_progress(self, results: Dict[str, bool], server_name: str, ok: bool,
+                         total: int, label: str) -> None:
+        """Record one server's result and log a progress line"""
+        results[server_name] = ok
+        mark = "✓" if ok else "✗"
+        self.logger.info(f"[{len(results)}/{total}] {mark} {server_name} {label if ok else 'failed'}")
+    
     def install(self, config: Dict[str, Any]) -> bool:
         """Install MCP component"""
         try:
@@ -289,20 +662,38 @@ class MCPComponent(Component):
                     self.logger.error(error)
                 return False
             
-            # Install each MCP server
-            installed_count = 0
-            failed_servers = []
-            
-            for server_name, server_info in self.mcp_servers.items():
-                if self._install_mcp_server(server_info, config):
-                    installed_count += 1
-                else:
-                    failed_servers.append(server_name)
-                    
-                    # Check if this is a required server
-                    if server_info.get("required", False):
-                        self.logger.error(f"Required MCP server {server_name} failed to install")
-                        return False
+            # Warm the npm cache so servers start without a download
+            if config.get("mcp_prefetch") or config.get("mcp_package_dir"):
+                self._prefetch_packages(config)
+            
+            # Take a fresh server snapshot for this operation
+            self._use_backend(config.get("mcp_backend", "cli"))
+            
+            results = None
+            if self.mcp_backend == "config":
+                results = self._write_servers_direct(config, replace=False)
+                if results is None:
+                    self._use_backend("cli")
+            
+            # Install MCP servers one at a time through the claude CLI
+            if results is None:
+                results = self._run_sequential(
+                    lambda name: self._install_mcp_server(self.mcp_servers[name], config),
+                    list(self.mcp_servers),
+                    "installed"
+                )
+            
+            installed_count = sum(results.values())
+            failed_servers = [name for name in self.mcp_servers if not results.get(name)]
+            
+            # Any required server failing fails the component
+            required_failed = [
+                name for name in failed_servers if self.mcp_servers[name].get("required", False)
+            ]
+            if required_failed:
+                for server_name in required_failed:
+                    self.logger.error(f"Required MCP server {server_name} failed to install")
+                return False
             
             # Update metadata
             try:
@@ -314,13 +705,14 @@ class MCPComponent(Component):
                 })
                 
                 # Add MCP configuration to metadata
-                metadata = self.settings_manager.load_metadata()
-                metadata["mcp"] = {
-                    "enabled": True,
-                    "servers": list(self.mcp_servers.keys()),
-                    "auto_update": False
-                }
-                self.settings_manager.save_metadata(metadata)
+                self.settings_manager.update_metadata({
+                    "mcp": {
+                        "enabled": True,
+                        "servers": list(self.mcp_servers.keys()),
+                        "auto_update": False,
+                        "backend": self.mcp_backend
+                    }
+                })
                 
                 self.logger.info("Updated metadata with MCP component registration")
             except Exception as e:
@@ -330,25 +722,13 @@ class MCPComponent(Component):
             # Verify installation
             if not config.get("dry_run", False):
                 self.logger.info("Verifying MCP server installation...")
-                try:
-                    result = subprocess.run(
-                        ["claude", "mcp", "list"],
-                        capture_output=True,
-                        text=True,
-                        timeout=15,
-                        shell=(sys.platform == "win32")
-                    )
-                    
-                    if result.returncode == 0:
-                        self.logger.debug("MCP servers list:")
-                        for line in result.stdout.strip().split('\n'):
-                            if line.strip():
-                                self.logger.debug(f"  {line.strip()}")
-                    else:
-                        self.logger.warning("Could not verify MCP server installation")
-                        
-                except Exception as e:
-                    self.logger.warning(f"Could not verify MCP installation: {e}")
+                state = self._get_mcp_state()
+                if state is not None:
+                    self.logger.debug("MCP servers list:")
+                    for name, command in sorted(state.items()):
+                        self.logger.debug(f"  {name}: {command}")
+                else:
+                    self.logger.warning("Could not verify MCP server installation")
             
             if failed_servers:
                 self.logger.warning(f"Some MCP servers failed to install: {failed_servers}")
@@ -367,22 +747,35 @@ class MCPComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude MCP servers...")
             
-            # Uninstall each MCP server
-            uninstalled_count = 0
-            
-            for server_name in self.mcp_servers.keys():
-                if self._uninstall_mcp_server(server_name):
-                    uninstalled_count += 1
+            # Remove servers through the backend they were installed with
+            mcp_metadata = self.settings_manager.get_metadata_setting("mcp") or {}
+            self._use_backend(mcp_metadata.get("backend", "cli"))
+            
+            results = None
+            if self.mcp_backend == "config":
+                results = self._remove_servers_direct()
+                if results is None:
+                    self._use_backend("cli")
+            
+            # Uninstall MCP servers one at a time through the claude CLI
+            if results is None:
+                results = self._run_sequential(
+                    self._uninstall_mcp_server,
+                    list(self.mcp_servers),
+                    "removed"
+                )
+            uninstalled_count = sum(results.values())
             
             # Update metadata to remove MCP component
             try:
                 if self.settings_manager.is_component_installed("mcp"):
                     self.settings_manager.remove_component_registration("mcp")
                     # Also remove MCP configuration from metadata
-                    metadata = self.settings_manager.load_metadata()
-                    if "mcp" in metadata:
-                        del metadata["mcp"]
-                        self.settings_manager.save_metadata(metadata)
+                    with self.settings_manager.metadata_lock():
+                        metadata = self.settings_manager.load_metadata()
+                        if "mcp" in metadata:
+                            del metadata["mcp"]
+                            self.settings_manager.save_metadata(metadata)
                     self.logger.info("Removed MCP component from metadata")
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
@@ -394,10 +787,6 @@ class MCPComponent(Component):
             self.logger.exception(f"Unexpected error during MCP uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update MCP component"""
         try:
@@ -413,36 +802,47 @@ class MCPComponent(Component):
             
             self.logger.info(f"Updating MCP component from {current_version} to {target_version}")
             
+            if config.get("mcp_prefetch") or config.get("mcp_package_dir"):
+                self._prefetch_packages(config)
+            
+            # Take a fresh server snapshot for this operation, with the
+            # backend the servers were installed with unless one is given
+            mcp_metadata = self.settings_manager.get_metadata_setting("mcp") or {}
+            self._use_backend(config.get("mcp_backend") or mcp_metadata.get("backend", "cli"))
+            
+            results = None
+            if self.mcp_backend == "config":
+                # Overwriting the entries is the whole update
+                results = self._write_servers_direct(config, replace=True)
+                if results is None:
+                    self._use_backend("cli")
+            
             # For MCP servers, update means reinstall to get latest versions
-            updated_count = 0
-            failed_servers = []
+            def reinstall(server_name: str) -> bool:
+                # Uninstall old version
+                if self._check_mcp_server_installed(server_name):
+                    self._uninstall_mcp_server(server_name)
+                
+                # Install new version
+                return self._install_mcp_server(self.mcp_servers[server_name], config)
             
-            for server_name, server_info in self.mcp_servers.items():
-                try:
-                    # Uninstall old version
-                    if self._check_mcp_server_installed(server_name):
-                        self._uninstall_mcp_server(server_name)
-                    
-                    # Install new version
-                    if self._install_mcp_server(server_info, config):
-                        updated_count += 1
-                    else:
-                        failed_servers.append(server_name)
-                        
-                except Exception as e:
-                    self.logger.error(f"Error updating MCP server {server_name}: {e}")
-                    failed_servers.append(server_name)
+            if results is None:
+                results = self._run_sequential(reinstall, list(self.mcp_servers), "updated")
+            
+            failed_servers = [name for name in self.mcp_servers if not results.get(name)]
             
             # Update metadata
             try:
                 # Update component version in metadata
-                metadata = self.settings_manager.load_metadata()
-                if "components" in metadata and "mcp" in metadata["components"]:
-                    metadata["components"]["mcp"]["version"] = target_version
-                    metadata["components"]["mcp"]["servers_count"] = len(self.mcp_servers)
-                if "mcp" in metadata:
-                    metadata["mcp"]["servers"] = list(self.mcp_servers.keys())
-                self.settings_manager.save_metadata(metadata)
+                with self.settings_manager.metadata_lock():
+                    metadata = self.settings_manager.load_metadata()
+                    if "components" in metadata and "mcp" in metadata["components"]:
+                        metadata["components"]["mcp"]["version"] = target_version
+                        metadata["components"]["mcp"]["servers_count"] = len(self.mcp_servers)
+                    if "mcp" in metadata:
+                        metadata["mcp"]["servers"] = list(self.mcp_servers.keys())
+                        metadata["mcp"]["backend"] = self.mcp_backend
+                    self.settings_manager.save_metadata(metadata)
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
@@ -472,28 +872,14 @@ class MCPComponent(Component):
         if installed_version != expected_version:
             errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
-        # Check if Claude CLI is available
-        try:
-            result = subprocess.run(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                shell=(sys.platform == "win32")
-            )
-            
-            if result.returncode != 0:
-                errors.append("Could not communicate with Claude CLI for MCP server verification")
-            else:
-                # Check if required servers are installed
-                output = result.stdout.lower()
-                for server_name, server_info in self.mcp_servers.items():
-                    if server_info.get("required", False):
-                        if server_name.lower() not in output:
-                            errors.append(f"Required MCP server not found: {server_name}")
-                            
-        except Exception as e:
-            errors.append(f"Could not verify MCP server installation: {e}")
+        # Check if required servers are registered with the Claude CLI
+        state = self._get_mcp_state()
+        if state is None:
+            errors.append("Could not communicate with Claude CLI for MCP server verification")
+        else:
+            for server_name, server_info in self.mcp_servers.items():
+                if server_info.get("required", False) and server_name not in state:
+                    errors.append(f"Required MCP server not found: {server_name}")
         
         return len(errors) == 0, errors
     
@@ -1,15 +1,25 @@
 """Core modules for SuperClaude installation system"""
 
-from .config_manager import ConfigManager
-from .settings_manager import SettingsManager
-from .file_manager import FileManager
-from .validator import Validator
-from .registry import ComponentRegistry
-
-__all__ = [
-    'ConfigManager',
-    'SettingsManager', 
-    'FileManager',
-    'Validator',
-    'ComponentRegistry'
-]
\ No newline at end of file
+from ..utils.lazy import lazy_exports
+
+# Public name -> defining submodule. Submodules are imported on first use,
+# so importing one module of this package does not load all of them.
+_EXPORTS = {
+    'ConfigManager': 'config_manager',
+    'SettingsManager': 'settings_manager',
+    'FileManager': 'file_manager',
+    'Validator': 'validator',
+    'ProbeEngine': 'probe',
+    'ProbeCache': 'probe',
+    'MCPBenchmark': 'mcp_bench',
+    'ComponentRegistry': 'registry',
+    'InstallManifest': 'manifest',
+    'StagedInstall': 'staging',
+    'InstallJournal': 'journal',
+    'BackupManager': 'backup_manager',
+    'BackupStore': 'backup_store'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
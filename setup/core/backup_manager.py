@@ -0,0 +1,471 @@
+"""
+Backup archive creation for SuperClaude installation system
+Streams files straight from the install directory into a tar archive
+"""
+
+import io
+import json
+import os
+import tarfile
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple, Callable
+from pathlib import Path
+from datetime import datetime
+
+from .staging import StagedInstall
+from .journal import InstallJournal
+from .probe import ProbeCache
+from .file_manager import atomic_write_json
+from ..utils.compression import (
+    CODECS, available_codecs, archive_extensions, detect_codec, open_reader, open_writer
+)
+
+
+class BackupManager:
+    """Creates backup archives of an installation directory"""
+
+    # Entries under the install dir that never belong in a backup
+    DEFAULT_EXCLUDES = {"backups", StagedInstall.STAGING_DIR, ProbeCache.CACHE_DIR, InstallJournal.JOURNAL_NAME}
+
+    METADATA_NAME = "backup_metadata.json"
+    INDEX_SUFFIX = ".index.json"
+    INDEX_VERSION = 2
+
+    def __init__(self, install_dir: Path, backup_dir: Optional[Path] = None):
+        """
+        Initialize backup manager
+
+        Args:
+            install_dir: Installation directory to back up
+            backup_dir: Directory for backup archives (default: <install_dir>/backups)
+        """
+        self.install_dir = install_dir
+        self.backup_dir = backup_dir or install_dir / "backups"
+
+    def iter_files(self, excludes: Optional[Set[str]] = None) -> Iterator[Tuple[Path, str]]:
+        """
+        Walk the install directory without materializing the file list
+
+        Args:
+            excludes: Top-level entry names to skip (default: DEFAULT_EXCLUDES)
+
+        Yields:
+            (absolute path, archive name) for every regular file or symlink
+        """
+        if excludes is None:
+            excludes = self.DEFAULT_EXCLUDES
+
+        backup_dir = self.backup_dir.resolve() if self.backup_dir.exists() else None
+        stack = [(self.install_dir, "")]
+
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = sorted(os.scandir(directory), key=lambda e: e.name)
+            except OSError as e:
+                print(f"Warning: Could not read {directory}: {e}")
+                continue
+
+            for entry in entries:
+                if not prefix and entry.name in excludes:
+                    continue
+
+                arcname = f"{prefix}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        path = Path(entry.path)
+                        if backup_dir is not None and path.resolve() == backup_dir:
+                            continue
+                        stack.append((path, f"{arcname}/"))
+                    elif entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                        yield Path(entry.path), arcname
+                except OSError as e:
+                    print(f"Warning: Could not inspect {entry.path}: {e}")
+
+    def create_archive(self, backup_name: str, compress: str = "gzip",
+                       metadata: Optional[Dict[str, Any]] = None,
+                       excludes: Optional[Set[str]] = None,
+                       progress: Optional[Callable[[int], None]] = None,
+                       level: Optional[int] = None, threads: int = 1) -> Tuple[Path, int]:
+        """
+        Create a backup archive by streaming files into a compressed tar
+
+        Files are read in fixed-size chunks and written straight to the
+        compressor, so memory use is bounded and nothing is staged on disk.
+        The archive is written under a temporary name and renamed when done.
+
+        Args:
+            backup_name: Archive base name (without extension)
+            compress: Compression codec (see utils.compression.available_codecs)
+            metadata: Optional metadata stored as backup_metadata.json
+            excludes: Top-level entry names to skip (default: DEFAULT_EXCLUDES)
+            progress: Optional callback receiving the running file count
+            level: Compression level (None for the codec default)
+            threads: Compression threads for codecs that support it
+
+        Returns:
+            Tuple of (archive path, number of files archived)
+
+        Raises:
+            ValueError: If compression method is unknown or unavailable
+        """
+        if compress not in available_codecs():
+            raise ValueError(f"Unknown or unavailable compression method: {compress}")
+
+        extension = CODECS[compress].extension
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_path = self.backup_dir / f"{backup_name}{extension}"
+        counter = 1
+        while backup_path.exists():
+            # Two backups within the same second - never overwrite the first
+            backup_path = self.backup_dir / f"{backup_name}_{counter}{extension}"
+            counter += 1
+        partial_path = backup_path.with_name(backup_path.name + ".partial")
+
+        files_added = 0
+        try:
+            with open(partial_path, 'wb') as raw, \
+                    self._compressing(raw, compress, level, threads) as writer, \
+                    tarfile.open(fileobj=writer, mode="w|") as tar:
+                if metadata is not None:
+                    start = tar.offset
+                    self._add_bytes(tar, self.METADATA_NAME,
+                                    json.dumps(metadata, indent=2).encode('utf-8'))
+                    self._record_offsets(tar, start)
+
+                for path, arcname in self.iter_files(excludes):
+                    try:
+                        start = tar.offset
+                        tar.add(str(path), arcname=arcname, recursive=False)
+                        self._record_offsets(tar, start)
+                    except OSError as e:
+                        # File vanished or is unreadable - skip it, keep the stream going
+                        print(f"Warning: Could not add {arcname} to backup: {e}")
+                        continue
+
+                    files_added += 1
+                    if progress:
+                        progress(files_added)
+
+                members = tar.getmembers()
+
+            os.replace(partial_path, backup_path)
+            self.write_index(backup_path, members, metadata)
+        except BaseException:
+            try:
+                partial_path.unlink()
+            except OSError:
+                pass
+            raise
+
+        return backup_path, files_added
+
+    @staticmethod
+    def _record_offsets(tar: tarfile.TarFile, start: int) -> None:
+        """
+        Store stream offsets on the member just written
+
+        tarfile only fills offset/offset_data when reading, so derive them
+        from the stream position: data ends at the (block padded) current
+        offset and the header(s) occupy everything before it.
+        """
+        member = tar.members[-1]
+        padded_size = -(-member.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE if member.isreg() else 0
+        member.offset = start
+        member.offset_data = tar.offset - padded_size
+
+    @staticmethod
+    def _add_bytes(tar: tarfile.TarFile, arcname: str, data: bytes) -> None:
+        """Add in-memory data to the archive as a regular file"""
+        info = tarfile.TarInfo(arcname)
+        info.size = len(data)
+        info.mtime = int(datetime.now().timestamp())
+        info.mode = 0o644
+        tar.addfile(info, io.BytesIO(data))
+
+    @classmethod
+    def is_archive(cls, path: Path) -> bool:
+        """Check whether a path names a backup archive (not an index or partial file)"""
+        return any(path.name.endswith(ext) for ext in archive_extensions())
+
+    @classmethod
+    def index_path(cls, archive_path: Path) -> Path:
+        """Get the index sidecar path for an archive"""
+        return archive_path.with_name(archive_path.name + cls.INDEX_SUFFIX)
+
+    @classmethod
+    def write_index(cls, archive_path: Path, members: List[tarfile.TarInfo],
+                    metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Write the index sidecar for an archive
+
+        The index holds everything listing needs (size, creation time, file
+        count, component versions) plus per-member offsets into the
+        uncompressed tar stream.
+
+        Args:
+            archive_path: Archive the index describes
+            members: Archive members in stream order
+            metadata: Backup metadata (read from the archive if omitted)
+
+        Returns:
+            Path to the written index
+        """
+        stat_result = archive_path.stat()
+        if metadata is None:
+            metadata = {}
+
+        index = {
+            "version": cls.INDEX_VERSION,
+            "name": archive_path.name,
+            "size": stat_result.st_size,
+            "mtime_ns": stat_result.st_mtime_ns,
+            "created": metadata.get("created") or datetime.fromtimestamp(stat_result.st_mtime).isoformat(),
+            "files": sum(1 for m in members if m.name != cls.METADATA_NAME),
+            "metadata": metadata,
+            "members": [
+                {
+                    "name": m.name,
+                    "size": m.size,
+                    "mode": m.mode,
+                    "mtime": m.mtime,
+                    "type": "file" if m.isreg() else "link" if m.issym() else "other",
+                    "linkname": m.linkname,
+                    "offset": m.offset,
+                    "offset_data": m.offset_data
+                }
+                for m in members
+            ]
+        }
+
+        index_path = cls.index_path(archive_path)
+        atomic_write_json(index_path, index)
+        return index_path
+
+    @classmethod
+    def load_index(cls, archive_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load the index sidecar for an archive
+
+        Args:
+            archive_path: Archive path
+
+        Returns:
+            Index dict, or None if missing, unreadable or stale (archive changed)
+        """
+        index_path = cls.index_path(archive_path)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if (index.get("version") != cls.INDEX_VERSION
+                    or index.get("size") != archive_path.stat().st_size):
+                return None
+            return index
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def build_index(cls, archive_path: Path) -> Path:
+        """
+        Build an index for an existing (legacy) archive by scanning it once
+
+        Args:
+            archive_path: Archive path
+
+        Returns:
+            Path to the written index
+        """
+        metadata: Dict[str, Any] = {}
+        members: List[tarfile.TarInfo] = []
+
+        with cls.open_tar_stream(archive_path) as tar:
+            for member in tar:
+                members.append(member)
+                if member.name == cls.METADATA_NAME:
+                    metadata_file = tar.extractfile(member)
+                    if metadata_file:
+                        try:
+                            metadata = json.loads(metadata_file.read().decode())
+                        except ValueError:
+                            pass
+
+        return cls.write_index(archive_path, members, metadata)
+
+    @staticmethod
+    @contextmanager
+    def _compressing(raw, codec_name: str, level: Optional[int], threads: int) -> Iterator[Any]:
+        """Open a compressing writer over raw and always close it"""
+        writer = open_writer(raw, codec_name, level, threads)
+        try:
+            yield writer
+        finally:
+            writer.close()
+
+    @staticmethod
+    @contextmanager
+    def open_tar_stream(archive_path: Path) -> Iterator[tarfile.TarFile]:
+        """
+        Open an archive for one sequential pass, detecting the codec from magic bytes
+
+        Args:
+            archive_path: Archive path
+
+        Yields:
+            TarFile in stream mode
+        """
+        codec_name = detect_codec(archive_path)
+        with open(archive_path, 'rb') as raw:
+            reader = open_reader(raw, codec_name)
+            try:
+                with tarfile.open(fileobj=reader, mode="r|") as tar:
+                    yield tar
+            finally:
+                reader.close()
+
+    @staticmethod
+    def is_plain_tar(archive_path: Path) -> bool:
+        """
+        Check whether an archive is an uncompressed tar (and therefore seekable)
+
+        Args:
+            archive_path: Archive path
+
+        Returns:
+            True if the ustar magic is present at its fixed header offset
+        """
+        try:
+            with open(archive_path, 'rb') as f:
+                header = f.read(512)
+        except OSError:
+            return False
+        return len(header) == 512 and header[257:262] == b"ustar"
+
+    @staticmethod
+    def _safe_target(install_dir: Path, name: str) -> Path:
+        """Resolve an archive member name inside install_dir, rejecting escapes"""
+        target = (install_dir / name).resolve()
+        root = install_dir.resolve()
+        if target != root and root not in target.parents:
+            raise ValueError(f"Archive member escapes install directory: {name}")
+        return install_dir / name
+
+    def extract_members(self, archive_path: Path, overwrite: bool = False,
+                        select: Optional[Callable[[str], bool]] = None,
+                        progress: Optional[Callable[[int], None]] = None) -> Tuple[int, List[str]]:
+        """
+        Restore members of a backup archive into the install directory
+
+        Uncompressed archives with an index are read by seeking straight to
+        each selected member, so restoring one file costs O(file size).
+        Otherwise the archive is streamed once, stopping as soon as the last
+        selected member (known from the index, when present) was extracted.
+
+        Args:
+            archive_path: Archive path
+            overwrite: Replace existing files
+            select: Optional predicate on member names limiting what is restored
+            progress: Optional callback receiving the running restored count
+
+        Returns:
+            Tuple of (files restored, list of warnings)
+        """
+        index = self.load_index(archive_path)
+        wanted = None
+        if index is not None:
+            wanted = [
+                m for m in index["members"]
+                if m["name"] != self.METADATA_NAME and (select is None or select(m["name"]))
+            ]
+            if not wanted:
+                return 0, []
+            if self.is_plain_tar(archive_path):
+                return self._extract_indexed(archive_path, wanted, overwrite, progress)
+
+        restored = 0
+        warnings: List[str] = []
+        remaining = {m["name"] for m in wanted} if wanted is not None else None
+        extract_kwargs = {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+
+        with self.open_tar_stream(archive_path) as tar:
+            for member in tar:
+                if member.name == self.METADATA_NAME:
+                    continue
+                if select is not None and not select(member.name):
+                    continue
+
+                try:
+                    target = self._safe_target(self.install_dir, member.name)
+                    if os.path.lexists(target) and not overwrite:
+                        warnings.append(f"Skipping existing file: {target}")
+                    else:
+                        tar.extract(member, self.install_dir, **extract_kwargs)
+                        restored += 1
+                        if progress:
+                            progress(restored)
+                except Exception as e:
+                    warnings.append(f"Could not restore {member.name}: {e}")
+
+                if remaining is not None:
+                    remaining.discard(member.name)
+                    if not remaining:
+                        break  # Everything selected is out - skip the rest of the stream
+
+        return restored, warnings
+
+    def _extract_indexed(self, archive_path: Path, members: List[Dict[str, Any]], overwrite: bool,
+                         progress: Optional[Callable[[int], None]]) -> Tuple[int, List[str]]:
+        """Restore members of an uncompressed tar by seeking to their data offsets"""
+        restored = 0
+        warnings: List[str] = []
+
+        with open(archive_path, 'rb') as archive:
+            for member in members:
+                name = member["name"]
+                try:
+                    target = self._safe_target(self.install_dir, name)
+                    if os.path.lexists(target) and not overwrite:
+                        warnings.append(f"Skipping existing file: {target}")
+                        continue
+
+                    target.parent.mkdir(parents=True, exist_ok=True)
+
+                    if member["type"] == "link":
+                        if os.path.lexists(target):
+                            target.unlink()
+                        os.symlink(member["linkname"], target)
+                    elif member["type"] == "file":
+                        archive.seek(member["offset_data"])
+                        fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=str(target.parent))
+                        try:
+                            with os.fdopen(fd, 'wb') as tmp:
+                                remaining = member["size"]
+                                while remaining:
+                                    chunk = archive.read(min(65536, remaining))
+                                    if not chunk:
+                                        raise EOFError("Unexpected end of archive")
+                                    tmp.write(chunk)
+                                    remaining -= len(chunk)
+                            os.chmod(tmp_name, member.get("mode", 0o644) & 0o777)  # No setuid/setgid/sticky from the archive
+                            mtime = member.get("mtime")
+                            if mtime is not None:
+                                os.utime(tmp_name, (mtime, mtime))
+                            os.replace(tmp_name, target)
+                        except BaseException:
+                            try:
+                                os.unlink(tmp_name)
+                            except OSError:
+                                pass
+                            raise
+                    else:
+                        continue
+
+                    restored += 1
+                    if progress:
+                        progress(restored)
+
+                except Exception as e:
+                    warnings.append(f"Could not restore {name}: {e}")
+
+        return restored, warnings
+
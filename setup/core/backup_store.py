@@ -0,0 +1,412 @@
+"""
+Content-addressed backup store for SuperClaude installation system
+Deduplicates file contents across backups by sha256
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple, Callable
+from pathlib import Path
+from datetime import datetime
+
+from .backup_manager import BackupManager
+from .file_manager import atomic_write_json
+from .copy_strategy import CopyStrategy
+
+
+class BackupStore:
+    """
+    Snapshot backups backed by a shared object store
+
+    Layout under the backup directory:
+        objects/ab/cdef...   file contents named by sha256
+        snapshots/<name>.json per-snapshot manifest (path -> digest, size, mode, mtime)
+
+    Creating a snapshot only reads files whose size or mtime changed since
+    the previous snapshot, and only writes objects not already stored.
+    """
+
+    SNAPSHOT_VERSION = 1
+    OBJECTS_DIR = "objects"
+    SNAPSHOTS_DIR = "snapshots"
+
+    # Objects younger than this are never garbage collected, so a snapshot
+    # being written concurrently cannot lose its freshly stored objects
+    GC_GRACE_SECONDS = 600
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup store
+
+        Args:
+            backup_dir: Backup directory holding objects/ and snapshots/
+        """
+        self.backup_dir = backup_dir
+        self.objects_dir = backup_dir / self.OBJECTS_DIR
+        self.snapshots_dir = backup_dir / self.SNAPSHOTS_DIR
+
+    @classmethod
+    def is_snapshot(cls, path: Path) -> bool:
+        """Check whether a path points to a snapshot manifest"""
+        return path.suffix == ".json" and path.parent.name == cls.SNAPSHOTS_DIR
+
+    def object_path(self, digest: str) -> Path:
+        """Get storage path for an object digest"""
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def snapshot_path(self, name: str) -> Path:
+        """Get manifest path for a snapshot name"""
+        return self.snapshots_dir / f"{name}.json"
+
+    def load_snapshot(self, snapshot_path: Path) -> Dict[str, Any]:
+        """
+        Load a snapshot manifest
+
+        Args:
+            snapshot_path: Path to snapshot manifest
+
+        Returns:
+            Snapshot manifest dict
+
+        Raises:
+            ValueError: If the manifest cannot be read
+        """
+        try:
+            with open(snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load snapshot {snapshot_path}: {e}")
+
+        if snapshot.get("version") != self.SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version in {snapshot_path}")
+        return snapshot
+
+    def list_snapshots(self) -> List[Path]:
+        """
+        List snapshot manifests, newest first
+
+        Ordered by when each manifest was written (it is written once, when
+        the snapshot completes): names given with --name and "_1" collision
+        suffixes say nothing about age.
+
+        Returns:
+            List of snapshot manifest paths
+        """
+        if not self.snapshots_dir.exists():
+            return []
+
+        snapshots = []
+        for snapshot_path in self.snapshots_dir.glob("*.json"):
+            try:
+                snapshots.append((snapshot_path.stat().st_mtime_ns, snapshot_path.name, snapshot_path))
+            except OSError:
+                continue  # Removed while listing
+        snapshots.sort(reverse=True)
+        return [snapshot_path for _, _, snapshot_path in snapshots]
+
+    def _latest_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Load the most recent readable snapshot (used as stat cache)"""
+        for snapshot_path in self.list_snapshots():
+            try:
+                return self.load_snapshot(snapshot_path)
+            except ValueError:
+                continue
+        return None
+
+    def _store_object(self, file_path: Path) -> Tuple[str, bool]:
+        """
+        Hash a file and add its content to the store if missing
+
+        A file whose digest is already stored is only read once. Otherwise
+        its bytes are hashed while they are copied into a temp file, which
+        is then named by the digest of what was actually written - a file
+        changing between the two reads can never be stored under another
+        content's digest.
+
+        Args:
+            file_path: File to store
+
+        Returns:
+            Tuple of (sha256 digest, True if a new object was written)
+        """
+        hasher = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+
+        if self.object_path(digest).exists():
+            return digest, False
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".obj.", dir=str(self.objects_dir))
+        try:
+            hasher = hashlib.sha256()
+            with os.fdopen(fd, 'wb') as out, open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b""):
+                    hasher.update(chunk)
+                    out.write(chunk)
+            digest = hasher.hexdigest()
+
+            object_path = self.object_path(digest)
+            if object_path.exists():
+                os.unlink(tmp_name)  # Changed into content that is already stored
+                return digest, False
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_name, object_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+        return digest, True
+
+    def create_snapshot(self, install_dir: Path, name: str,
+                        metadata: Optional[Dict[str, Any]] = None,
+                        progress: Optional[Callable[[int], None]] = None) -> Tuple[Path, Dict[str, int]]:
+        """
+        Snapshot an installation directory into the store
+
+        Args:
+            install_dir: Installation directory to back up
+            name: Snapshot name
+            metadata: Optional metadata stored in the manifest
+            progress: Optional callback receiving the running file count
+
+        Returns:
+            Tuple of (manifest path, stats dict with files/hashed/stored/stored_bytes)
+        """
+        previous = self._latest_snapshot()
+        previous_files = previous.get("files", {}) if previous else {}
+
+        files: Dict[str, Dict[str, Any]] = {}
+        stats = {"files": 0, "hashed": 0, "stored": 0, "stored_bytes": 0}
+
+        walker = BackupManager(install_dir, self.backup_dir)
+        for path, arcname in walker.iter_files():
+            try:
+                st = path.lstat()
+                if path.is_symlink():
+                    files[arcname] = {"link": os.readlink(path)}
+                    stats["files"] += 1
+                    continue
+
+                entry = {
+                    "size": st.st_size,
+                    "mode": st.st_mode & 0o7777,
+                    "mtime_ns": st.st_mtime_ns
+                }
+
+                # Stat cache: unchanged size and mtime means unchanged content
+                cached = previous_files.get(arcname)
+                if (cached and cached.get("size") == st.st_size
+                        and cached.get("mtime_ns") == st.st_mtime_ns
+                        and self.object_path(cached["sha256"]).exists()):
+                    entry["sha256"] = cached["sha256"]
+                else:
+                    entry["sha256"], stored = self._store_object(path)
+                    stats["hashed"] += 1
+                    if stored:
+                        stats["stored"] += 1
+                        stats["stored_bytes"] += st.st_size
+
+                files[arcname] = entry
+                stats["files"] += 1
+                if progress:
+                    progress(stats["files"])
+
+            except OSError as e:
+                print(f"Warning: Could not add {arcname} to backup: {e}")
+
+        snapshot_path = self.snapshot_path(name)
+        counter = 1
+        while snapshot_path.exists():
+            snapshot_path = self.snapshot_path(f"{name}_{counter}")
+            counter += 1
+
+        atomic_write_json(snapshot_path, {
+            "version": self.SNAPSHOT_VERSION,
+            "name": snapshot_path.stem,
+            "created": datetime.now().isoformat(),
+            "install_dir": str(install_dir),
+            "metadata": metadata or {},
+            "files": files
+        })
+
+        return snapshot_path, stats
+
+    def restore_snapshot(self, snapshot_path: Path, install_dir: Path, overwrite: bool = False,
+                         select: Optional[Callable[[str], bool]] = None) -> Tuple[int, List[str], List[str]]:
+        """
+        Reassemble a snapshot into an installation directory
+
+        Entries that would land outside install_dir (absolute paths, "..",
+        or a path below a restored symlink) are refused.
+
+        Args:
+            snapshot_path: Snapshot manifest path
+            install_dir: Directory to restore into
+            overwrite: Replace existing files
+            select: Optional predicate on archive paths limiting what is restored
+
+        Returns:
+            Tuple of (files restored, list of warnings, list of errors); any
+            error means the restore is incomplete
+        """
+        snapshot = self.load_snapshot(snapshot_path)
+        restored = 0
+        warnings: List[str] = []
+        errors: List[str] = []
+
+        for arcname, entry in sorted(snapshot.get("files", {}).items()):
+            if select is not None and not select(arcname):
+                continue
+
+            try:
+                target = self._contained_target(install_dir, arcname)
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+
+            if os.path.lexists(target) and not overwrite:
+                warnings.append(f"Skipping existing file: {target}")
+                continue
+
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+
+                if "link" in entry:
+                    if os.path.lexists(target):
+                        target.unlink()
+                    os.symlink(entry["link"], target)
+                    restored += 1
+                    continue
+
+                object_path = self.object_path(entry["sha256"])
+                if not object_path.exists():
+                    errors.append(f"Missing object for {arcname}")
+                    continue
+
+                fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=str(target.parent))
+                try:
+                    os.close(fd)
+                    CopyStrategy().copy_data(object_path, Path(tmp_name))
+                    os.chmod(tmp_name, entry.get("mode", 0o644) & 0o777)  # No setuid/setgid/sticky from the snapshot
+                    if "mtime_ns" in entry:
+                        os.utime(tmp_name, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+                    os.replace(tmp_name, target)
+                except BaseException:
+                    try:
+                        os.unlink(tmp_name)
+                    except OSError:
+                        pass
+                    raise
+
+                restored += 1
+
+            except OSError as e:
+                errors.append(f"Could not restore {arcname}: {e}")
+
+        return restored, warnings, errors
+
+    @staticmethod
+    def _contained_target(install_dir: Path, arcname: str) -> Path:
+        """
+        Map a snapshot path into install_dir, rejecting anything that escapes it
+
+        The entry itself may be a symlink (it is replaced, never written
+        through), so only its parent directory is resolved.
+
+        Raises:
+            ValueError: If the entry would be written outside install_dir
+        """
+        relative = Path(arcname)
+        if relative.is_absolute() or ".." in relative.parts or not relative.parts:
+            raise ValueError(f"Snapshot entry escapes install directory: {arcname}")
+
+        target = install_dir / relative
+        root = install_dir.resolve()
+        parent = target.parent.resolve()
+        if parent != root and root not in parent.parents:
+            raise ValueError(f"Snapshot entry escapes install directory: {arcname}")
+        return target
+
+    def snapshot_info(self, snapshot_path: Path) -> Dict[str, Any]:
+        """
+        Get summary information for a snapshot
+
+        Args:
+            snapshot_path: Snapshot manifest path
+
+        Returns:
+            Dict with created, files, size (logical bytes) and metadata
+        """
+        snapshot = self.load_snapshot(snapshot_path)
+        files = snapshot.get("files", {})
+        return {
+            "created": datetime.fromisoformat(snapshot["created"]) if snapshot.get("created") else None,
+            "files": len(files),
+            "size": sum(entry.get("size", 0) for entry in files.values()),
+            "metadata": snapshot.get("metadata", {})
+        }
+
+    def delete_snapshot(self, snapshot_path: Path) -> None:
+        """
+        Delete a snapshot manifest (objects are reclaimed by gc)
+
+        Args:
+            snapshot_path: Snapshot manifest path
+        """
+        snapshot_path.unlink()
+
+    def gc(self) -> Tuple[int, int]:
+        """
+        Remove objects no snapshot references
+
+        Returns:
+            Tuple of (objects removed, bytes freed)
+        """
+        if not self.objects_dir.exists():
+            return 0, 0
+
+        referenced: Set[str] = set()
+        for snapshot_path in self.list_snapshots():
+            try:
+                snapshot = self.load_snapshot(snapshot_path)
+            except ValueError:
+                # Unreadable manifest - keep everything rather than risk data loss
+                return 0, 0
+            for entry in snapshot.get("files", {}).values():
+                if "sha256" in entry:
+                    referenced.add(entry["sha256"])
+
+        cutoff = time.time() - self.GC_GRACE_SECONDS
+        removed = 0
+        freed = 0
+        for prefix_dir in self.objects_dir.iterdir():
+            if not prefix_dir.is_dir():
+                continue
+            for object_path in prefix_dir.iterdir():
+                digest = prefix_dir.name + object_path.name
+                if digest in referenced:
+                    continue
+                try:
+                    st = object_path.stat()
+                    if st.st_mtime > cutoff:
+                        continue
+                    object_path.unlink()
+                    removed += 1
+                    freed += st.st_size
+                except OSError:
+                    pass
+            try:
+                prefix_dir.rmdir()
+            except OSError:
+                pass  # Still holds objects
+
+        return removed, freed
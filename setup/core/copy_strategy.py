@@ -0,0 +1,231 @@
+"""
+Fast file copy backends for SuperClaude installation system
+Tries reflinks and in-kernel copies before falling back to a userspace copy
+"""
+
+import errno
+import os
+import shutil
+import sys
+import threading
+from typing import Dict, List, Tuple
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows
+
+
+# ioctl number of FICLONE (_IOW(0x94, 9, int)) from linux/fs.h
+FICLONE = 0x40049409
+
+# errno values meaning "this method does not work here", as opposed to a real I/O error
+_UNSUPPORTED = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EBADF,
+    errno.EPERM, errno.ENOTSOCK,
+    getattr(errno, "EOPNOTSUPP", errno.EINVAL), getattr(errno, "ENOTSUP", errno.EINVAL)
+}
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class _Unsupported(Exception):
+    """A copy method is not available for this source/destination pair"""
+
+
+class CopyStrategy:
+    """
+    File copier that picks the cheapest method the filesystems support
+
+    Methods are tried in order: FICLONE reflink (btrfs, XFS, overlayfs on
+    top of either), os.copy_file_range (in-kernel copy, which may itself
+    reflink), os.sendfile, then a plain read/write loop. A method that
+    fails as unsupported is dropped for that pair of filesystems for the
+    rest of the process, so detection happens once per filesystem.
+
+    Modes:
+        auto: fastest available data copy (default)
+        hardlink: hard-link files when source and target share a filesystem,
+                  otherwise copy as in auto mode. Only for read-only files -
+                  editing a linked target also edits the source.
+        plain: always use the plain read/write loop
+    """
+
+    MODES = ("auto", "hardlink", "plain")
+    METHODS = ("reflink", "copy_file_range", "sendfile", "copy")
+
+    # (source st_dev, target directory st_dev) -> methods still believed to work
+    _filesystem_methods: Dict[Tuple[int, int], List[str]] = {}
+    _filesystem_lock = threading.Lock()
+
+    def __init__(self, mode: str = "auto"):
+        """
+        Initialize copy strategy
+
+        Args:
+            mode: One of MODES
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown copy mode: {mode}")
+        self.mode = mode
+
+    def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> str:
+        """
+        Copy a file like shutil.copy2 (or shutil.copy without metadata)
+
+        Args:
+            source: Source file path
+            target: Target file path (replaced if it exists)
+            preserve_permissions: Also copy timestamps and flags, not only the mode
+
+        Returns:
+            Name of the method used ("hardlink" or one of METHODS)
+        """
+        if self.mode == "hardlink" and self._link(source, target):
+            return "hardlink"
+
+        # Never write through a target that is the source itself (an earlier
+        # hardlink) or a symlink (e.g. into a read-only framework store)
+        try:
+            if os.path.islink(target) or os.path.samefile(source, target):
+                os.unlink(target)
+        except OSError:
+            pass
+
+        method = self.copy_data(source, target)
+
+        if preserve_permissions:
+            shutil.copystat(source, target)
+        else:
+            shutil.copymode(source, target)
+
+        return method
+
+    def copy_data(self, source: Path, target: Path) -> str:
+        """
+        Copy file contents only, creating or truncating target
+
+        Args:
+            source: Source file path
+            target: Target file path
+
+        Returns:
+            Name of the method used
+        """
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            size = os.fstat(src_fd).st_size
+
+            if self.mode == "plain":
+                self._copy_plain(src_fd, dst_fd)
+                return "copy"
+
+            key = (os.fstat(src_fd).st_dev, os.fstat(dst_fd).st_dev)
+            for method in self._methods_for(key):
+                try:
+                    getattr(self, f"_copy_{method}")(src_fd, dst_fd, size)
+                    return method
+                except _Unsupported:
+                    self._drop_method(key, method)
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED:
+                        raise
+                    self._drop_method(key, method)
+                # Start the next method from a clean target
+                os.ftruncate(dst_fd, 0)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+
+            self._copy_plain(src_fd, dst_fd)
+            return "copy"
+
+    def _link(self, source: Path, target: Path) -> bool:
+        """Hard-link source to target atomically; False if linking is not possible"""
+        try:
+            if os.path.samefile(source, target):
+                return True
+        except OSError:
+            pass
+
+        temp_link = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.link")
+        try:
+            os.link(source, temp_link)
+        except OSError as e:
+            if e.errno in _UNSUPPORTED or e.errno in (errno.EMLINK, errno.EACCES):
+                return False
+            raise
+
+        try:
+            os.replace(temp_link, target)
+        except OSError:
+            try:
+                os.unlink(temp_link)
+            except OSError:
+                pass
+            raise
+        return True
+
+    def _methods_for(self, key: Tuple[int, int]) -> List[str]:
+        """Get the methods to try for a pair of filesystems"""
+        with self._filesystem_lock:
+            if key not in self._filesystem_methods:
+                methods = list(self.METHODS[:-1])
+                if fcntl is None or not sys.platform.startswith("linux"):
+                    methods.remove("reflink")
+                if not hasattr(os, "copy_file_range"):
+                    methods.remove("copy_file_range")
+                if not hasattr(os, "sendfile"):
+                    methods.remove("sendfile")
+                self._filesystem_methods[key] = methods
+            return list(self._filesystem_methods[key])
+
+    def _drop_method(self, key: Tuple[int, int], method: str) -> None:
+        """Remember that a method does not work for a pair of filesystems"""
+        with self._filesystem_lock:
+            methods = self._filesystem_methods.get(key, [])
+            if method in methods:
+                methods.remove(method)
+
+    @staticmethod
+    def _copy_reflink(src_fd: int, dst_fd: int, size: int) -> None:
+        """Share the source's extents with the target (copy-on-write clone)"""
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+    @staticmethod
+    def _copy_copy_file_range(src_fd: int, dst_fd: int, size: int) -> None:
+        """Copy inside the kernel with copy_file_range(2)"""
+        offset = 0
+        while offset < size:
+            copied = os.copy_file_range(src_fd, dst_fd, min(size - offset, 1 << 30), offset, offset)
+            if copied == 0:
+                if offset == 0:
+                    raise _Unsupported()  # Some filesystems report success but copy nothing
+                break
+            offset += copied
+
+    @staticmethod
+    def _copy_sendfile(src_fd: int, dst_fd: int, size: int) -> None:
+        """Copy inside the kernel with sendfile(2)"""
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, 1 << 30))
+            if sent == 0:
+                if offset == 0:
+                    raise _Unsupported()
+                break
+            offset += sent
+
+    @staticmethod
+    def _copy_plain(src_fd: int, dst_fd: int) -> None:
+        """Copy through a userspace buffer"""
+        while True:
+            chunk = os.read(src_fd, _CHUNK_SIZE)
+            if not chunk:
+                break
+            view = memoryview(chunk)
+            while view:
+                written = os.write(dst_fd, view)
+                view = view[written:]
@@ -2,29 +2,121 @@
 Cross-platform file management for SuperClaude installation system
 """
 
+import json
+import os
 import shutil
 import stat
-from typing import List, Optional, Callable, Dict, Any
+import tempfile
+import threading
+from typing import List, Optional, Callable, Dict, Any, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import fnmatch
 import hashlib
 
+from .copy_strategy import CopyStrategy
+
+
+_umask: Optional[int] = None
+_umask_lock = threading.Lock()
+
+
+def _current_umask() -> int:
+    """
+    Get the process umask without changing it where possible
+
+    Linux reports it in /proc/self/status. Elsewhere os.umask() has to set a
+    value to read the old one, so it is read once under a lock and cached.
+
+    Returns:
+        The umask bits
+    """
+    global _umask
+    if _umask is not None:
+        return _umask
+
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    with _umask_lock:
+        if _umask is None:
+            _umask = os.umask(0o022)
+            os.umask(_umask)
+    return _umask
+
+
+def atomic_write_json(file_path: Path, data: Any, indent: int = 2, sort_keys: bool = True) -> None:
+    """
+    Write JSON to a file atomically (temp file in the same directory + rename)
+
+    Readers never observe a partially written file, and a crash leaves
+    either the old or the new content in place. An existing file keeps its
+    permissions; a new one gets 0o666 minus the umask, like open() would
+    give it, rather than the owner-only mode of the temp file.
+
+    Args:
+        file_path: Target file path
+        data: JSON-serializable data
+        indent: JSON indentation
+        sort_keys: Sort object keys (False preserves insertion order)
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = file_path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_current_umask()
+
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{file_path.name}.", suffix=".tmp", dir=str(file_path.parent)
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False, sort_keys=sort_keys)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
 
 class FileManager:
     """Cross-platform file operations manager"""
     
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, manifest=None, staging=None, copy_mode: str = "auto",
+                 journal=None):
         """
         Initialize file manager
         
         Args:
             dry_run: If True, only simulate file operations
+            manifest: Optional InstallManifest; when set, copies of unchanged files are skipped
+            staging: Optional StagedInstall; when set, copies are written to the staging
+                     directory and switched into place when the transaction commits
+            copy_mode: CopyStrategy mode ("auto", "hardlink" or "plain")
+            journal: Optional InstallJournal; when set, copies and directories are
+                     journaled, and copies an interrupted run finished are not redone
         """
         self.dry_run = dry_run
+        self.manifest = manifest
+        self.staging = staging
+        self.copy_mode = copy_mode
+        self.journal = journal
         self.copied_files: List[Path] = []
+        self.skipped_files: List[Path] = []
         self.created_dirs: List[Path] = []
         
-    def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
+    def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True,
+                  direct: bool = False) -> bool:
         """
         Copy single file with permission preservation
         
@@ -32,6 +124,7 @@ class FileManager:
             source: Source file path
             target: Target file path
             preserve_permissions: Whether to preserve file permissions
+            direct: Copy straight to target, bypassing the manifest and staging
             
         Returns:
             True if successful, False otherwise
@@ -46,23 +139,87 @@ class FileManager:
             print(f"[DRY RUN] Would copy {source} -> {target}")
             return True
         
+        # Incremental mode: leave byte-identical targets alone
+        use_manifest = not direct and self.manifest is not None
+        if use_manifest and self.manifest.is_unchanged(source, target):
+            self.skipped_files.append(target)
+            return True
+        
         try:
+            # Staged copies land in the transaction directory until commit
+            destination = target
+            if not direct and self.staging is not None:
+                destination = self.staging.stage_path(target)
+            
+            # Resumed run: keep a copy the interrupted run already finished
+            journal = None if direct else self.journal
+            if journal is not None and self._copy_completed(source, target, destination):
+                self.copied_files.append(target)
+                if use_manifest:
+                    self.manifest.record_copy(source, target, stat_path=destination)
+                return True
+            
+            seq = journal.begin("copy", str(target), source=str(source)) if journal is not None else None
+            
             # Ensure target directory exists
-            target.parent.mkdir(parents=True, exist_ok=True)
+            destination.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copy file
-            if preserve_permissions:
-                shutil.copy2(source, target)
-            else:
-                shutil.copy(source, target)
+            # Copy file (reflink/in-kernel copy where the filesystem allows)
+            CopyStrategy(self.copy_mode).copy_file(source, destination, preserve_permissions)
             
             self.copied_files.append(target)
+            
+            if journal is not None:
+                from .manifest import source_digest
+                dest_stat = destination.stat()
+                journal.complete(
+                    seq, "copy", str(target),
+                    destination=str(destination),
+                    sha256=source_digest(source),
+                    size=dest_stat.st_size,
+                    mtime_ns=dest_stat.st_mtime_ns
+                )
+            
+            if use_manifest:
+                self.manifest.record_copy(source, target, stat_path=destination)
+            
             return True
             
         except Exception as e:
             print(f"Error copying {source} to {target}: {e}")
             return False
     
+    def _copy_completed(self, source: Path, target: Path, destination: Path) -> bool:
+        """
+        Check whether the journal shows this exact copy finished in an earlier attempt
+        
+        The copy counts as done only if it went to the same destination,
+        the source content is unchanged and the destination still has the
+        size and mtime it had right after the copy.
+        
+        Args:
+            source: Source file path
+            target: Target file path
+            destination: Where this run would write the copy
+            
+        Returns:
+            True if the copy can be skipped, False otherwise
+        """
+        from .manifest import source_digest
+        
+        done = self.journal.completed("copy", str(target))
+        if done is None or done.get("destination") != str(destination):
+            return False
+        
+        try:
+            dest_stat = destination.stat()
+        except OSError:
+            return False
+        
+        return (dest_stat.st_size == done.get("size")
+                and dest_stat.st_mtime_ns == done.get("mtime_ns")
+                and source_digest(source) == done.get("sha256"))
+    
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
@@ -106,7 +263,9 @@ class FileManager:
                 return ignored
             
             # Copy tree
-            shutil.copytree(source, target, ignore=ignore_func, dirs_exist_ok=True)
+            copier = CopyStrategy(self.copy_mode)
+            shutil.copytree(source, target, ignore=ignore_func, dirs_exist_ok=True,
+                            copy_function=lambda src, dst: copier.copy_file(Path(src), Path(dst)))
             
             # Track created directories and files
             for item in target.rglob('*'):
@@ -137,8 +296,14 @@ class FileManager:
             return True
         
         try:
+            # Replayed, not skipped, on resume - mkdir is idempotent
+            seq = self.journal.begin("mkdir", str(directory)) if self.journal is not None else None
+            
             directory.mkdir(parents=True, exist_ok=True, mode=mode)
             
+            if self.journal is not None:
+                self.journal.complete(seq, "mkdir", str(directory))
+            
             if directory not in self.created_dirs:
                 self.created_dirs.append(directory)
             
@@ -158,7 +323,9 @@ class FileManager:
         Returns:
             True if successful, False otherwise
         """
-        if not file_path.exists():
+        if not file_path.exists() and not file_path.is_symlink():
+            if self.manifest is not None:
+                self.manifest.remove(file_path)
             return True  # Already gone
         
         if self.dry_run:
@@ -166,7 +333,8 @@ class FileManager:
             return True
         
         try:
-            if file_path.is_file():
+            # Links into a framework store are removed, never followed
+            if file_path.is_symlink() or file_path.is_file():
                 file_path.unlink()
             else:
                 print(f"Warning: {file_path} is not a file, skipping")
@@ -176,12 +344,48 @@ class FileManager:
             if file_path in self.copied_files:
                 self.copied_files.remove(file_path)
             
+            if self.manifest is not None:
+                self.manifest.remove(file_path)
+            
             return True
             
         except Exception as e:
             print(f"Error removing file {file_path}: {e}")
             return False
     
+    def remove_files(self, file_paths: List[Path], max_workers: int = 8) -> Tuple[int, List[Path]]:
+        """
+        Remove many files, one batch per directory, batches in parallel
+        
+        Each directory's files are unlinked by a single worker, so workers
+        never contend on the same directory.
+        
+        Args:
+            file_paths: Files to remove
+            max_workers: Maximum directories processed concurrently (1 = serial)
+            
+        Returns:
+            Tuple of (number of files removed or already gone, files that could not be removed)
+        """
+        batches: Dict[Path, List[Path]] = {}
+        for file_path in dict.fromkeys(file_paths):
+            batches.setdefault(file_path.parent, []).append(file_path)
+        
+        def remove_batch(batch: List[Path]) -> List[Path]:
+            return [file_path for file_path in batch if not self.remove_file(file_path)]
+        
+        failed: List[Path] = []
+        if len(batches) <= 1 or max_workers <= 1:
+            for batch in batches.values():
+                failed.extend(remove_batch(batch))
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+                for batch_failed in pool.map(remove_batch, batches.values()):
+                    failed.extend(batch_failed)
+        
+        removed = sum(len(batch) for batch in batches.values()) - len(failed)
+        return removed, failed
+    
     def remove_directory(self, directory: Path, recursive: bool = False) -> bool:
         """
         Remove directory
@@ -364,7 +568,7 @@ class FileManager:
         
         backup_path = file_path.with_suffix(file_path.suffix + backup_suffix)
         
-        if self.copy_file(file_path, backup_path):
+        if self.copy_file(file_path, backup_path, direct=True):
             return backup_path
         return None
     
@@ -421,6 +625,7 @@ class FileManager:
         """
         return {
             'files_copied': len(self.copied_files),
+            'files_skipped': len(self.skipped_files),
             'directories_created': len(self.created_dirs),
             'dry_run': self.dry_run,
             'copied_files': [str(f) for f in self.copied_files],
@@ -0,0 +1,244 @@
+"""
+Shared read-only framework store for SuperClaude installation system
+Publishes framework files once per content version and links user installs to them
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+from .copy_strategy import CopyStrategy
+from .manifest import file_digest
+
+
+class FrameworkStoreError(Exception):
+    """The framework store cannot be used (missing entry and not writable, corrupt entry)"""
+
+
+class FrameworkStore:
+    """
+    Versioned, content-addressed store of framework files shared by many users
+
+    Each component's files are published once into
+    <store_dir>/<component>-<version>-<digest>/, where the digest covers
+    every file name and content, and made read-only. An install links to
+    it instead of copying:
+
+        ~/.claude/.superclaude-store/core -> /opt/superclaude/core-3.0.0-1a2b3c4d5e6f
+        ~/.claude/COMMANDS.md -> .superclaude-store/core/COMMANDS.md
+
+    Per-user files are relative symlinks through the per-component link in
+    .superclaude-store/, so moving a user to a new store entry is a single
+    atomic link flip. Publishing an entry that already exists writes nothing.
+    """
+
+    LINK_DIR = ".superclaude-store"
+    ENTRY_FILE = "store.json"
+
+    def __init__(self, store_dir: Path):
+        """
+        Initialize framework store
+
+        Args:
+            store_dir: Root directory of the shared store (e.g. /opt/superclaude)
+        """
+        self.store_dir = Path(store_dir)
+
+    @staticmethod
+    def content_digest(files: Dict[str, Path]) -> str:
+        """
+        Digest of a set of files: names and contents
+
+        Args:
+            files: Relative store path -> source file
+
+        Returns:
+            First 12 hex digits of the sha256 over all entries
+        """
+        hasher = hashlib.sha256()
+        for relpath in sorted(files):
+            hasher.update(f"{relpath}\0{file_digest(files[relpath])}\n".encode("utf-8"))
+        return hasher.hexdigest()[:12]
+
+    def entry_path(self, component: str, version: str, files: Dict[str, Path]) -> Path:
+        """Get the store entry directory for a component's files"""
+        return self.store_dir / f"{component}-{version}-{self.content_digest(files)}"
+
+    def publish(self, component: str, version: str, files: Dict[str, Path]) -> Path:
+        """
+        Make sure a store entry with exactly these files exists
+
+        The entry is assembled in a temporary directory inside the store and
+        renamed into place, so other users never see a partial entry. If
+        another process publishes the same entry first, its copy is kept.
+
+        Args:
+            component: Component name
+            version: Component version
+            files: Relative store path -> source file
+
+        Returns:
+            Path of the store entry
+
+        Raises:
+            FrameworkStoreError: If the entry is missing and cannot be written
+        """
+        entry = self.entry_path(component, version, files)
+        if (entry / self.ENTRY_FILE).is_file():
+            return entry
+
+        try:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            build_dir = Path(tempfile.mkdtemp(prefix=f".{entry.name}.", dir=str(self.store_dir)))
+        except OSError as e:
+            raise FrameworkStoreError(f"Store entry {entry.name} is missing and {self.store_dir} is not writable: {e}")
+
+        try:
+            copier = CopyStrategy()
+            for relpath, source in files.items():
+                target = build_dir / relpath
+                target.parent.mkdir(parents=True, exist_ok=True)
+                copier.copy_file(source, target)
+
+            with open(build_dir / self.ENTRY_FILE, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "component": component,
+                    "version": version,
+                    "files": sorted(files)
+                }, f, indent=2)
+
+            self._make_read_only(build_dir)
+
+            try:
+                os.rename(build_dir, entry)
+            except OSError:
+                if not (entry / self.ENTRY_FILE).is_file():
+                    raise
+                self._remove_tree(build_dir)  # Published concurrently by someone else
+
+        except OSError as e:
+            self._remove_tree(build_dir)
+            raise FrameworkStoreError(f"Could not publish {entry.name}: {e}")
+
+        return entry
+
+    def link_into(self, install_dir: Path, component: str, entry: Path,
+                  targets: List[Tuple[str, Path]]) -> int:
+        """
+        Point an installation at a store entry
+
+        Args:
+            install_dir: User installation directory
+            component: Component name
+            entry: Store entry from publish()
+            targets: (relative store path, installed file path) pairs
+
+        Returns:
+            Number of installed files that had to be (re)linked
+        """
+        component_link = install_dir / self.LINK_DIR / component
+        component_link.parent.mkdir(parents=True, exist_ok=True)
+        self._replace_symlink(component_link, str(entry))
+
+        changed = 0
+        for relpath, target in targets:
+            link_value = os.path.relpath(component_link / relpath, target.parent)
+            if target.is_symlink() and os.readlink(target) == link_value:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._replace_symlink(target, link_value)
+            changed += 1
+
+        return changed
+
+    @classmethod
+    def unlink_from(cls, install_dir: Path, component: str) -> None:
+        """Remove a component's store link from an installation"""
+        component_link = install_dir / cls.LINK_DIR / component
+        if component_link.is_symlink():
+            component_link.unlink()
+        try:
+            component_link.parent.rmdir()
+        except OSError:
+            pass  # Other components still linked
+
+    @classmethod
+    def linked_entry(cls, install_dir: Path, component: str) -> Optional[Path]:
+        """
+        Get the store entry an installation links a component to
+
+        Returns:
+            Store entry path, or None if the component is not linked
+        """
+        component_link = install_dir / cls.LINK_DIR / component
+        if not component_link.is_symlink():
+            return None
+        return Path(os.readlink(component_link))
+
+    @classmethod
+    def validate_link(cls, install_dir: Path, component: str,
+                      targets: List[Tuple[str, Path]]) -> List[str]:
+        """
+        Check a linked installation against its store entry
+
+        Args:
+            install_dir: User installation directory
+            component: Component name
+            targets: (relative store path, installed file path) pairs
+
+        Returns:
+            List of problems (empty if the linked install is intact)
+        """
+        errors = []
+        entry = cls.linked_entry(install_dir, component)
+        if entry is None:
+            return [f"Store link {cls.LINK_DIR}/{component} not found"]
+        if not (entry / cls.ENTRY_FILE).is_file():
+            return [f"Store entry {entry} is missing or incomplete"]
+
+        component_link = install_dir / cls.LINK_DIR / component
+        for relpath, target in targets:
+            expected = os.path.relpath(component_link / relpath, target.parent)
+            if not target.is_symlink() or os.readlink(target) != expected:
+                errors.append(f"{target.name} is not linked to the store")
+            elif not target.is_file():
+                errors.append(f"{target.name} links to a missing store file")
+
+        return errors
+
+    @staticmethod
+    def _replace_symlink(path: Path, value: str) -> None:
+        """Atomically make path a symlink to value (replacing any file or link)"""
+        temp_link = path.with_name(f".{path.name}.{os.getpid()}.link")
+        try:
+            temp_link.unlink()
+        except FileNotFoundError:
+            pass
+        os.symlink(value, temp_link)
+        try:
+            os.replace(temp_link, path)
+        except OSError:
+            temp_link.unlink()
+            raise
+
+    @staticmethod
+    def _make_read_only(directory: Path) -> None:
+        """Drop write permission from a store entry (files 0444, directories 0555)"""
+        for root, dirs, files in os.walk(directory):
+            for name in files:
+                os.chmod(os.path.join(root, name), 0o444)
+            os.chmod(root, 0o555)
+
+    @staticmethod
+    def _remove_tree(directory: Path) -> None:
+        """Remove a (possibly read-only) directory tree"""
+        for root, dirs, files in os.walk(directory):
+            try:
+                os.chmod(root, 0o755)
+            except OSError:
+                pass
+        shutil.rmtree(directory, ignore_errors=True)
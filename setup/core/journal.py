@@ -0,0 +1,221 @@
+"""
+Write-ahead operation journal for resumable SuperClaude installations
+Records every install step before and after it is applied so an interrupted run can be resumed
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+
+
+class InstallJournal:
+    """
+    Append-only JSON-lines journal of installation steps
+
+    Each step (backup, copy, mkdir, metadata, mcp-add) is written as an "intent"
+    record before it is applied and a "done" record, carrying whatever is
+    needed to verify the result later, once it succeeded:
+
+        {"seq": 7, "op": "copy", "key": "/home/u/.claude/RULES.md", "state": "intent", ...}
+        {"seq": 7, "op": "copy", "key": "/home/u/.claude/RULES.md", "state": "done", "size": 4120, ...}
+
+    Every record is handed to the OS immediately, so a killed process loses
+    nothing; fsync is batched (every sync_every records and at step
+    boundaries the installer chooses), so a power loss can drop at most the
+    last batch - those steps are simply redone on resume. A resumed run
+    appends to the same file, so a run interrupted twice still remembers
+    everything the earlier attempts finished.
+    """
+
+    JOURNAL_NAME = ".superclaude-journal.jsonl"
+    JOURNAL_VERSION = 1
+
+    def __init__(self, install_dir: Path, sync_every: int = 64):
+        """
+        Initialize journal
+
+        Args:
+            install_dir: Installation directory holding the journal
+            sync_every: Records written between two fsyncs
+        """
+        self.install_dir = install_dir
+        self.journal_file = install_dir / self.JOURNAL_NAME
+        self.sync_every = max(1, sync_every)
+        self.resuming = False
+        self.previous_run: Optional[Dict[str, Any]] = None
+
+        # (op, key) -> done record from earlier attempts
+        self._completed: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._file = None
+        self._seq = 0
+        self._unsynced = 0
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Check whether an unfinished run left a journal behind"""
+        return self.journal_file.is_file()
+
+    def load(self) -> bool:
+        """
+        Read the journal of an interrupted run for resuming
+
+        A torn last line (crash mid-write) is ignored.
+
+        Returns:
+            True if a journal was found, False otherwise
+        """
+        self._completed.clear()
+        self.previous_run = None
+
+        if not self.exists():
+            return False
+
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                if record.get("op") == "run":
+                    self.previous_run = record  # The latest attempt's staging is the live one
+                elif record.get("state") == "done":
+                    self._completed[(record["op"], record["key"])] = record
+                self._seq = max(self._seq, record.get("seq", 0))
+
+        self.resuming = True
+        return True
+
+    def start(self, components: List[str], staging: Optional[str] = None) -> None:
+        """
+        Open the journal for this run
+
+        A fresh run replaces any old journal; a resumed run (after load())
+        appends to it.
+
+        Args:
+            components: Components this run installs
+            staging: Name of the staging transaction files are written to
+        """
+        self.install_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.journal_file, 'a' if self.resuming else 'w', encoding='utf-8')
+
+        record = {
+            "op": "run",
+            "key": "resume" if self.resuming else "start",
+            "version": self.JOURNAL_VERSION,
+            "components": components,
+            "staging": staging,
+            "pid": os.getpid(),
+            "time": datetime.now().isoformat()
+        }
+        self._append(record)
+        self.sync()
+
+    @property
+    def staging_name(self) -> Optional[str]:
+        """Staging transaction of the interrupted run (None if not resuming)"""
+        if not self.resuming or self.previous_run is None:
+            return None
+        return self.previous_run.get("staging")
+
+    @property
+    def components(self) -> List[str]:
+        """Components the interrupted run was installing"""
+        if self.previous_run is None:
+            return []
+        return list(self.previous_run.get("components", []))
+
+    def completed(self, op: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the done record an earlier attempt wrote for a step
+
+        Args:
+            op: Step type ("backup", "copy", "mkdir", "metadata", "mcp-add")
+            key: Step key (target path, server name, ...)
+
+        Returns:
+            The done record, or None if the step never finished
+        """
+        with self._lock:
+            return self._completed.get((op, key))
+
+    def begin(self, op: str, key: str, **fields: Any) -> int:
+        """
+        Record that a step is about to be applied
+
+        Args:
+            op: Step type
+            key: Step key
+            **fields: Extra JSON-serializable details
+
+        Returns:
+            Sequence number to pass to complete()
+        """
+        with self._lock:
+            self._seq += 1
+            self._append({"seq": self._seq, "op": op, "key": key, "state": "intent", **fields})
+            return self._seq
+
+    def complete(self, seq: int, op: str, key: str, **fields: Any) -> None:
+        """
+        Record that a step was applied
+
+        Args:
+            seq: Sequence number from begin()
+            op: Step type
+            key: Step key
+            **fields: Details needed to verify the result on resume
+        """
+        # Not added to completed(): within a run a step may legitimately be
+        # repeated (e.g. an MCP add retried after a lost write)
+        with self._lock:
+            self._append({"seq": seq, "op": op, "key": key, "state": "done", **fields})
+
+    def sync(self) -> None:
+        """Force every record written so far to disk"""
+        with self._lock:
+            self._sync()
+
+    def finish(self, success: bool) -> None:
+        """
+        Close the journal at the end of a run
+
+        A successful run leaves nothing to resume, so its journal is
+        removed; otherwise it is synced and kept for --resume.
+
+        Args:
+            success: Whether every step of the run succeeded
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._sync()
+            self._file.close()
+            self._file = None
+
+        if success:
+            try:
+                self.journal_file.unlink()
+            except OSError:
+                pass
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Write one record line (caller holds the lock)"""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self._sync()
+
+    def _sync(self) -> None:
+        """fsync pending records (caller holds the lock)"""
+        if self._file is None or not self._unsynced:
+            return
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
@@ -0,0 +1,322 @@
+"""
+Installed file manifest for incremental SuperClaude installations
+Tracks size, mtime and sha256 of every installed file so unchanged files can be skipped
+"""
+
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+
+from .file_manager import atomic_write_json
+
+
+# In-process cache of source file digests keyed by (path, size, mtime_ns)
+_digest_cache: Dict[Tuple[str, int, int], str] = {}
+_digest_cache_lock = threading.Lock()
+
+
+def file_digest(file_path: Path, chunk_size: int = 65536) -> str:
+    """
+    Calculate sha256 of a file, reading it in chunks
+
+    Args:
+        file_path: Path to file
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex sha256 digest
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def source_digest(file_path: Path) -> str:
+    """
+    Get sha256 of a source file, reusing earlier results while the file is unchanged
+
+    Args:
+        file_path: Path to source file
+
+    Returns:
+        Hex sha256 digest
+    """
+    stat_result = file_path.stat()
+    key = (str(file_path), stat_result.st_size, stat_result.st_mtime_ns)
+
+    with _digest_cache_lock:
+        cached = _digest_cache.get(key)
+    if cached is not None:
+        return cached
+
+    digest = file_digest(file_path)
+    with _digest_cache_lock:
+        _digest_cache[key] = digest
+    return digest
+
+
+class InstallManifest:
+    """
+    Per-file manifest of installed files stored in .superclaude-manifest.json
+
+    Each entry also names the component that installed the file, so
+    uninstall and size reporting can work from the manifest alone.
+    """
+
+    MANIFEST_VERSION = 1
+    MANIFEST_NAME = ".superclaude-manifest.json"
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize manifest and load existing entries
+
+        Args:
+            install_dir: Installation directory containing the manifest
+        """
+        self.install_dir = install_dir
+        self.manifest_file = install_dir / self.MANIFEST_NAME
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._saved: Dict[str, Dict[str, Any]] = {}  # Entries as last loaded/saved
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._owner = threading.local()
+        self.load()
+
+    @contextmanager
+    def owned_by(self, component_name: str) -> Iterator[None]:
+        """
+        Attribute files recorded by the current thread to a component
+
+        Args:
+            component_name: Name of component being installed
+        """
+        previous = getattr(self._owner, "name", None)
+        self._owner.name = component_name
+        try:
+            yield
+        finally:
+            self._owner.name = previous
+
+    def load(self) -> None:
+        """Load manifest entries from disk (missing or corrupt manifest means empty)"""
+        self.entries = {}
+        self._dirty = False
+
+        if not self.manifest_file.exists():
+            return
+
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.MANIFEST_VERSION:
+                self.entries = data.get("files", {})
+        except (json.JSONDecodeError, IOError, AttributeError):
+            # A broken manifest only costs one full copy - start over
+            self.entries = {}
+        self._saved = dict(self.entries)
+
+    def save(self) -> None:
+        """Write manifest atomically if any entry changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            data = {
+                "version": self.MANIFEST_VERSION,
+                "updated_at": datetime.now().isoformat(),
+                "files": self.entries
+            }
+            atomic_write_json(self.manifest_file, data)
+            self._saved = dict(self.entries)
+            self._dirty = False
+
+    def revert(self, components: Iterable[str]) -> None:
+        """
+        Undo the records of components whose staged files were discarded
+
+        Their entries go back to what the manifest held for the files left
+        in place, or are dropped if it held nothing.
+
+        Args:
+            components: Names of rolled-back components
+        """
+        components = set(components)
+        with self._lock:
+            for key in list(self.entries):
+                if self.entries[key].get("component") not in components:
+                    continue
+                if key in self._saved:
+                    self.entries[key] = self._saved[key]
+                else:
+                    del self.entries[key]
+                self._dirty = True
+
+    def _key(self, target: Path) -> str:
+        """Get manifest key for a target path (relative to install dir when possible)"""
+        try:
+            return target.relative_to(self.install_dir).as_posix()
+        except ValueError:
+            return str(target)
+
+    def get_entry(self, target: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get manifest entry for an installed file
+
+        Args:
+            target: Installed file path
+
+        Returns:
+            Entry dict with size, mtime_ns and sha256, or None if not tracked
+        """
+        with self._lock:
+            return self.entries.get(self._key(target))
+
+    def record(self, target: Path, sha256: Optional[str] = None,
+               stat_path: Optional[Path] = None) -> None:
+        """
+        Record the current state of an installed file
+
+        Args:
+            target: Installed file path
+            sha256: Known content digest (computed from the file if omitted)
+            stat_path: File to take size/mtime from, e.g. a staged copy that
+                       will be renamed onto target (defaults to target)
+        """
+        stat_result = (stat_path or target).stat()
+        if sha256 is None:
+            sha256 = file_digest(stat_path or target)
+
+        with self._lock:
+            key = self._key(target)
+            entry = {
+                "size": stat_result.st_size,
+                "mtime_ns": stat_result.st_mtime_ns,
+                "sha256": sha256
+            }
+            component = self._current_owner(key)
+            if component:
+                entry["component"] = component
+            self.entries[key] = entry
+            self._dirty = True
+
+    def claim(self, target: Path) -> None:
+        """
+        Record only who owns an installed file, not its content
+
+        Used for files that are not copies (e.g. links into a framework
+        store), so incremental checks re-examine them but uninstall still
+        finds them.
+
+        Args:
+            target: Installed file path
+        """
+        with self._lock:
+            key = self._key(target)
+            component = self._current_owner(key)
+            self.entries[key] = {"component": component} if component else {}
+            self._dirty = True
+
+    def _current_owner(self, key: str) -> Optional[str]:
+        """Owner for an entry: the current thread's component, else the recorded one"""
+        component = getattr(self._owner, "name", None)
+        if component is None:
+            component = self.entries.get(key, {}).get("component")
+        return component
+
+    def files_for(self, component: Optional[str] = None) -> List[Path]:
+        """
+        Get installed files from the manifest
+
+        Args:
+            component: Only files owned by this component (None for all files)
+
+        Returns:
+            List of installed file paths
+        """
+        with self._lock:
+            return [
+                self.install_dir / key for key, entry in self.entries.items()
+                if component is None or entry.get("component") == component
+            ]
+
+    def size_of(self, component: Optional[str] = None) -> int:
+        """
+        Total recorded size of installed files
+
+        Args:
+            component: Only files owned by this component (None for all files)
+
+        Returns:
+            Size in bytes
+        """
+        with self._lock:
+            return sum(
+                entry.get("size", 0) for entry in self.entries.values()
+                if component is None or entry.get("component") == component
+            )
+
+    def record_copy(self, source: Path, target: Path, stat_path: Optional[Path] = None) -> None:
+        """
+        Record a freshly copied file using the (cached) source digest
+
+        Args:
+            source: Source file path
+            target: Installed file path
+            stat_path: Where the copy was actually written (defaults to target)
+        """
+        self.record(target, source_digest(source), stat_path)
+
+    def remove(self, target: Path) -> None:
+        """
+        Forget an installed file
+
+        Args:
+            target: Installed file path
+        """
+        with self._lock:
+            if self.entries.pop(self._key(target), None) is not None:
+                self._dirty = True
+
+    def is_unchanged(self, source: Path, target: Path) -> bool:
+        """
+        Check whether target already holds the same content as source
+
+        The target digest is taken from the manifest while its size and
+        mtime still match the recorded entry; otherwise the target is hashed
+        once and the result recorded for the next run.
+
+        Args:
+            source: Source file path
+            target: Installed file path
+
+        Returns:
+            True if the copy can be skipped, False otherwise
+        """
+        try:
+            target_stat = target.stat()
+            source_stat = source.stat()
+        except OSError:
+            return False
+
+        if (not target.is_file() or target.is_symlink()
+                or source_stat.st_size != target_stat.st_size):
+            return False
+
+        entry = self.get_entry(target)
+        if (entry and entry.get("size") == target_stat.st_size
+                and entry.get("mtime_ns") == target_stat.st_mtime_ns):
+            target_hash = entry.get("sha256")
+        else:
+            try:
+                target_hash = file_digest(target)
+            except OSError:
+                return False
+            self.record(target, target_hash)
+
+        return target_hash == source_digest(source)
@@ -0,0 +1,270 @@
+"""
+MCP server cold-start benchmark for SuperClaude installation system
+Times process start to the first initialize and tools/list responses over stdio
+"""
+
+import json
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Percentile with linear interpolation between closest ranks
+
+    Args:
+        values: Samples
+        pct: Percentile in 0-100
+
+    Returns:
+        Percentile value, or None if there are no samples
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _process_tree_peak_rss(pid: int) -> Optional[int]:
+    """
+    Sum peak RSS (VmHWM) over a process and its descendants
+
+    Only available where /proc exists (Linux).
+
+    Args:
+        pid: Root process id
+
+    Returns:
+        Peak RSS in bytes, or None if it cannot be measured
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    # Map parent -> children from /proc/<pid>/stat
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as f:
+                stat_fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(stat_fields[1]), []).append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    total = 0
+    found = False
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status", 'r') as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        total += int(line.split()[1]) * 1024
+                        found = True
+                        break
+        except (OSError, ValueError):
+            continue
+
+    return total if found else None
+
+
+class MCPBenchmark:
+    """
+    Measures how long MCP servers take to become ready
+
+    Each run starts the server fresh, sends initialize, the initialized
+    notification and tools/list over the stdio transport, and records the
+    time from process start to each response plus the peak RSS of the
+    server's process tree.
+    """
+
+    PROTOCOL_VERSION = "2024-11-05"
+
+    def __init__(self, timeout: float = 60.0):
+        """
+        Initialize benchmark
+
+        Args:
+            timeout: Seconds a single run may take before it counts as failed
+        """
+        self.timeout = timeout
+
+    def run_once(self, command: List[str], env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Start a server once and time its first responses
+
+        Args:
+            command: Server command line as argument list
+            env: Extra environment variables for the server
+
+        Returns:
+            Dict with ok, initialize_s, tools_list_s, tools, peak_rss and error
+        """
+        result: Dict[str, Any] = {
+            "ok": False, "initialize_s": None, "tools_list_s": None,
+            "tools": None, "peak_rss": None, "error": None
+        }
+
+        executable = shutil.which(command[0])
+        if executable is None:
+            result["error"] = f"{command[0]} not found in PATH"
+            return result
+
+        start = time.perf_counter()
+        try:
+            process = subprocess.Popen(
+                [executable, *command[1:]],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env={**os.environ, **(env or {})},
+                # Own process group so npx and the server it starts are stopped together
+                start_new_session=(sys.platform != "win32")
+            )
+        except OSError as e:
+            result["error"] = str(e)
+            return result
+
+        lines: "queue.Queue[Optional[bytes]]" = queue.Queue()
+
+        def read_stdout() -> None:
+            for line in process.stdout:
+                lines.put(line)
+            lines.put(None)
+
+        threading.Thread(target=read_stdout, daemon=True).start()
+        deadline = start + self.timeout
+
+        try:
+            self._send(process, {
+                "jsonrpc": "2.0", "id": 1, "method": "initialize",
+                "params": {
+                    "protocolVersion": self.PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "superclaude-mcp-bench", "version": "3.0.0"}
+                }
+            })
+            self._wait_for(lines, 1, deadline)
+            result["initialize_s"] = time.perf_counter() - start
+
+            self._send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+            self._send(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}})
+            response = self._wait_for(lines, 2, deadline)
+            result["tools_list_s"] = time.perf_counter() - start
+            result["tools"] = len(response.get("result", {}).get("tools", []))
+            result["ok"] = True
+
+        except (TimeoutError, EOFError, OSError, ValueError) as e:
+            result["error"] = str(e) or e.__class__.__name__
+
+        finally:
+            result["peak_rss"] = _process_tree_peak_rss(process.pid)
+            self._stop(process)
+
+        return result
+
+    def run(self, command: List[str], runs: int = 5,
+            env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Benchmark a server over several cold starts
+
+        Args:
+            command: Server command line as argument list
+            runs: Number of cold starts
+            env: Extra environment variables for the server
+
+        Returns:
+            Dict with runs, ok, p50/p95 for initialize and tools/list,
+            peak_rss (max over runs), tools and the last error
+        """
+        samples = [self.run_once(command, env) for _ in range(runs)]
+        succeeded = [sample for sample in samples if sample["ok"]]
+        initialize = [sample["initialize_s"] for sample in succeeded]
+        tools_list = [sample["tools_list_s"] for sample in succeeded]
+        rss = [sample["peak_rss"] for sample in samples if sample["peak_rss"]]
+        errors = [sample["error"] for sample in samples if sample["error"]]
+
+        return {
+            "runs": runs,
+            "ok": len(succeeded),
+            "initialize_p50": percentile(initialize, 50),
+            "initialize_p95": percentile(initialize, 95),
+            "tools_list_p50": percentile(tools_list, 50),
+            "tools_list_p95": percentile(tools_list, 95),
+            "peak_rss": max(rss) if rss else None,
+            "tools": succeeded[-1]["tools"] if succeeded else None,
+            "error": errors[-1] if errors else None
+        }
+
+    @staticmethod
+    def _send(process: subprocess.Popen, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message line to the server"""
+        process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+        process.stdin.flush()
+
+    @staticmethod
+    def _wait_for(lines: "queue.Queue[Optional[bytes]]", request_id: int, deadline: float) -> Dict[str, Any]:
+        """
+        Wait for the response to a request, skipping logs and notifications
+
+        Raises:
+            TimeoutError: If the deadline passes
+            EOFError: If the server closes stdout first
+            ValueError: If the server answers with an error
+        """
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError(f"No response to request {request_id}")
+            try:
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"No response to request {request_id}")
+            if line is None:
+                raise EOFError("Server exited before responding")
+
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue  # Not a protocol line
+            if not isinstance(message, dict) or message.get("id") != request_id:
+                continue
+            if "error" in message:
+                raise ValueError(f"Server error: {message['error'].get('message', message['error'])}")
+            return message
+
+    @staticmethod
+    def _stop(process: subprocess.Popen) -> None:
+        """Stop a server and everything it started"""
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            if sys.platform != "win32":
+                os.killpg(process.pid, signal.SIGTERM)
+            else:
+                process.terminate()
+            process.wait(timeout=5)
+        except (ProcessLookupError, subprocess.TimeoutExpired):
+            try:
+                if sys.platform != "win32":
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except ProcessLookupError:
+                pass
+            process.wait()
@@ -0,0 +1,211 @@
+"""
+Direct access to the user-scope MCP server configuration
+Reads and writes the mcpServers section of ~/.claude.json without the claude CLI
+"""
+
+import json
+import os
+import shlex
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from pathlib import Path
+
+from .file_manager import atomic_write_json
+from ..utils.process import pid_alive
+
+
+class MCPConfigFile:
+    """
+    User-scope MCP server configuration stored in ~/.claude.json
+
+    Writes take the same lock Claude Code uses for this file (a
+    "<file>.lock" directory) and replace the file atomically, so a running
+    Claude session never reads a half-written config. All additions and
+    removals of one update_servers() call land in a single write.
+
+    While SuperClaude holds the lock, the directory contains a file with
+    its pid, so a waiter only breaks the lock once that process is gone.
+    Locks without an owner file (Claude Code's own) are broken only when
+    their mtime has not been refreshed for LOCK_STALE_SECONDS.
+    """
+
+    SERVERS_KEY = "mcpServers"
+    LOCK_TIMEOUT = 10.0
+    LOCK_STALE_SECONDS = 10.0
+    LOCK_OWNER_FILE = "superclaude.pid"
+
+    _thread_lock = threading.Lock()
+
+    def __init__(self, config_file: Optional[Path] = None):
+        """
+        Initialize MCP config file access
+
+        Args:
+            config_file: Config file path (default: see default_path)
+        """
+        self.config_file = config_file or self.default_path()
+        self.lock_dir = self.config_file.with_name(self.config_file.name + ".lock")
+
+    @staticmethod
+    def default_path() -> Path:
+        """Get the user config path, honouring CLAUDE_CONFIG_DIR like the claude CLI"""
+        config_dir = os.environ.get("CLAUDE_CONFIG_DIR")
+        if config_dir:
+            return Path(config_dir) / ".claude.json"
+        return Path.home() / ".claude.json"
+
+    @staticmethod
+    def server_entry(command: str, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Build a stdio server entry from a command line
+
+        Args:
+            command: Command line, e.g. "npx @context7/mcp"
+            env: Environment variables for the server
+
+        Returns:
+            Entry in the format `claude mcp add` writes
+        """
+        parts = shlex.split(command)
+        return {
+            "type": "stdio",
+            "command": parts[0],
+            "args": parts[1:],
+            "env": dict(env or {})
+        }
+
+    @staticmethod
+    def entry_command(entry: Dict[str, Any]) -> str:
+        """Get the command line of a server entry (URL for remote servers)"""
+        if "command" in entry:
+            return " ".join([entry["command"], *entry.get("args", [])])
+        return entry.get("url", "")
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Hold the config file lock
+
+        Raises:
+            TimeoutError: If the lock cannot be taken within LOCK_TIMEOUT
+        """
+        with self._thread_lock:
+            deadline = time.monotonic() + self.LOCK_TIMEOUT
+            while True:
+                try:
+                    self.lock_dir.mkdir()
+                    break
+                except FileExistsError:
+                    # A lock left behind by a crashed process is broken
+                    try:
+                        if self._lock_is_stale():
+                            self._remove_lock_dir()
+                            continue
+                    except OSError:
+                        continue
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Could not lock {self.config_file}")
+                    time.sleep(0.05)
+            try:
+                (self.lock_dir / self.LOCK_OWNER_FILE).write_text(str(os.getpid()), encoding="utf-8")
+                yield
+            finally:
+                try:
+                    self._remove_lock_dir()
+                except OSError:
+                    pass
+
+    def _lock_owner(self) -> Optional[int]:
+        """Get the pid of the SuperClaude process holding the lock (None if unknown)"""
+        try:
+            return int((self.lock_dir / self.LOCK_OWNER_FILE).read_text(encoding="utf-8").strip())
+        except (OSError, ValueError):
+            return None
+
+    def _lock_is_stale(self) -> bool:
+        """
+        Check whether the existing lock was abandoned
+
+        Raises:
+            OSError: If the lock disappeared while checking
+        """
+        owner = self._lock_owner()
+        if owner is not None:
+            return not pid_alive(owner)
+        return time.time() - self.lock_dir.stat().st_mtime > self.LOCK_STALE_SECONDS
+
+    def _remove_lock_dir(self) -> None:
+        """Remove the lock directory and its owner file"""
+        try:
+            (self.lock_dir / self.LOCK_OWNER_FILE).unlink()
+        except FileNotFoundError:
+            pass
+        self.lock_dir.rmdir()
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Load the whole config document
+
+        Returns:
+            Config dict (empty if file doesn't exist)
+
+        Raises:
+            ValueError: If the file exists but is not valid JSON
+        """
+        if not self.config_file.exists():
+            return {}
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load {self.config_file}: {e}")
+
+    def list_servers(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get user-scope MCP servers
+
+        Returns:
+            Dict of server name to server entry
+        """
+        return dict(self.load().get(self.SERVERS_KEY, {}))
+
+    def update_servers(self, add: Optional[Dict[str, Dict[str, Any]]] = None,
+                       remove: Iterable[str] = (), replace: bool = True) -> Tuple[List[str], List[str]]:
+        """
+        Add/replace and remove servers in one locked, atomic write
+
+        Args:
+            add: Server entries to add or replace, by name
+            remove: Server names to remove
+            replace: Overwrite servers that already exist (False leaves them as they are)
+
+        Returns:
+            Tuple of (names added or changed, names removed)
+        """
+        add = add or {}
+        remove = list(remove)
+
+        with self.lock():
+            config = self.load()
+            servers = dict(config.get(self.SERVERS_KEY, {}))
+
+            added = [
+                name for name, entry in add.items()
+                if servers.get(name) != entry and (replace or name not in servers)
+            ]
+            removed = [name for name in remove if name in servers]
+            if not added and not removed:
+                return [], []
+
+            for name in added:
+                servers[name] = add[name]
+            for name in removed:
+                del servers[name]
+
+            config[self.SERVERS_KEY] = servers
+            # Keep the file's key order - it belongs to Claude Code
+            atomic_write_json(self.config_file, config, sort_keys=False)
+
+        return added, removed
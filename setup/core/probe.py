@@ -0,0 +1,364 @@
+"""
+Concurrent system probes for SuperClaude installation system
+Runs tool/version commands in parallel with a shared deadline
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import signal
+import sys
+import threading
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from pathlib import Path
+from datetime import datetime
+
+from .file_manager import atomic_write_json
+
+
+class ProbeResult:
+    """Outcome of running one probe command"""
+
+    def __init__(self, command: Tuple[str, ...], executable: Optional[str] = None,
+                 returncode: Optional[int] = None, stdout: str = "", stderr: str = "",
+                 error: Optional[str] = None):
+        """
+        Initialize probe result
+
+        Args:
+            command: Command that was probed
+            executable: Resolved executable path (None if not found in PATH)
+            returncode: Process exit code (None if it never finished)
+            stdout: Captured standard output
+            stderr: Captured standard error
+            error: "not_found", "timeout" or an error message when the probe failed
+        """
+        self.command = command
+        self.executable = executable
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.error = error
+
+    @property
+    def found(self) -> bool:
+        """Whether the executable exists in PATH"""
+        return self.error != "not_found"
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether the probe hit the deadline"""
+        return self.error == "timeout"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command ran and exited successfully"""
+        return self.error is None and self.returncode == 0
+
+    @property
+    def output(self) -> str:
+        """Combined stdout and stderr"""
+        return self.stdout + self.stderr
+
+
+def _fingerprint(executable: str) -> Optional[List[int]]:
+    """Get [inode, size, mtime_ns] of an executable (following symlinks)"""
+    try:
+        stat_result = os.stat(executable)
+    except OSError:
+        return None
+    return [stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns]
+
+
+class ProbeCache:
+    """
+    Persistent probe results stored in <install_dir>/.superclaude-cache/probes.json
+    
+    Entries are keyed by the resolved executable path and arguments and
+    carry the executable's inode, size and mtime. An entry is only reused
+    while that fingerprint still matches, so upgrading or replacing a tool
+    invalidates it without any explicit expiry.
+    """
+
+    CACHE_VERSION = 1
+    CACHE_DIR = ".superclaude-cache"
+    CACHE_NAME = "probes.json"
+
+    def __init__(self, cache_file: Path):
+        """
+        Initialize probe cache and load existing entries
+
+        Args:
+            cache_file: JSON file holding cached probe results
+        """
+        self.cache_file = cache_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    @classmethod
+    def for_install_dir(cls, install_dir: Path) -> "ProbeCache":
+        """Get the probe cache belonging to an installation directory"""
+        return cls(install_dir / cls.CACHE_DIR / cls.CACHE_NAME)
+
+    def load(self) -> None:
+        """Load cache entries from disk (missing or corrupt cache means empty)"""
+        self.entries = {}
+        self._dirty = False
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.CACHE_VERSION:
+                self.entries = data.get("probes", {})
+        except (json.JSONDecodeError, IOError, AttributeError):
+            self.entries = {}
+
+    def save(self) -> None:
+        """Write cache atomically if any entry changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            try:
+                atomic_write_json(self.cache_file, {
+                    "version": self.CACHE_VERSION,
+                    "probes": self.entries
+                })
+            except IOError:
+                return  # A cache that can't be written only costs a re-probe
+            self._dirty = False
+
+    @staticmethod
+    def _key(command: Tuple[str, ...], executable: str) -> str:
+        """Get cache key for a resolved command"""
+        return json.dumps([executable, *command[1:]])
+
+    def get(self, command: Tuple[str, ...], executable: str) -> Optional[ProbeResult]:
+        """
+        Look up a cached result whose executable is unchanged
+
+        Args:
+            command: Probe command
+            executable: Resolved path of command[0]
+
+        Returns:
+            Cached ProbeResult, or None if missing or stale
+        """
+        with self._lock:
+            entry = self.entries.get(self._key(command, executable))
+
+        if not entry or entry.get("fingerprint") != _fingerprint(executable):
+            return None
+
+        return ProbeResult(
+            command,
+            executable,
+            returncode=entry.get("returncode"),
+            stdout=entry.get("stdout", ""),
+            stderr=entry.get("stderr", "")
+        )
+
+    def put(self, result: ProbeResult) -> None:
+        """
+        Store a completed probe result
+
+        Timeouts and spawn errors are not cached, they may be transient.
+
+        Args:
+            result: Probe result to store
+        """
+        if result.error is not None or result.executable is None:
+            return
+
+        fingerprint = _fingerprint(result.executable)
+        if fingerprint is None:
+            return
+
+        with self._lock:
+            self.entries[self._key(result.command, result.executable)] = {
+                "fingerprint": fingerprint,
+                "returncode": result.returncode,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+                "probed_at": datetime.now().isoformat()
+            }
+            self._dirty = True
+
+
+class ProbeEngine:
+    """
+    Runs probe commands concurrently and memoizes their results
+
+    All commands passed to run() are started at once with
+    asyncio.create_subprocess_exec and share a single deadline, so total
+    latency is that of the slowest probe rather than the sum. Results are
+    kept for the lifetime of the engine; commands are looked up in PATH
+    with shutil.which first, so missing tools never spawn a process.
+    With a ProbeCache attached, results also persist across runs.
+    """
+
+    def __init__(self, timeout: float = 10.0):
+        """
+        Initialize probe engine
+
+        Args:
+            timeout: Shared deadline in seconds for each batch of probes
+        """
+        self.timeout = timeout
+        self.cache: Optional[ProbeCache] = None
+        self._results: Dict[Tuple[str, ...], ProbeResult] = {}
+        self._lock = threading.Lock()
+
+    def use_cache(self, cache: Optional[ProbeCache]) -> None:
+        """
+        Attach a persistent cache consulted before spawning probes
+
+        Args:
+            cache: Probe cache (None to disable)
+        """
+        self.cache = cache
+
+    def run(self, commands: Sequence[Sequence[str]]) -> Dict[Tuple[str, ...], ProbeResult]:
+        """
+        Probe several commands concurrently
+
+        Args:
+            commands: Commands as argument lists, e.g. [["node", "--version"]]
+
+        Returns:
+            Dict mapping each command tuple to its ProbeResult
+        """
+        wanted = [tuple(command) for command in commands]
+
+        with self._lock:
+            pending = list(dict.fromkeys(
+                command for command in wanted if command not in self._results
+            ))
+
+        if pending:
+            results = self._run_pending(pending)
+            with self._lock:
+                self._results.update(results)
+
+        with self._lock:
+            return {command: self._results[command] for command in wanted}
+
+    def probe(self, command: Sequence[str]) -> ProbeResult:
+        """
+        Probe a single command (memoized)
+
+        Args:
+            command: Command as argument list
+
+        Returns:
+            ProbeResult for the command
+        """
+        return self.run([command])[tuple(command)]
+
+    def clear(self) -> None:
+        """Forget memoized results"""
+        with self._lock:
+            self._results.clear()
+
+    def _run_pending(self, commands: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], ProbeResult]:
+        """Resolve executables and run the ones found in PATH"""
+        results: Dict[Tuple[str, ...], ProbeResult] = {}
+        to_spawn: List[Tuple[Tuple[str, ...], str]] = []
+
+        cache = self.cache
+
+        for command in commands:
+            executable = shutil.which(command[0]) if command else None
+            if executable is None:
+                results[command] = ProbeResult(command, error="not_found")
+                continue
+
+            cached = cache.get(command, executable) if cache else None
+            if cached is not None:
+                results[command] = cached
+            else:
+                to_spawn.append((command, executable))
+
+        if to_spawn:
+            spawned = asyncio.run(self._spawn_all(to_spawn))
+            results.update(spawned)
+
+            if cache:
+                for result in spawned.values():
+                    cache.put(result)
+                cache.save()
+
+        return results
+
+    async def _spawn_all(self, probes: List[Tuple[Tuple[str, ...], str]]) -> Dict[Tuple[str, ...], ProbeResult]:
+        """Start every probe at once and wait for all of them up to the deadline"""
+        deadline = asyncio.get_running_loop().time() + self.timeout
+        results = await asyncio.gather(*(
+            self._spawn(command, executable, deadline) for command, executable in probes
+        ))
+        return {result.command: result for result in results}
+
+    async def _spawn(self, command: Tuple[str, ...], executable: str, deadline: float) -> ProbeResult:
+        """
+        Run one probe process
+
+        Args:
+            command: Probe command
+            executable: Resolved path of command[0]
+            deadline: Event loop time by which the probe must finish
+
+        Returns:
+            ProbeResult for the command
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                executable, *command[1:],
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Own process group so a timeout also kills wrapper script children
+                start_new_session=(sys.platform != "win32")
+            )
+        except FileNotFoundError:
+            return ProbeResult(command, error="not_found")
+        except OSError as e:
+            return ProbeResult(command, executable, error=str(e))
+
+        remaining = max(0.0, deadline - asyncio.get_running_loop().time())
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), remaining)
+        except asyncio.TimeoutError:
+            try:
+                if sys.platform != "win32":
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            return ProbeResult(command, executable, error="timeout")
+
+        return ProbeResult(
+            command,
+            executable,
+            returncode=process.returncode,
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace")
+        )
+
+
+# Engine shared by the validator and components within one process
+_probe_engine: Optional[ProbeEngine] = None
+_probe_engine_lock = threading.Lock()
+
+
+def get_probe_engine() -> ProbeEngine:
+    """Get the process-wide probe engine"""
+    global _probe_engine
+    with _probe_engine_lock:
+        if _probe_engine is None:
+            _probe_engine = ProbeEngine()
+        return _probe_engine
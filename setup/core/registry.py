@@ -4,13 +4,38 @@ Component registry for auto-discovery and dependency resolution
 
 import importlib
 import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+import os
+import sys
+import threading
+from typing import Dict, List, Set, Optional, Type, Any
 from pathlib import Path
 from ..base.component import Component
+from .file_manager import atomic_write_json
 
 
 class ComponentRegistry:
-    """Auto-discovery and management of installable components"""
+    """
+    Auto-discovery and management of installable components
+
+    Metadata and dependencies come from each class's METADATA and
+    DEPENDENCIES attributes; only components without them are instantiated.
+    Discovery results (component name, class path, metadata and
+    dependencies) are kept in a manifest cached on disk next to the
+    component sources, in __pycache__/ like Python's own bytecode cache.
+    The manifest is reused while the modifications times and sizes of the
+    component source files and the base classes they build on, and the
+    package version, are unchanged, so a warm registry imports no
+    component module; classes are imported and instantiated only when a
+    component is actually asked for.
+    """
+
+    MANIFEST_VERSION = 2
+    MANIFEST_NAME = "registry-manifest.json"
+
+    # Manifests already loaded in this process, by components directory
+    _manifests: Dict[str, Dict[str, Any]] = {}
+    _manifests_lock = threading.Lock()
     
     def __init__(self, components_dir: Path):
         """
@@ -20,8 +45,11 @@ class ComponentRegistry:
             components_dir: Directory containing component modules
         """
         self.components_dir = components_dir
+        self.manifest_file = components_dir / "__pycache__" / self.MANIFEST_NAME
         self.component_classes: Dict[str, Type[Component]] = {}
         self.component_instances: Dict[str, Component] = {}
+        self.component_metadata: Dict[str, Dict[str, Any]] = {}
+        self.class_paths: Dict[str, str] = {}
         self.dependency_graph: Dict[str, Set[str]] = {}
         self._discovered = False
     
@@ -29,21 +57,120 @@ class ComponentRegistry:
         """
         Auto-discover all component classes in components directory
         
+        Uses the cached discovery manifest when the component sources are
+        unchanged, otherwise imports the component modules and rewrites it.
+        
         Args:
-            force_reload: Force rediscovery even if already done
+            force_reload: Force rediscovery even if already done (ignores the cache)
         """
         if self._discovered and not force_reload:
             return
         
         self.component_classes.clear()
         self.component_instances.clear()
+        self.component_metadata.clear()
+        self.class_paths.clear()
         self.dependency_graph.clear()
         
         if not self.components_dir.exists():
             return
         
+        sources = self._source_fingerprints()
+        manifest = None if force_reload else self._load_manifest(sources)
+        if manifest is None:
+            manifest = self._scan_components(sources)
+            self._save_manifest(manifest)
+        
+        for name, entry in manifest["components"].items():
+            self.class_paths[name] = entry["class"]
+            self.component_metadata[name] = entry["metadata"]
+            self.dependency_graph[name] = set(entry["dependencies"])
+        
+        self._discovered = True
+    
+    def _source_fingerprints(self) -> Dict[str, Any]:
+        """
+        Get [mtime_ns, size] of every file discovery results depend on
+        
+        Besides the component modules this covers the base package (the
+        Component defaults for metadata and dependencies live there), the
+        package __init__ and VERSION file, plus the package version itself.
+        Keys are paths relative to the package directory.
+        """
+        package_dir = self.components_dir.parent
+        source_files = [
+            py_file for py_file in sorted(self.components_dir.glob("*.py"))
+            if not py_file.name.startswith("__")
+        ]
+        source_files += sorted((package_dir / "base").glob("*.py"))
+        source_files += [package_dir / "__init__.py", package_dir.parent / "VERSION"]
+        
+        sources: Dict[str, Any] = {}
+        for source_file in source_files:
+            try:
+                stat_result = source_file.stat()
+            except OSError:
+                continue
+            key = Path(os.path.relpath(source_file, package_dir)).as_posix()
+            sources[key] = [stat_result.st_mtime_ns, stat_result.st_size]
+        
+        from .. import __version__
+        sources["__version__"] = __version__
+        return sources
+    
+    def _load_manifest(self, sources: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the discovery manifest if it matches the current sources
+        
+        Args:
+            sources: Current source fingerprints
+            
+        Returns:
+            Manifest dict, or None if missing or stale
+        """
+        key = str(self.components_dir.resolve())
+        with self._manifests_lock:
+            manifest = self._manifests.get(key)
+        
+        if manifest is None:
+            try:
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                return None
+        
+        if (not isinstance(manifest, dict) or
+                manifest.get("version") != self.MANIFEST_VERSION or
+                manifest.get("sources") != sources):
+            return None
+        
+        with self._manifests_lock:
+            self._manifests[key] = manifest
+        return manifest
+    
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Remember a manifest in this process and on disk (best effort)"""
+        with self._manifests_lock:
+            self._manifests[str(self.components_dir.resolve())] = manifest
+        
+        try:
+            atomic_write_json(self.manifest_file, manifest, sort_keys=False)
+        except (IOError, TypeError, ValueError):
+            pass  # Read-only checkout or odd metadata - discovery just isn't cached
+    
+    def _scan_components(self, sources: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Import component modules and build a discovery manifest
+        
+        Args:
+            sources: Source fingerprints to record in the manifest
+            
+        Returns:
+            Manifest dict
+        """
+        components: Dict[str, Dict[str, Any]] = {}
+        
         # Add components directory to Python path temporarily
-        import sys
         original_path = sys.path.copy()
         
         try:
@@ -53,27 +180,29 @@ class ComponentRegistry:
                 sys.path.insert(0, str(setup_dir))
             
             # Discover all Python files in components directory
-            for py_file in self.components_dir.glob("*.py"):
-                if py_file.name.startswith("__"):
-                    continue
-                
-                module_name = py_file.stem
-                self._load_component_module(module_name)
+            for file_name in sources:
+                if not file_name.startswith(f"{self.components_dir.name}/"):
+                    continue  # Base classes and version files are fingerprinted only
+                module_name = Path(file_name).stem
+                self._load_component_module(module_name, components)
         
         finally:
             # Restore original Python path
             sys.path = original_path
         
-        # Build dependency graph
-        self._build_dependency_graph()
-        self._discovered = True
+        return {
+            "version": self.MANIFEST_VERSION,
+            "sources": sources,
+            "components": components
+        }
     
-    def _load_component_module(self, module_name: str) -> None:
+    def _load_component_module(self, module_name: str, components: Dict[str, Dict[str, Any]]) -> None:
         """
         Load component classes from a module
         
         Args:
             module_name: Name of module to load
+            components: Manifest entries to add discovered components to
         """
         try:
             # Import the module
@@ -86,14 +215,26 @@ class ComponentRegistry:
                     issubclass(obj, Component) and 
                     obj is not Component):
                     
-                    # Create instance to get metadata
                     try:
-                        instance = obj()
-                        metadata = instance.get_metadata()
+                        if obj.METADATA:
+                            # Declared on the class - no instance needed
+                            metadata = dict(obj.METADATA)
+                            dependencies = list(obj.DEPENDENCIES)
+                        else:
+                            # Create instance to get metadata
+                            instance = obj()
+                            metadata = instance.get_metadata()
+                            dependencies = list(instance.get_dependencies())
+                            self.component_instances[metadata["name"]] = instance
                         component_name = metadata["name"]
                         
+                        components[component_name] = {
+                            "class": f"{obj.__module__}:{obj.__qualname__}",
+                            "metadata": metadata,
+                            "dependencies": dependencies
+                        }
+                        
                         self.component_classes[component_name] = obj
-                        self.component_instances[component_name] = instance
                         
                     except Exception as e:
                         print(f"Warning: Could not instantiate component {name}: {e}")
@@ -101,15 +242,35 @@ class ComponentRegistry:
         except Exception as e:
             print(f"Warning: Could not load component module {module_name}: {e}")
     
-    def _build_dependency_graph(self) -> None:
-        """Build dependency graph for all discovered components"""
-        for name, instance in self.component_instances.items():
-            try:
-                dependencies = instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                print(f"Warning: Could not get dependencies for {name}: {e}")
-                self.dependency_graph[name] = set()
+    def _import_component_class(self, component_name: str) -> Optional[Type[Component]]:
+        """
+        Import a component class from its manifest class path
+        
+        Args:
+            component_name: Name of component
+            
+        Returns:
+            Component class or None if unknown or not importable
+        """
+        component_class = self.component_classes.get(component_name)
+        if component_class is not None:
+            return component_class
+        
+        class_path = self.class_paths.get(component_name)
+        if class_path is None:
+            return None
+        
+        module_name, _, qualname = class_path.partition(":")
+        try:
+            component_class = importlib.import_module(module_name)
+            for attr in qualname.split("."):
+                component_class = getattr(component_class, attr)
+        except (ImportError, AttributeError) as e:
+            print(f"Warning: Could not load component {component_name} from {class_path}: {e}")
+            return None
+        
+        self.component_classes[component_name] = component_class
+        return component_class
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
@@ -122,7 +283,7 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
-        return self.component_classes.get(component_name)
+        return self._import_component_class(component_name)
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
         """
@@ -137,17 +298,26 @@ class ComponentRegistry:
         """
         self.discover_components()
         
+        component_class = self._import_component_class(component_name)
+        if component_class is None:
+            return None
+        
         if install_dir is not None:
             # Create new instance with specified install directory
-            component_class = self.component_classes.get(component_name)
-            if component_class:
-                try:
-                    return component_class(install_dir)
-                except Exception as e:
-                    print(f"Error creating component instance {component_name}: {e}")
-                    return None
-        
-        return self.component_instances.get(component_name)
+            try:
+                return component_class(install_dir)
+            except Exception as e:
+                print(f"Error creating component instance {component_name}: {e}")
+                return None
+        
+        if component_name not in self.component_instances:
+            try:
+                self.component_instances[component_name] = component_class()
+            except Exception as e:
+                print(f"Error creating component instance {component_name}: {e}")
+                return None
+        
+        return self.component_instances[component_name]
     
     def list_components(self) -> List[str]:
         """
@@ -157,7 +327,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.class_paths.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -170,13 +340,8 @@ class ComponentRegistry:
             Component metadata dict or None if not found
         """
         self.discover_components()
-        instance = self.component_instances.get(component_name)
-        if instance:
-            try:
-                return instance.get_metadata()
-            except Exception:
-                return None
-        return None
+        metadata = self.component_metadata.get(component_name)
+        return dict(metadata) if metadata is not None else None
     
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
         """
@@ -279,6 +444,46 @@ class ComponentRegistry:
         
         return errors
     
+    def check_features(self, features: Dict[str, Any]) -> List[str]:
+        """
+        Compare discovered components with features.json
+        
+        Args:
+            features: Loaded features configuration
+            
+        Returns:
+            List of mismatches (empty if consistent)
+        """
+        self.discover_components()
+        problems = []
+        declared = features.get("components", {})
+        
+        for name, metadata in self.component_metadata.items():
+            info = declared.get(name)
+            if info is None:
+                problems.append(f"Component {name} is missing from features.json")
+                continue
+            
+            for key in ("name", "version", "description", "category"):
+                if info.get(key) != metadata.get(key):
+                    problems.append(
+                        f"Component {name} {key} differs: "
+                        f"features.json has {info.get(key)!r}, component has {metadata.get(key)!r}"
+                    )
+            
+            declared_deps = set(info.get("dependencies", []))
+            if declared_deps != self.dependency_graph.get(name, set()):
+                problems.append(
+                    f"Component {name} dependencies differ: "
+                    f"features.json has {sorted(declared_deps)}, component has {sorted(self.dependency_graph[name])}"
+                )
+        
+        for name in declared:
+            if name not in self.component_metadata:
+                problems.append(f"features.json lists unknown component {name}")
+        
+        return problems
+    
     def get_components_by_category(self, category: str) -> List[str]:
         """
         Get components filtered by category
@@ -292,13 +497,9 @@ class ComponentRegistry:
         self.discover_components()
         components = []
         
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
+        for name, metadata in self.component_metadata.items():
+            if metadata.get("category") == category:
+                components.append(name)
         
         return components
     
@@ -375,20 +576,14 @@ class ComponentRegistry:
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, metadata in self.component_metadata.items():
+            category = metadata.get("category", "unknown")
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.class_paths),
             "categories": categories,
             "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
             "validation_errors": self.validate_dependency_graph()
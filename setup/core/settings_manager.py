@@ -5,14 +5,154 @@ Handles settings.json manipulation with deep merge and backup
 
 import json
 import shutil
-from typing import Dict, Any, Optional, List
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Optional, List, Iterator, Tuple
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from .file_manager import atomic_write_json
+
+
+# Per-file locks shared by every SettingsManager instance, so components
+# installed concurrently never interleave read-modify-write cycles
+_file_locks: Dict[str, threading.RLock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def _get_file_lock(path: Path) -> threading.RLock:
+    """Get the process-wide lock guarding a settings or metadata file"""
+    key = str(path.absolute())
+    with _file_locks_guard:
+        if key not in _file_locks:
+            _file_locks[key] = threading.RLock()
+        return _file_locks[key]
+
+
+class _CachedDocument:
+    """In-memory copy of a JSON file shared by every SettingsManager in the process"""
+    
+    def __init__(self):
+        self.data: Optional[Dict[str, Any]] = None
+        self.base: Optional[Dict[str, Any]] = None    # Disk contents data was derived from
+        self.stat: Optional[Tuple[int, int]] = None   # (mtime_ns, size) of base on disk
+        self.dirty = False                             # Changes not yet written to disk
+        self.backup = False                            # Settings backup requested before flush
+        self.deferred = 0                              # Open session() count
+
+
+# Parsed documents keyed by absolute path (guarded by the per-file locks)
+_documents: Dict[str, _CachedDocument] = {}
+
+
+def _get_document(path: Path) -> _CachedDocument:
+    """Get the shared cache entry for a settings or metadata file"""
+    key = str(path.absolute())
+    with _file_locks_guard:
+        if key not in _documents:
+            _documents[key] = _CachedDocument()
+        return _documents[key]
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) of a file, or None if it doesn't exist"""
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+_MISSING = object()
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """Compare JSON values without treating true/1 or 1/1.0 as equal"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _escape_pointer(key: str) -> str:
+    """Escape a key for use in a JSON Pointer (RFC 6901)"""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer(token: str) -> str:
+    """Undo _escape_pointer for one JSON Pointer token"""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _apply_operation(node: Any, keys: List[str], operation: Dict[str, Any]) -> Any:
+    """
+    Apply one diff operation below node, copying only the dicts along its path
+    
+    Args:
+        node: Document (or subtree) to patch - never modified
+        keys: Remaining path tokens
+        operation: {"op", "path", "value"} as produced by SettingsManager.diff
+        
+    Returns:
+        Patched node (node itself if there was nothing to do)
+    """
+    removing = operation["op"] == "remove"
+    if not isinstance(node, dict):
+        if removing:
+            return node
+        node = {}
+    
+    key = keys[0]
+    result = dict(node)
+    if len(keys) == 1:
+        if removing:
+            if key not in result:
+                return node
+            del result[key]
+        else:
+            result[key] = operation["value"]
+        return result
+    
+    child = node.get(key, _MISSING)
+    if child is _MISSING and removing:
+        return node
+    result[key] = _apply_operation(None if child is _MISSING else child, keys[1:], operation)
+    return result
+
+
+def _apply_patch(document: Dict[str, Any], operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply diff operations to a document without modifying it
+    
+    Args:
+        document: Document to patch
+        operations: Operations from SettingsManager.diff
+        
+    Returns:
+        Patched document sharing unchanged subtrees with the input
+    """
+    for operation in operations:
+        keys = [_unescape_pointer(token) for token in operation["path"].split("/")[1:]]
+        if not keys:
+            document = operation["value"] if operation["op"] != "remove" else {}
+        else:
+            document = _apply_operation(document, keys, operation)
+    return document
+
 
 class SettingsManager:
-    """Manages settings.json file operations"""
+    """
+    Manages settings.json file operations
+    
+    Documents are parsed once and cached process-wide; the cache is
+    invalidated when the file's mtime or size changes on disk. Inside
+    session() all saves are held in memory and written once when the
+    outermost session ends.
+    """
     
     def __init__(self, install_dir: Path):
         """
@@ -25,6 +165,207 @@ class SettingsManager:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+    
+    @contextmanager
+    def settings_lock(self) -> Iterator[None]:
+        """Hold the settings.json lock across a load/modify/save sequence"""
+        with _get_file_lock(self.settings_file):
+            yield
+    
+    @contextmanager
+    def metadata_lock(self) -> Iterator[None]:
+        """Hold the metadata lock across a load/modify/save sequence"""
+        with _get_file_lock(self.metadata_file):
+            yield
+    
+    @contextmanager
+    def session(self) -> Iterator["SettingsManager"]:
+        """
+        Unit of work: defer settings and metadata writes until the session ends
+        
+        Sessions nest and are shared by every SettingsManager for the same
+        install directory, so components saving from worker threads all
+        land in one write per file when the outermost session closes.
+        """
+        paths = (self.settings_file, self.metadata_file)
+        for path in paths:
+            with _get_file_lock(path):
+                _get_document(path).deferred += 1
+        try:
+            yield self
+        finally:
+            for path in paths:
+                with _get_file_lock(path):
+                    document = _get_document(path)
+                    document.deferred -= 1
+                    if document.deferred == 0 and document.dirty:
+                        self._flush_document(path, document)
+    
+    def discard_pending(self, components: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop changes made in the current session that are not written yet
+        
+        Args:
+            components: Only put these components' registrations back to
+                        what is on disk; None discards every pending
+                        settings and metadata change
+        """
+        if components is None:
+            for path in (self.settings_file, self.metadata_file):
+                with _get_file_lock(path):
+                    document = _get_document(path)
+                    if document.dirty:
+                        document.data = document.base
+                        document.dirty = False
+                        document.backup = False
+            return
+        
+        with self.metadata_lock():
+            document = _get_document(self.metadata_file)
+            if not document.dirty:
+                return
+            saved = (document.base or {}).get("components", {})
+            operations = []
+            for name in components:
+                pointer = f"/components/{_escape_pointer(name)}"
+                if name in saved:
+                    operations.append({"op": "replace", "path": pointer, "value": saved[name]})
+                else:
+                    operations.append({"op": "remove", "path": pointer})
+            document.data = _apply_patch(document.data, operations)
+    
+    def _refresh_document(self, path: Path, document: _CachedDocument, label: str) -> None:
+        """
+        Make a cached document reflect the file on disk (caller holds the file lock)
+        
+        If the file changed since it was read or written - another process
+        or the user edited it - it is re-read. Changes pending in a session
+        are then re-applied on top of the new contents, so an outside edit
+        is never overwritten with stale data.
+        
+        Args:
+            path: File the document caches
+            document: Cache entry
+            label: Document name used in error messages
+            
+        Raises:
+            ValueError: If the file cannot be parsed
+        """
+        current_stat = _stat_key(path)
+        if document.data is not None and document.stat == current_stat:
+            return
+        
+        if current_stat is None:
+            disk_data = {}
+        else:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    disk_data = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                raise ValueError(f"Could not load {label} from {path}: {e}")
+        
+        if document.dirty and document.data is not None:
+            pending = self.diff(document.base, document.data)
+            document.data = _apply_patch(disk_data, pending)
+        else:
+            document.data = disk_data
+        document.base = disk_data
+        document.stat = current_stat
+    
+    def _peek_document(self, path: Path, label: str) -> Dict[str, Any]:
+        """
+        Get the cached parsed contents of a JSON file without copying
+        
+        The result is shared with the cache and must not be modified; use
+        _load_document for a private copy.
+        
+        Args:
+            path: File to load
+            label: Document name used in error messages
+            
+        Returns:
+            Parsed dict (empty if file doesn't exist)
+        """
+        with _get_file_lock(path):
+            document = _get_document(path)
+            self._refresh_document(path, document, label)
+            return document.data
+    
+    def _load_document(self, path: Path, label: str) -> Dict[str, Any]:
+        """
+        Get a private copy of the parsed contents of a JSON file
+        
+        Callers get their own copy, so a modification that is never saved
+        cannot leak into the cache.
+        
+        Args:
+            path: File to load
+            label: Document name used in error messages
+            
+        Returns:
+            Parsed dict (empty if file doesn't exist)
+        """
+        return copy.deepcopy(self._peek_document(path, label))
+    
+    def _save_document(self, path: Path, data: Dict[str, Any], backup: bool = False) -> None:
+        """
+        Store new contents for a JSON file, writing now or at session end
+        
+        Args:
+            path: File to save
+            data: New contents (owned by the cache from now on)
+            backup: Create a settings backup before the write reaches disk
+        """
+        with _get_file_lock(path):
+            document = _get_document(path)
+            if document.data is None:
+                self._refresh_document(path, document, path.name)
+            document.data = data
+            document.dirty = True
+            document.backup = document.backup or backup
+            
+            if document.deferred == 0:
+                self._flush_document(path, document)
+    
+    def _flush_document(self, path: Path, document: _CachedDocument) -> None:
+        """Write a cached document to disk atomically (caller holds the file lock)"""
+        # Pick up edits made on disk since the document was read
+        self._refresh_document(path, document, path.name)
+        
+        if document.backup and path == self.settings_file and path.exists():
+            self._create_settings_backup()
+        
+        # Save atomically so readers see old or new, never partial
+        try:
+            atomic_write_json(path, document.data)
+        except IOError as e:
+            raise ValueError(f"Could not save {path.name}: {e}")
+        
+        document.base = document.data
+        document.stat = _stat_key(path)
+        document.dirty = False
+        document.backup = False
+    
+    @staticmethod
+    def _lookup(data: Dict[str, Any], key_path: str, default: Any) -> Any:
+        """
+        Get a dot-notation path from a shared document, copying only a mutable result
+        
+        Args:
+            data: Cached document (not modified)
+            key_path: Dot-separated path
+            default: Value if the path doesn't exist
+            
+        Returns:
+            Value (deep-copied if it is a dict or list) or default
+        """
+        try:
+            value = data
+            for key in key_path.split('.'):
+                value = value[key]
+        except (KeyError, TypeError):
+            return default
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -33,14 +374,7 @@ class SettingsManager:
         Returns:
             Settings dict (empty if file doesn't exist)
         """
-        if not self.settings_file.exists():
-            return {}
-        
-        try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
+        return self._load_document(self.settings_file, "settings")
     
     def save_settings(self, settings: Dict[str, Any], create_backup: bool = True) -> None:
         """
@@ -50,19 +384,7 @@ class SettingsManager:
             settings: Settings dict to save
             create_backup: Whether to create backup before saving
         """
-        # Create backup if requested and file exists
-        if create_backup and self.settings_file.exists():
-            self._create_settings_backup()
-        
-        # Ensure directory exists
-        self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save with pretty formatting
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
+        self._save_document(self.settings_file, settings, backup=create_backup)
     
     def load_metadata(self) -> Dict[str, Any]:
         """
@@ -71,14 +393,7 @@ class SettingsManager:
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
-        if not self.metadata_file.exists():
-            return {}
-        
-        try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+        return self._load_document(self.metadata_file, "metadata")
     
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
@@ -87,15 +402,7 @@ class SettingsManager:
         Args:
             metadata: Metadata dict to save
         """
-        # Ensure directory exists
-        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save with pretty formatting
-        try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+        self._save_document(self.metadata_file, metadata)
     
     def migrate_superclaude_data(self) -> bool:
         """
@@ -104,7 +411,12 @@ class SettingsManager:
         Returns:
             True if migration occurred, False if no data to migrate
         """
-        settings = self.load_settings()
+        with self.settings_lock(), self.metadata_lock():
+            return self._migrate_superclaude_data()
+    
+    def _migrate_superclaude_data(self) -> bool:
+        """Migrate SuperClaude data; caller must hold both file locks"""
+        settings = self._peek_document(self.settings_file, "settings")
         
         # SuperClaude-specific fields to migrate
         superclaude_fields = ["components", "framework", "superclaude", "mcp"]
@@ -121,7 +433,7 @@ class SettingsManager:
             return False
         
         # Load existing metadata (if any) and merge
-        existing_metadata = self.load_metadata()
+        existing_metadata = self._peek_document(self.metadata_file, "metadata")
         merged_metadata = self._deep_merge(existing_metadata, data_to_migrate)
         
         # Save to metadata file
@@ -156,8 +468,15 @@ class SettingsManager:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
         """
-        merged = self.merge_settings(modifications)
-        self.save_settings(merged, create_backup)
+        with self.settings_lock():
+            # _deep_merge never modifies its base, so the cached document is used as-is
+            existing = self._peek_document(self.settings_file, "settings")
+            merged = self._deep_merge(existing, modifications)
+            
+            # Nothing changed - skip the backup and the write
+            if not self.diff(existing, merged):
+                return
+            self.save_settings(merged, create_backup)
     
     def get_setting(self, key_path: str, default: Any = None) -> Any:
         """
@@ -170,15 +489,8 @@ class SettingsManager:
         Returns:
             Setting value or default
         """
-        settings = self.load_settings()
-        
-        try:
-            value = settings
-            for key in key_path.split('.'):
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        settings = self._peek_document(self.settings_file, "settings")
+        return self._lookup(settings, key_path, default)
     
     def set_setting(self, key_path: str, value: Any, create_backup: bool = True) -> None:
         """
@@ -213,25 +525,39 @@ class SettingsManager:
         Returns:
             True if setting was removed, False if not found
         """
-        settings = self.load_settings()
-        keys = key_path.split('.')
-        
-        # Navigate to parent of target key
-        current = settings
-        try:
-            for key in keys[:-1]:
-                current = current[key]
+        with self.settings_lock():
+            settings = self._peek_document(self.settings_file, "settings")
+            keys = key_path.split('.')
             
-            # Remove the target key
-            if keys[-1] in current:
-                del current[keys[-1]]
-                self.save_settings(settings, create_backup)
-                return True
-            else:
-                return False
+            # Navigate to parent of target key
+            current = settings
+            try:
+                for key in keys[:-1]:
+                    current = current[key]
                 
-        except (KeyError, TypeError):
-            return False
+                if not isinstance(current, dict) or keys[-1] not in current:
+                    return False
+            except (KeyError, TypeError):
+                return False
+            
+            # Copy only the dicts along the path; the cached document stays untouched
+            pointer = "".join(f"/{_escape_pointer(key)}" for key in keys)
+            settings = _apply_patch(settings, [{"op": "remove", "path": pointer}])
+            self.save_settings(settings, create_backup)
+            return True
+    
+    def update_metadata(self, modifications: Dict[str, Any]) -> None:
+        """
+        Deep merge modifications into metadata and save
+        
+        Args:
+            modifications: Metadata modifications to apply
+        """
+        with self.metadata_lock():
+            existing = self._peek_document(self.metadata_file, "metadata")
+            merged = self._deep_merge(existing, modifications)
+            if self.diff(existing, merged):
+                self.save_metadata(merged)
     
     def add_component_registration(self, component_name: str, component_info: Dict[str, Any]) -> None:
         """
@@ -241,16 +567,17 @@ class SettingsManager:
             component_name: Name of component
             component_info: Component metadata dict
         """
-        metadata = self.load_metadata()
-        if "components" not in metadata:
-            metadata["components"] = {}
-        
-        metadata["components"][component_name] = {
-            **component_info,
-            "installed_at": datetime.now().isoformat()
-        }
-        
-        self.save_metadata(metadata)
+        with self.metadata_lock():
+            metadata = self._peek_document(self.metadata_file, "metadata")
+            metadata = _apply_patch(metadata, [{
+                "op": "add",
+                "path": f"/components/{_escape_pointer(component_name)}",
+                "value": {
+                    **copy.deepcopy(component_info),
+                    "installed_at": datetime.now().isoformat()
+                }
+            }])
+            self.save_metadata(metadata)
     
     def remove_component_registration(self, component_name: str) -> bool:
         """
@@ -262,12 +589,16 @@ class SettingsManager:
         Returns:
             True if component was removed, False if not found
         """
-        metadata = self.load_metadata()
-        if "components" in metadata and component_name in metadata["components"]:
-            del metadata["components"][component_name]
+        with self.metadata_lock():
+            metadata = self._peek_document(self.metadata_file, "metadata")
+            if component_name not in metadata.get("components", {}):
+                return False
+            metadata = _apply_patch(metadata, [{
+                "op": "remove",
+                "path": f"/components/{_escape_pointer(component_name)}"
+            }])
             self.save_metadata(metadata)
             return True
-        return False
     
     def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -276,8 +607,7 @@ class SettingsManager:
         Returns:
             Dict of component_name -> component_info
         """
-        metadata = self.load_metadata()
-        return metadata.get("components", {})
+        return self.get_metadata_setting("components", {})
     
     def is_component_installed(self, component_name: str) -> bool:
         """
@@ -289,8 +619,8 @@ class SettingsManager:
         Returns:
             True if component is installed, False otherwise
         """
-        components = self.get_installed_components()
-        return component_name in components
+        metadata = self._peek_document(self.metadata_file, "metadata")
+        return component_name in metadata.get("components", {})
     
     def get_component_version(self, component_name: str) -> Optional[str]:
         """
@@ -302,8 +632,8 @@ class SettingsManager:
         Returns:
             Version string or None if not installed
         """
-        components = self.get_installed_components()
-        component_info = components.get(component_name, {})
+        metadata = self._peek_document(self.metadata_file, "metadata")
+        component_info = metadata.get("components", {}).get(component_name, {})
         return component_info.get("version")
     
     def update_framework_version(self, version: str) -> None:
@@ -313,14 +643,12 @@ class SettingsManager:
         Args:
             version: Framework version string
         """
-        metadata = self.load_metadata()
-        if "framework" not in metadata:
-            metadata["framework"] = {}
-        
-        metadata["framework"]["version"] = version
-        metadata["framework"]["updated_at"] = datetime.now().isoformat()
-        
-        self.save_metadata(metadata)
+        self.update_metadata({
+            "framework": {
+                "version": version,
+                "updated_at": datetime.now().isoformat()
+            }
+        })
     
     def get_framework_version(self) -> Optional[str]:
         """
@@ -329,7 +657,7 @@ class SettingsManager:
         Returns:
             Version string or None if not set
         """
-        metadata = self.load_metadata()
+        metadata = self._peek_document(self.metadata_file, "metadata")
         framework = metadata.get("framework", {})
         return framework.get("version")
     
@@ -344,36 +672,81 @@ class SettingsManager:
         Returns:
             Metadata value or default
         """
-        metadata = self.load_metadata()
-        
-        try:
-            value = metadata
-            for key in key_path.split('.'):
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        metadata = self._peek_document(self.metadata_file, "metadata")
+        return self._lookup(metadata, key_path, default)
     
     def _deep_merge(self, base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Deep merge two dictionaries
+        Deep merge two dictionaries with structural sharing
+        
+        Only the dicts along paths the overlay actually changes are copied;
+        every other subtree of the result is shared with base. If the
+        overlay changes nothing, base itself is returned. Overlay values
+        are copied, so the caller may keep modifying its overlay.
         
         Args:
-            base: Base dictionary
+            base: Base dictionary (must not be modified afterwards)
             overlay: Dictionary to merge on top
             
         Returns:
-            Merged dictionary
+            Merged dictionary (base itself if the merge is a no-op)
         """
-        result = copy.deepcopy(base)
+        result = None
         
         for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+            current = base.get(key, _MISSING)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = self._deep_merge(current, value)
+            elif _json_equal(current, value):
+                continue
             else:
-                result[key] = copy.deepcopy(value)
+                merged = copy.deepcopy(value)
+            
+            if merged is current:
+                continue
+            if result is None:
+                result = dict(base)  # Shallow copy: siblings stay shared
+            result[key] = merged
         
-        return result
+        return base if result is None else result
+    
+    def diff(self, old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+        """
+        Compute a minimal JSON-Patch-style diff between two documents
+        
+        Subtrees shared between old and new (as produced by _deep_merge)
+        are skipped without being walked. Lists are compared as values.
+        
+        Args:
+            old: Original document
+            new: Modified document
+            path: JSON Pointer prefix for the emitted paths
+            
+        Returns:
+            List of {"op": "add"|"remove"|"replace", "path": ..., "value": ...}
+            operations (empty if the documents are equal)
+        """
+        if old is new:
+            return []
+        
+        if not (isinstance(old, dict) and isinstance(new, dict)):
+            if _json_equal(old, new):
+                return []
+            return [{"op": "replace", "path": path, "value": new}]
+        
+        operations = []
+        for key, old_value in old.items():
+            pointer = f"{path}/{_escape_pointer(key)}"
+            if key not in new:
+                operations.append({"op": "remove", "path": pointer})
+            else:
+                operations.extend(self.diff(old_value, new[key], pointer))
+        
+        for key, new_value in new.items():
+            if key not in old:
+                operations.append({"op": "add", "path": f"{path}/{_escape_pointer(key)}", "value": new_value})
+        
+        return operations
     
     def _create_settings_backup(self) -> Path:
         """
@@ -476,7 +849,11 @@ class SettingsManager:
                 self._create_settings_backup()
             
             # Restore backup
-            shutil.copy2(backup_file, self.settings_file)
+            with self.settings_lock():
+                shutil.copy2(backup_file, self.settings_file)
+                document = _get_document(self.settings_file)
+                document.data = None  # Force re-read; pending changes are discarded
+                document.dirty = False
             return True
             
         except (json.JSONDecodeError, IOError):
@@ -0,0 +1,271 @@
+"""
+Transactional staging for SuperClaude installations and updates
+
+New files are materialized under a staging directory next to the installed
+files and switched into place with atomic renames once every component has
+finished. The previous version of each file is kept as a hard link so a
+failed switch is rolled back by renaming, never by copying.
+
+Each file is replaced atomically, but the tree as a whole is not: the
+install directory (~/.claude) is shared with Claude Code's own files, so it
+cannot be swapped for a staged copy with one directory rename. A reader
+running during the commit may see some files already new and others still
+old; the window is one rename per file, and an interrupted commit is rolled
+back by recover().
+"""
+
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set, Tuple, Iterator
+from pathlib import Path
+from datetime import datetime
+
+from .file_manager import atomic_write_json
+from ..utils.process import pid_alive
+
+
+class StagedInstall:
+    """
+    Stages component files and commits them to the install directory
+
+    Every file is switched with its own atomic rename and the commit as a
+    whole is all-or-nothing (rolled back on failure), but it is not one
+    atomic tree switch: concurrent readers can observe a mix of old and new
+    files while it runs.
+    """
+
+    STAGING_DIR = ".superclaude-staging"
+    JOURNAL_NAME = "commit.json"
+
+    def __init__(self, install_dir: Path, txn_name: Optional[str] = None):
+        """
+        Initialize staging transaction
+
+        Args:
+            install_dir: Installation directory the staged files belong to
+            txn_name: Reuse the staging directory of an interrupted run
+                      (see recover(keep=...)) instead of starting a new one
+        """
+        self.install_dir = install_dir
+        self.staging_root = install_dir / self.STAGING_DIR
+        txn_name = txn_name or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self.txn_dir = self.staging_root / txn_name
+        self.new_dir = self.txn_dir / "new"
+        self.old_dir = self.txn_dir / "old"
+
+        # target path -> (staged path, owning component)
+        self.staged: Dict[Path, Tuple[Path, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._owner = threading.local()
+
+    @contextmanager
+    def owned_by(self, component_name: str) -> Iterator[None]:
+        """
+        Attribute files staged by the current thread to a component
+
+        Args:
+            component_name: Name of component being installed
+        """
+        previous = getattr(self._owner, "name", None)
+        self._owner.name = component_name
+        try:
+            yield
+        finally:
+            self._owner.name = previous
+
+    def _relative(self, target: Path) -> Path:
+        """Get target path relative to the install directory"""
+        try:
+            return target.relative_to(self.install_dir)
+        except ValueError:
+            raise ValueError(f"Cannot stage file outside installation directory: {target}")
+
+    def stage_path(self, target: Path) -> Path:
+        """
+        Reserve a staging location for a target file
+
+        Args:
+            target: Final installed file path
+
+        Returns:
+            Path inside the staging directory to write the new content to
+        """
+        staged_path = self.new_dir / self._relative(target)
+        staged_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            self.staged[target] = (staged_path, getattr(self._owner, "name", None))
+
+        return staged_path
+
+    def is_staged(self, target: Path) -> bool:
+        """Check whether a target has a staged replacement"""
+        with self._lock:
+            return target in self.staged
+
+    def commit(self, owners: Optional[Set[str]] = None) -> bool:
+        """
+        Switch staged files into the install directory
+
+        Each existing target is hard linked into the transaction's old/
+        directory and then atomically replaced, so readers always see either
+        the previous or the new version of a file - though not necessarily
+        the same version of every file until the loop finishes. If any
+        replace fails, every file already switched is renamed back.
+
+        Args:
+            owners: Only commit files staged by these components
+                    (None commits everything)
+
+        Returns:
+            True if all files were switched, False if the commit was rolled back
+        """
+        with self._lock:
+            entries = sorted(
+                (target, staged_path)
+                for target, (staged_path, owner) in self.staged.items()
+                if owners is None or owner is None or owner in owners
+            )
+
+        if not entries:
+            return True
+
+        # Journal first so an interrupted commit can be rolled back later
+        journal = [
+            {"path": self._relative(target).as_posix(), "existed": target.exists()}
+            for target, _ in entries
+        ]
+        atomic_write_json(self.txn_dir / self.JOURNAL_NAME, {"files": journal})
+
+        switched: List[Tuple[Path, bool]] = []
+        try:
+            for (target, staged_path), entry in zip(entries, journal):
+                if entry["existed"]:
+                    old_path = self.old_dir / entry["path"]
+                    old_path.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        os.link(target, old_path)
+                    except OSError:
+                        # No hard links on this filesystem - move the old file aside
+                        os.replace(target, old_path)
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staged_path, target)
+                switched.append((target, entry["existed"]))
+        except Exception as e:
+            print(f"Error committing staged files: {e}")
+            self._rollback(switched)
+            self._clear_journal()
+            return False
+
+        # Commit is complete - nothing left for recover() to undo
+        self._clear_journal()
+        return True
+
+    def _clear_journal(self) -> None:
+        """Remove the commit journal"""
+        try:
+            (self.txn_dir / self.JOURNAL_NAME).unlink()
+        except OSError:
+            pass
+
+    def _rollback(self, switched: List[Tuple[Path, bool]]) -> None:
+        """
+        Restore previous files for targets already switched
+
+        Args:
+            switched: (target, existed_before) pairs in commit order
+        """
+        for target, existed in reversed(switched):
+            try:
+                if existed:
+                    os.replace(self.old_dir / self._relative(target), target)
+                elif target.exists():
+                    target.unlink()
+            except Exception as e:
+                print(f"Warning: Could not roll back {target}: {e}")
+
+    def cleanup(self) -> None:
+        """Remove this transaction's staging directory"""
+        shutil.rmtree(self.txn_dir, ignore_errors=True)
+        try:
+            self.staging_root.rmdir()
+        except OSError:
+            pass  # Other transactions still present
+
+        with self._lock:
+            self.staged.clear()
+
+    @staticmethod
+    def _owner_pid(txn_name: str) -> int:
+        """Get the id of the process that created a transaction (0 if unknown)"""
+        try:
+            return int(txn_name.rsplit("_", 1)[1])
+        except (IndexError, ValueError):
+            return 0
+
+    @classmethod
+    def recover(cls, install_dir: Path, keep: Optional[str] = None) -> int:
+        """
+        Roll back commits interrupted by a crash and drop abandoned staging trees
+
+        Transactions whose creating process is still running belong to a
+        concurrent install and are left alone.
+
+        Args:
+            install_dir: Installation directory
+            keep: Transaction to leave in place for a resumed run, provided it
+                  never started committing
+
+        Returns:
+            Number of interrupted transactions rolled back
+        """
+        staging_root = install_dir / cls.STAGING_DIR
+        if not staging_root.is_dir():
+            return 0
+
+        recovered = 0
+        for txn_dir in staging_root.iterdir():
+            if not txn_dir.is_dir():
+                continue
+
+            # Another install into this directory is still running this transaction
+            if pid_alive(cls._owner_pid(txn_dir.name)):
+                continue
+
+            journal_file = txn_dir / cls.JOURNAL_NAME
+            if txn_dir.name == keep and not journal_file.exists():
+                continue
+            if journal_file.exists():
+                try:
+                    with open(journal_file, 'r', encoding='utf-8') as f:
+                        journal = json.load(f).get("files", [])
+                except (json.JSONDecodeError, IOError):
+                    journal = []
+
+                for entry in reversed(journal):
+                    target = install_dir / entry["path"]
+                    old_path = txn_dir / "old" / entry["path"]
+                    staged_path = txn_dir / "new" / entry["path"]
+                    try:
+                        if entry.get("existed"):
+                            if old_path.exists():
+                                os.replace(old_path, target)
+                        elif not staged_path.exists() and target.exists():
+                            # New file already switched in - undo it
+                            target.unlink()
+                    except Exception as e:
+                        print(f"Warning: Could not recover {target}: {e}")
+                recovered += 1
+
+            shutil.rmtree(txn_dir, ignore_errors=True)
+
+        try:
+            staging_root.rmdir()
+        except OSError:
+            pass
+
+        return recovered
@@ -2,13 +2,14 @@
 System validation for SuperClaude installation requirements
 """
 
-import subprocess
 import sys
 import shutil
 from typing import Tuple, List, Dict, Any, Optional
 from pathlib import Path
 import re
 
+from .probe import ProbeEngine, get_probe_engine
+
 # Handle packaging import - if not available, use a simple version comparison
 try:
     from packaging import version
@@ -53,9 +54,36 @@ except ImportError:
 class Validator:
     """System requirements validator"""
     
-    def __init__(self):
-        """Initialize validator"""
+    NODE_PROBE = ("node", "--version")
+    CLAUDE_PROBE = ("claude", "--version")
+    
+    def __init__(self, probes: Optional[ProbeEngine] = None):
+        """
+        Initialize validator
+        
+        Args:
+            probes: Probe engine running tool commands (shared engine if None)
+        """
         self.validation_cache: Dict[str, Any] = {}
+        self.probes = probes or get_probe_engine()
+    
+    def prefetch(self, commands: List[Tuple[str, ...]]) -> None:
+        """
+        Run tool probes concurrently so later checks read memoized results
+        
+        Args:
+            commands: Probe commands as argument tuples
+        """
+        self.probes.run(commands)
+    
+    def _requirement_probes(self, requirements: Dict[str, Any]) -> List[Tuple[str, ...]]:
+        """Collect every probe command a requirements dict will need"""
+        commands = []
+        if "node" in requirements:
+            commands.append(self.NODE_PROBE)
+        for tool_req in requirements.get("external_tools", {}).values():
+            commands.append(tuple(tool_req["command"].split()))
+        return commands
     
     def check_python(self, min_version: str = "3.8", max_version: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -114,23 +142,21 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if node is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            probe = self.probes.probe(self.NODE_PROBE)
+            
+            if probe.timed_out:
+                result_tuple = (False, "Node.js version check timed out")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
             
-            if result.returncode != 0:
+            if not probe.ok:
                 help_msg = self.get_installation_help("node")
                 result_tuple = (False, f"Node.js not found in PATH{help_msg}")
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
             
             # Parse version (format: v18.17.0)
-            version_output = result.stdout.strip()
+            version_output = probe.stdout.strip()
             if version_output.startswith('v'):
                 current_version = version_output[1:]
             else:
@@ -153,15 +179,6 @@ class Validator:
             self.validation_cache[cache_key] = result_tuple
             return result_tuple
             
-        except subprocess.TimeoutExpired:
-            result_tuple = (False, "Node.js version check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
-        except FileNotFoundError:
-            help_msg = self.get_installation_help("node")
-            result_tuple = (False, f"Node.js not found in PATH{help_msg}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
         except Exception as e:
             result_tuple = (False, f"Could not check Node.js version: {e}")
             self.validation_cache[cache_key] = result_tuple
@@ -182,23 +199,21 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if claude is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['claude', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            probe = self.probes.probe(self.CLAUDE_PROBE)
             
-            if result.returncode != 0:
+            if probe.timed_out:
+                result_tuple = (False, "Claude CLI version check timed out")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
+            
+            if not probe.ok:
                 help_msg = self.get_installation_help("claude_cli")
                 result_tuple = (False, f"Claude CLI not found in PATH{help_msg}")
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
             
             # Parse version from output
-            version_output = result.stdout.strip()
+            version_output = probe.stdout.strip()
             version_match = re.search(r'(\d+\.\d+\.\d+)', version_output)
             
             if not version_match:
@@ -218,15 +233,6 @@ class Validator:
             self.validation_cache[cache_key] = result_tuple
             return result_tuple
             
-        except subprocess.TimeoutExpired:
-            result_tuple = (False, "Claude CLI version check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
-        except FileNotFoundError:
-            help_msg = self.get_installation_help("claude_cli")
-            result_tuple = (False, f"Claude CLI not found in PATH{help_msg}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
         except Exception as e:
             result_tuple = (False, f"Could not check Claude CLI: {e}")
             self.validation_cache[cache_key] = result_tuple
@@ -249,25 +255,26 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Split command into parts
-            cmd_parts = command.split()
-            
-            result = subprocess.run(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            probe = self.probes.probe(command.split())
+            
+            if probe.timed_out:
+                result_tuple = (False, f"{tool_name} check timed out")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
             
-            if result.returncode != 0:
+            if not probe.found:
+                result_tuple = (False, f"{tool_name} not found in PATH")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
+            
+            if not probe.ok:
                 result_tuple = (False, f"{tool_name} not found or command failed")
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
             
             # Extract version if min_version specified
             if min_version:
-                version_output = result.stdout + result.stderr
+                version_output = probe.output
                 version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', version_output)
                 
                 if version_match:
@@ -290,14 +297,6 @@ class Validator:
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
                 
-        except subprocess.TimeoutExpired:
-            result_tuple = (False, f"{tool_name} check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
-        except FileNotFoundError:
-            result_tuple = (False, f"{tool_name} not found in PATH")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
         except Exception as e:
             result_tuple = (False, f"Could not check {tool_name}: {e}")
             self.validation_cache[cache_key] = result_tuple
@@ -384,6 +383,9 @@ class Validator:
         """
         errors = []
         
+        # Start every tool probe at once; the checks below read the results
+        self.prefetch(self._requirement_probes(requirements))
+        
         # Check Python requirements
         if "python" in requirements:
             python_req = requirements["python"]
@@ -490,6 +492,8 @@ class Validator:
             "python_executable": sys.executable
         }
         
+        self.prefetch([self.NODE_PROBE, self.CLAUDE_PROBE])
+        
         # Add Node.js info if available
         node_success, node_msg = self.check_node()
         info["node_available"] = node_success
@@ -589,6 +593,8 @@ class Validator:
             "recommendations": []
         }
         
+        self.prefetch([self.NODE_PROBE, self.CLAUDE_PROBE])
+        
         # Check Python
         python_success, python_msg = self.check_python()
         diagnostics["checks"]["python"] = {
@@ -647,21 +653,7 @@ class Validator:
         ]
         
         for tool_alternatives, display_name in tool_checks:
-            tool_found = False
-            for tool in tool_alternatives:
-                try:
-                    result = subprocess.run(
-                        ["which" if sys.platform != "win32" else "where", tool],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=(sys.platform == "win32")
-                    )
-                    if result.returncode == 0:
-                        tool_found = True
-                        break
-                except Exception:
-                    continue
+            tool_found = any(shutil.which(tool) for tool in tool_alternatives)
             
             if not tool_found:
                 # Only report as missing if none of the alternatives were found
@@ -681,5 +673,6 @@ class Validator:
             )
     
     def clear_cache(self) -> None:
-        """Clear validation cache"""
-        self.validation_cache.clear()
\ No newline at end of file
+        """Clear validation cache and memoized probe results"""
+        self.validation_cache.clear()
+        self.probes.clear()
\ No newline at end of file
@@ -13,10 +13,11 @@ Available operations:
 - update: Update existing SuperClaude installation
 - uninstall: Remove SuperClaude framework installation  
 - backup: Backup and restore SuperClaude installations
+- mcp-bench: Measure MCP server cold-start latency (module mcp_bench)
 """
 
 __version__ = "3.0.0"
-__all__ = ["install", "update", "uninstall", "backup"]
+__all__ = ["install", "update", "uninstall", "backup", "mcp_bench"]
 
 
 def get_operation_info():
@@ -41,6 +42,11 @@ def get_operation_info():
             "name": "backup",
             "description": "Backup and restore SuperClaude installations",
             "module": "setup.operations.backup"
+        },
+        "mcp-bench": {
+            "name": "mcp-bench",
+            "description": "Measure MCP server cold-start latency",
+            "module": "setup.operations.mcp_bench"
         }
     }
 
@@ -5,15 +5,18 @@ Refactored from backup.py for unified CLI hub
 
 import sys
 import time
-import tarfile
 import json
+import fnmatch
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
 from ..core.settings_manager import SettingsManager
 from ..core.file_manager import FileManager
+from ..core.backup_manager import BackupManager
+from ..core.backup_store import BackupStore
+from ..utils.compression import available_codecs
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
@@ -44,8 +47,10 @@ Examples:
   SuperClaude.py backup --list --verbose       # List available backups (verbose)
   SuperClaude.py backup --restore              # Interactive restore
   SuperClaude.py backup --restore backup.tar.gz  # Restore specific backup
+  SuperClaude.py backup --restore backup.tar --path settings.json --overwrite  # Restore one file
   SuperClaude.py backup --info backup.tar.gz   # Show backup information
   SuperClaude.py backup --cleanup --force      # Clean up old backups (forced)
+  SuperClaude.py backup --reindex              # Index archives from older versions
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -85,6 +90,12 @@ Examples:
         help="Clean up old backup files"
     )
     
+    operation_group.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Build index files for archives without one (all archives with --force)"
+    )
+    
     # Backup options
     parser.add_argument(
         "--backup-dir",
@@ -98,14 +109,41 @@ Examples:
         help="Custom backup name (for --create)"
     )
     
+    parser.add_argument(
+        "--format",
+        choices=["snapshot", "tar"],
+        default="snapshot",
+        help="Backup format: deduplicated snapshot or standalone tar archive (default: snapshot)"
+    )
+    
     parser.add_argument(
         "--compress",
-        choices=["none", "gzip", "bzip2"],
+        choices=available_codecs(),
         default="gzip",
-        help="Compression method (default: gzip)"
+        help="Compression method for tar backups (default: gzip)"
+    )
+    
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        help="Compression level (default depends on method, e.g. gzip 9, xz 6, zstd 3)"
+    )
+    
+    parser.add_argument(
+        "--compress-threads",
+        type=int,
+        default=1,
+        help="Compression threads for gzip/zstd tar backups (default: 1)"
     )
     
     # Restore options
+    parser.add_argument(
+        "--path",
+        type=str,
+        nargs="+",
+        help="Only restore archive paths matching these globs (for --restore)"
+    )
+    
     parser.add_argument(
         "--overwrite",
         action="store_true",
@@ -139,7 +177,10 @@ def get_backup_directory(args: argparse.Namespace) -> Path:
 
 def check_installation_exists(install_dir: Path) -> bool:
     """Check if SuperClaude installation exists"""
-    return install_dir.exists() and (install_dir / "settings.json").exists()
+    return install_dir.exists() and (
+        (install_dir / "settings.json").exists()
+        or (install_dir / ".superclaude-metadata.json").exists()
+    )
 
 
 def get_backup_info(backup_path: Path) -> Dict[str, Any]:
@@ -155,33 +196,46 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     if not backup_path.exists():
         return info
     
+    if BackupStore.is_snapshot(backup_path):
+        info["type"] = "snapshot"
+        try:
+            info.update(BackupStore(backup_path.parent.parent).snapshot_info(backup_path))
+        except Exception as e:
+            info["error"] = str(e)
+        return info
+    
+    info["type"] = "tar"
+    
     try:
         # Get file stats
         stats = backup_path.stat()
         info["size"] = stats.st_size
         info["created"] = datetime.fromtimestamp(stats.st_mtime)
         
-        # Try to read metadata from backup
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
-        
-        with tarfile.open(backup_path, mode) as tar:
-            # Look for metadata file
+        # Index sidecar answers everything without decompressing the archive
+        index = BackupManager.load_index(backup_path)
+        if index is not None:
+            info["files"] = index["files"]
+            info["metadata"] = index.get("metadata", {})
             try:
-                metadata_member = tar.getmember("backup_metadata.json")
-                metadata_file = tar.extractfile(metadata_member)
-                if metadata_file:
-                    info["metadata"] = json.loads(metadata_file.read().decode())
-            except KeyError:
-                pass  # No metadata file
-            
-            # Get list of files in backup
-            info["files"] = len(tar.getnames())
-            
+                info["created"] = datetime.fromisoformat(index["created"])
+            except (KeyError, ValueError):
+                pass
+            return info
+        
+        # Legacy archive without index - scan it once (codec detected from magic bytes)
+        files = 0
+        with BackupManager.open_tar_stream(backup_path) as tar:
+            for member in tar:
+                files += 1
+                if member.name == BackupManager.METADATA_NAME:
+                    metadata_file = tar.extractfile(member)
+                    if metadata_file:
+                        info["metadata"] = json.loads(metadata_file.read().decode())
+        
+        # Get number of files in backup
+        info["files"] = files
+        
     except Exception as e:
         info["error"] = str(e)
     
@@ -197,16 +251,38 @@ def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
     
     # Find all backup files
     for backup_file in backup_dir.glob("*.tar*"):
-        if backup_file.is_file():
+        if backup_file.is_file() and BackupManager.is_archive(backup_file):
             info = get_backup_info(backup_file)
             backups.append(info)
     
+    # Snapshots in the deduplicating store
+    for snapshot_file in BackupStore(backup_dir).list_snapshots():
+        backups.append(get_backup_info(snapshot_file))
+    
     # Sort by creation date (newest first)
-    backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
+    backups.sort(key=lambda x: x.get("created") or datetime.min, reverse=True)
     
     return backups
 
 
+def resolve_backup_path(name: str, backup_dir: Path) -> Path:
+    """Resolve a backup argument to an archive file or snapshot manifest"""
+    backup_path = Path(name)
+    if backup_path.is_absolute():
+        return backup_path
+    
+    candidate = backup_dir / backup_path
+    if candidate.exists():
+        return candidate
+    
+    # Snapshots can be referred to by name
+    snapshot_path = BackupStore(backup_dir).snapshot_path(backup_path.name.replace(".json", ""))
+    if snapshot_path.exists():
+        return snapshot_path
+    
+    return candidate
+
+
 def display_backup_list(backups: List[Dict[str, Any]]) -> None:
     """Display list of available backups"""
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}Available Backups{Colors.RESET}")
@@ -271,7 +347,6 @@ def create_backup(args: argparse.Namespace) -> bool:
         
         # Setup backup directory
         backup_dir = get_backup_directory(args)
-        backup_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate backup filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -280,49 +355,37 @@ def create_backup(args: argparse.Namespace) -> bool:
         else:
             backup_name = f"superclaude_backup_{timestamp}"
         
-        # Determine compression
-        if args.compress == "gzip":
-            backup_file = backup_dir / f"{backup_name}.tar.gz"
-            mode = "w:gz"
-        elif args.compress == "bzip2":
-            backup_file = backup_dir / f"{backup_name}.tar.bz2"
-            mode = "w:bz2"
-        else:
-            backup_file = backup_dir / f"{backup_name}.tar"
-            mode = "w"
-        
-        logger.info(f"Creating backup: {backup_file}")
+        logger.info(f"Creating backup: {backup_dir / backup_name}")
         
         # Create metadata
         metadata = create_backup_metadata(args.install_dir)
         
-        # Create backup
+        # Stream installation directory contents into the archive
         start_time = time.time()
         
-        with tarfile.open(backup_file, mode) as tar:
-            # Add metadata file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
+        def report_progress(files_added: int) -> None:
+            if files_added % 10 == 0:
+                logger.debug(f"Added {files_added} files to backup")
+        
+        if args.format == "snapshot":
+            store = BackupStore(backup_dir)
+            backup_file, stats = store.create_snapshot(
+                args.install_dir, backup_name, metadata=metadata, progress=report_progress
+            )
+            
+            duration = time.time() - start_time
             
-            # Add installation directory contents
-            files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
-                    try:
-                        # Create relative path for archive
-                        rel_path = item.relative_to(args.install_dir)
-                        tar.add(item, arcname=str(rel_path))
-                        files_added += 1
-                        
-                        if files_added % 10 == 0:
-                            logger.debug(f"Added {files_added} files to backup")
-                            
-                    except Exception as e:
-                        logger.warning(f"Could not add {item} to backup: {e}")
+            logger.success(f"Snapshot created successfully in {duration:.1f} seconds")
+            logger.info(f"Snapshot: {backup_file}")
+            logger.info(f"Files archived: {stats['files']} ({stats['hashed']} read, {stats['stored']} new)")
+            logger.info(f"New data stored: {format_size(stats['stored_bytes'])}")
+            return True
+        
+        backup_manager = BackupManager(args.install_dir, backup_dir)
+        backup_file, files_added = backup_manager.create_archive(
+            backup_name, args.compress, metadata=metadata, progress=report_progress,
+            level=args.compress_level, threads=args.compress_threads
+        )
         
         duration = time.time() - start_time
         file_size = backup_file.stat().st_size
@@ -356,49 +419,51 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
         
         logger.info(f"Restoring from backup: {backup_path}")
         
-        # Determine compression
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
+        # Limit restore to members matching --path globs
+        patterns = getattr(args, "path", None)
+        select = None
+        if patterns:
+            logger.info(f"Restoring only paths matching: {', '.join(patterns)}")
+            
+            def select(name: str) -> bool:
+                return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
         
-        # Create backup of current installation if it exists
-        if check_installation_exists(args.install_dir) and not args.dry_run:
-            logger.info("Creating backup of current installation before restore")
-            # This would call create_backup internally
+        if args.dry_run:
+            logger.info(f"[DRY RUN] Would restore files from {backup_path.name}")
+            return True
+        
+        def report_progress(files_restored: int) -> None:
+            if files_restored % 10 == 0:
+                logger.debug(f"Restored {files_restored} files")
         
-        # Extract backup
         start_time = time.time()
-        files_restored = 0
         
-        with tarfile.open(backup_path, mode) as tar:
-            # Extract all files except metadata
-            for member in tar.getmembers():
-                if member.name == "backup_metadata.json":
-                    continue
-                
-                try:
-                    target_path = args.install_dir / member.name
-                    
-                    # Check if file exists and overwrite flag
-                    if target_path.exists() and not args.overwrite:
-                        logger.warning(f"Skipping existing file: {target_path}")
-                        continue
-                    
-                    # Extract file
-                    tar.extract(member, args.install_dir)
-                    files_restored += 1
-                    
-                    if files_restored % 10 == 0:
-                        logger.debug(f"Restored {files_restored} files")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not restore {member.name}: {e}")
+        if info["type"] == "snapshot":
+            store = BackupStore(backup_path.parent.parent)
+            files_restored, warnings, errors = store.restore_snapshot(
+                backup_path, args.install_dir, overwrite=args.overwrite, select=select
+            )
+            if errors:
+                for warning in warnings:
+                    logger.warning(warning)
+                for error in errors:
+                    logger.error(error)
+                logger.error(f"Restore incomplete: {len(errors)} file(s) could not be restored ({files_restored} restored)")
+                return False
+        else:
+            backup_manager = BackupManager(args.install_dir, backup_path.parent)
+            files_restored, warnings = backup_manager.extract_members(
+                backup_path, overwrite=args.overwrite, select=select, progress=report_progress
+            )
+        
+        for warning in warnings:
+            logger.warning(warning)
         
         duration = time.time() - start_time
         
+        if patterns and files_restored == 0 and not warnings:
+            logger.warning("No files in the backup matched the given --path patterns")
+        
         logger.success(f"Restore completed successfully in {duration:.1f} seconds")
         logger.info(f"Files restored: {files_restored}")
         
@@ -456,7 +521,7 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         # Keep only N most recent
         if args.keep and len(backups) > args.keep:
             # Sort by date and take oldest ones to remove
-            backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
+            backups.sort(key=lambda x: x.get("created") or datetime.min, reverse=True)
             to_remove.extend(backups[args.keep:])
         
         # Remove duplicates
@@ -471,10 +536,17 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         for backup in to_remove:
             try:
                 backup["path"].unlink()
+                if backup.get("type") == "tar":
+                    BackupManager.index_path(backup["path"]).unlink(missing_ok=True)
                 logger.info(f"Removed backup: {backup['path'].name}")
             except Exception as e:
                 logger.warning(f"Could not remove {backup['path'].name}: {e}")
         
+        # Reclaim store objects no remaining snapshot references
+        removed, freed = BackupStore(backup_dir).gc()
+        if removed:
+            logger.info(f"Removed {removed} unreferenced objects ({format_size(freed)})")
+        
         return True
         
     except Exception as e:
@@ -482,6 +554,38 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         return False
 
 
+def reindex_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
+    """Build index sidecars for archives created before indexes existed"""
+    logger = get_logger()
+    
+    if not backup_dir.exists():
+        logger.info("No backups found to index")
+        return True
+    
+    indexed = 0
+    failed = 0
+    for backup_file in sorted(backup_dir.glob("*.tar*")):
+        if not backup_file.is_file() or not BackupManager.is_archive(backup_file):
+            continue
+        if not args.force and BackupManager.load_index(backup_file) is not None:
+            continue
+        
+        if args.dry_run:
+            logger.info(f"[DRY RUN] Would index {backup_file.name}")
+            continue
+        
+        try:
+            BackupManager.build_index(backup_file)
+            indexed += 1
+            logger.info(f"Indexed {backup_file.name}")
+        except Exception as e:
+            failed += 1
+            logger.warning(f"Could not index {backup_file.name}: {e}")
+    
+    logger.info(f"Indexed {indexed} archives")
+    return failed == 0
+
+
 def run(args: argparse.Namespace) -> int:
     """Execute backup operation with parsed arguments"""
     operation = BackupOperation()
@@ -523,17 +627,13 @@ def run(args: argparse.Namespace) -> int:
                     logger.info("Restore cancelled by user")
                     return 0
             else:
-                # Specific backup file
-                backup_path = Path(args.restore)
-                if not backup_path.is_absolute():
-                    backup_path = backup_dir / backup_path
+                # Specific backup file or snapshot name
+                backup_path = resolve_backup_path(args.restore, backup_dir)
             
             success = restore_backup(backup_path, args)
             
         elif args.info:
-            backup_path = Path(args.info)
-            if not backup_path.is_absolute():
-                backup_path = backup_dir / backup_path
+            backup_path = resolve_backup_path(args.info, backup_dir)
             
             info = get_backup_info(backup_path)
             if info["exists"]:
@@ -557,6 +657,9 @@ def run(args: argparse.Namespace) -> int:
             
         elif args.cleanup:
             success = cleanup_old_backups(backup_dir, args)
+            
+        elif args.reindex:
+            success = reindex_backups(backup_dir, args)
         
         else:
             logger.error("No backup operation specified")
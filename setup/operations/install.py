@@ -4,7 +4,13 @@ Refactored from install.py for unified CLI hub
 """
 
 import sys
+import os
+import io
+import glob
+import contextlib
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import argparse
@@ -13,11 +19,14 @@ from ..base.installer import Installer
 from ..core.registry import ComponentRegistry
 from ..core.config_manager import ConfigManager
 from ..core.validator import Validator
+from ..core.probe import ProbeCache, get_probe_engine
+from ..core.manifest import source_digest
+from ..core.journal import InstallJournal
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors, format_size
+    display_warning, display_table, Menu, confirm, ProgressBar, Colors, format_size
 )
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, LogLevel
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
@@ -44,6 +53,7 @@ Examples:
   SuperClaude.py install --profile developer      # Developer profile  
   SuperClaude.py install --components core mcp    # Specific components
   SuperClaude.py install --verbose --force        # Verbose with force mode
+  SuperClaude.py install --resume --yes           # Finish an interrupted installation
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -82,6 +92,89 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Copy every file even if the installed copy is unchanged"
+    )
+    
+    parser.add_argument(
+        "--no-staging",
+        action="store_true",
+        help="Write files directly into the install directory instead of staging and swapping"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted installation from its journal, skipping steps it already finished"
+    )
+    
+    parser.add_argument(
+        "--copy-mode",
+        choices=["auto", "hardlink", "plain"],
+        default="auto",
+        help="How to copy framework files: reflink/in-kernel copy when possible, hard links to the source (files must not be edited in place), or a plain byte copy (default: auto)"
+    )
+    
+    parser.add_argument(
+        "--store-dir",
+        type=Path,
+        help="Link framework and command files to a shared read-only store (e.g. /opt/superclaude) instead of copying them"
+    )
+    
+    parser.add_argument(
+        "--no-probe-cache",
+        action="store_true",
+        help="Re-run tool version probes instead of reusing cached results"
+    )
+    
+    parser.add_argument(
+        "--mcp-backend",
+        choices=["cli", "config"],
+        default="cli",
+        help="Register MCP servers one at a time with the claude CLI, or write them all straight into ~/.claude.json in one batch (default: cli)"
+    )
+    
+    parser.add_argument(
+        "--mcp-prefetch",
+        action="store_true",
+        help="Download MCP server packages into the npm cache during install"
+    )
+    
+    parser.add_argument(
+        "--npm-cache",
+        type=Path,
+        help="npm cache directory for pre-fetched MCP packages (also used by the servers at runtime)"
+    )
+    
+    parser.add_argument(
+        "--mcp-package-dir",
+        type=Path,
+        help="Install MCP servers offline from npm tarballs in this directory (implies --mcp-prefetch)"
+    )
+    
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Maximum number of components to install, or MCP packages to pre-fetch, in parallel (default: 4, 1 = serial)"
+    )
+    
+    parser.add_argument(
+        "--targets",
+        type=str,
+        nargs="+",
+        metavar="FILE_OR_GLOB",
+        help="Install into many directories in one run: files listing one install directory per line, or glob patterns (replaces --install-dir; excludes mcp)"
+    )
+    
+    parser.add_argument(
+        "--target-jobs",
+        type=int,
+        help="Worker processes for --targets (default: CPU count, at most one per target)"
+    )
+    
     parser.add_argument(
         "--list-components",
         action="store_true",
@@ -139,6 +232,13 @@ def get_components_to_install(args: argparse.Namespace, registry: ComponentRegis
     if args.components:
         return args.components
     
+    # Resuming: the components the interrupted run was installing
+    if args.resume and not args.targets:
+        journal = InstallJournal(args.install_dir)
+        if journal.load() and journal.components:
+            logger.info(f"Resuming installation of: {', '.join(journal.components)}")
+            return journal.components
+    
     # Profile-based selection
     if args.profile:
         try:
@@ -336,7 +436,7 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
     
     try:
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        installer = Installer(args.install_dir, dry_run=args.dry_run, max_workers=args.jobs)
         
         # Create component registry
         registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
@@ -365,11 +465,7 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         # Install components
         logger.info(f"Installing {len(ordered_components)} components...")
         
-        config = {
-            "force": args.force,
-            "backup": not args.no_backup,
-            "dry_run": args.dry_run
-        }
+        config = get_install_config(args)
         
         success = installer.install_components(ordered_components, config)
         
@@ -403,6 +499,11 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
             summary = installer.get_installation_summary()
             if summary['failed']:
                 logger.error(f"Failed components: {', '.join(summary['failed'])}")
+            if summary['skipped']:
+                logger.warning(f"Skipped components: {', '.join(summary['skipped'])}")
+            for component_name, errors in summary['errors'].items():
+                for error in errors:
+                    logger.error(f"  {component_name}: {error}")
         
         return success
         
@@ -411,6 +512,199 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         return False
 
 
+def get_install_config(args: argparse.Namespace) -> Dict[str, Any]:
+    """Build the installer configuration from parsed arguments"""
+    return {
+        "force": args.force,
+        "backup": not args.no_backup,
+        "dry_run": args.dry_run,
+        "incremental": not args.no_incremental,
+        "staged": not args.no_staging,
+        "resume": args.resume,
+        "copy_mode": args.copy_mode,
+        "store_dir": args.store_dir,
+        "mcp_backend": args.mcp_backend,
+        "mcp_prefetch": args.mcp_prefetch,
+        "npm_cache": args.npm_cache,
+        "mcp_package_dir": args.mcp_package_dir,
+        "jobs": args.jobs
+    }
+
+
+def resolve_targets(specs: List[str]) -> List[Path]:
+    """
+    Expand --targets arguments into install directories
+    
+    Args:
+        specs: Files listing one directory per line (# starts a comment),
+               glob patterns, or plain directory paths
+            
+    Returns:
+        Absolute install directories, in order, without duplicates
+    """
+    targets: List[Path] = []
+    
+    for spec in specs:
+        spec_path = Path(spec).expanduser()
+        if spec_path.is_file():
+            with open(spec_path, 'r', encoding='utf-8') as f:
+                entries = [line.split("#", 1)[0].strip() for line in f]
+            paths = [Path(entry).expanduser() for entry in entries if entry]
+        elif any(char in spec for char in "*?["):
+            paths = [Path(match) for match in sorted(glob.glob(str(spec_path))) if Path(match).is_dir()]
+        else:
+            paths = [spec_path]
+        
+        for path in paths:
+            path = path.absolute()
+            if path not in targets:
+                targets.append(path)
+    
+    return targets
+
+
+def install_target(install_dir: Path, components: List[str], args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Install components into one directory of a --targets run
+    
+    Runs in a worker process. Console output is limited to errors; the
+    parent process reports the returned result.
+    
+    Args:
+        install_dir: Target installation directory
+        components: Components to install (dependencies included)
+        args: Parsed arguments shared by all targets
+        
+    Returns:
+        Dict with install_dir, success, installed, failed, errors and duration
+    """
+    start_time = time.time()
+    result = {"install_dir": str(install_dir), "success": False, "installed": [],
+              "failed": [], "errors": [], "duration": 0.0}
+    
+    logger = get_logger()
+    if logger and not args.verbose:
+        logger.set_console_level(LogLevel.ERROR)
+    
+    try:
+        target_args = argparse.Namespace(**{**vars(args), "install_dir": install_dir})
+        installer = Installer(install_dir, dry_run=args.dry_run, max_workers=args.jobs)
+        
+        # Discovery and probe results are inherited from the parent process
+        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        ordered_components = registry.resolve_dependencies(components)
+        installer.register_components(list(
+            registry.create_component_instances(ordered_components, install_dir).values()
+        ))
+        
+        # Listed targets may be new home directories
+        if not args.dry_run:
+            install_dir.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Component progress prints would interleave across workers - keep them
+        # and report them only if the target fails without a component error
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result["success"] = installer.install_components(ordered_components, get_install_config(target_args))
+        
+        summary = installer.get_installation_summary()
+        result["installed"] = sorted(summary["installed"])
+        result["failed"] = sorted(summary["failed"])
+        result["errors"] = [
+            f"{name}: {error}" for name, errors in summary["errors"].items() for error in errors
+        ]
+        if not result["success"] and not result["errors"]:
+            result["errors"] = [line.strip() for line in output.getvalue().splitlines() if line.strip()][-5:]
+        
+    except Exception as e:
+        result["errors"].append(str(e))
+    
+    result["duration"] = time.time() - start_time
+    return result
+
+
+def perform_fleet_installation(components: List[str], targets: List[Path], args: argparse.Namespace) -> bool:
+    """
+    Install the same components into many directories
+    
+    Component discovery, system probes and source file digests are done
+    once in this process; targets are then installed by a process pool
+    whose workers inherit that state (fork start method where available).
+    
+    Args:
+        components: Components to install
+        targets: Install directories
+        args: Parsed arguments
+        
+    Returns:
+        True if every target succeeded, False otherwise
+    """
+    logger = get_logger()
+    start_time = time.time()
+    
+    # Hash every source file once so no worker has to
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+    ordered_components = registry.resolve_dependencies(components)
+    for instance in registry.create_component_instances(ordered_components, targets[0]).values():
+        for source, _ in instance.get_files_to_install():
+            if source.is_file():
+                source_digest(source)
+    
+    workers = args.target_jobs or os.cpu_count() or 1
+    workers = max(1, min(workers, len(targets)))
+    logger.info(f"Installing {', '.join(ordered_components)} into {len(targets)} targets with {workers} workers...")
+    
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+    
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {
+            executor.submit(install_target, target, components, args): target
+            for target in targets
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"install_dir": str(futures[future]), "success": False, "installed": [],
+                          "failed": [], "errors": [f"Worker failed: {e}"], "duration": 0.0}
+            results.append(result)
+            
+            mark = "✓" if result["success"] else "✗"
+            logger.info(f"[{done}/{len(targets)}] {mark} {result['install_dir']} ({result['duration']:.1f}s)")
+            for error in result["errors"]:
+                logger.error(f"  {error}")
+    
+    results.sort(key=lambda result: targets.index(Path(result["install_dir"])))
+    if not args.quiet:
+        display_table(
+            ["Target", "Result", "Installed", "Failed", "Time"],
+            [
+                [
+                    result["install_dir"],
+                    "ok" if result["success"] else "FAILED",
+                    ", ".join(result["installed"]) or "-",
+                    ", ".join(result["failed"]) or "-",
+                    f"{result['duration']:.2f}s"
+                ]
+                for result in results
+            ],
+            "Fleet Installation"
+        )
+    
+    succeeded = sum(1 for result in results if result["success"])
+    duration = time.time() - start_time
+    if succeeded == len(targets):
+        logger.success(f"Installed into {succeeded}/{len(targets)} targets in {duration:.1f} seconds")
+    else:
+        logger.error(f"Installed into {succeeded}/{len(targets)} targets in {duration:.1f} seconds")
+    
+    return succeeded == len(targets)
+
+
 def run(args: argparse.Namespace) -> int:
     """Execute installation operation with parsed arguments"""
     operation = InstallOperation()
@@ -452,6 +746,11 @@ def run(args: argparse.Namespace) -> int:
                 print("No components found")
             return 0
         
+        # Reuse tool probe results from earlier runs while the tools are unchanged
+        # (a --targets run doesn't write into the invoking user's install directory)
+        if not args.no_probe_cache and not args.dry_run and not args.targets:
+            get_probe_engine().use_cache(ProbeCache.for_install_dir(args.install_dir))
+        
         # Handle diagnostic mode
         if args.diagnose:
             validator = Validator()
@@ -475,6 +774,10 @@ def run(args: argparse.Namespace) -> int:
                 logger.error(f"  - {error}")
             return 1
         
+        # features.json and the component classes describe the same components
+        for problem in registry.check_features(config_manager.load_features()):
+            logger.warning(f"Component metadata mismatch: {problem}")
+        
         # Get components to install
         components = get_components_to_install(args, registry, config_manager)
         if not components:
@@ -489,6 +792,30 @@ def run(args: argparse.Namespace) -> int:
             else:
                 logger.warning("System requirements not met, but continuing due to --force flag")
         
+        # Fleet mode: the same components into many install directories
+        if args.targets:
+            targets = resolve_targets(args.targets)
+            if not targets:
+                logger.error("No install directories matched --targets")
+                return 1
+            
+            # MCP servers are registered in the invoking user's ~/.claude.json by
+            # the claude CLI, not in a target directory: every worker would
+            # register the same servers concurrently, for the wrong user
+            if "mcp" in registry.resolve_dependencies(components):
+                logger.error("The mcp component cannot be installed with --targets: MCP servers are "
+                             "registered per user, not per install directory")
+                logger.info("Leave mcp out of the component selection and run "
+                            "'SuperClaude.py install --components mcp' as each target user")
+                return 1
+            
+            if not args.dry_run and not args.yes:
+                if not confirm(f"Install {', '.join(components)} into {len(targets)} directories?", default=True):
+                    logger.info("Installation cancelled by user")
+                    return 0
+            
+            return 0 if perform_fleet_installation(components, targets, args) else 1
+        
         # Check for existing installation
         if args.install_dir.exists() and not args.force:
             if not args.dry_run:
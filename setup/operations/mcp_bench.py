@@ -0,0 +1,194 @@
+"""
+SuperClaude MCP Benchmark Operation Module
+Measures MCP server cold-start latency and memory
+"""
+
+import sys
+import json
+import shlex
+from typing import List, Dict, Any, Optional, Tuple
+import argparse
+from pathlib import Path
+
+from ..core.mcp_bench import MCPBenchmark
+from ..core.mcp_config import MCPConfigFile
+from ..components.mcp import MCPComponent
+from ..utils.ui import display_header, display_table, display_warning, format_size, format_duration
+from ..utils.logger import get_logger
+from ..utils import mcp_stub
+from . import OperationBase
+
+
+class MCPBenchOperation(OperationBase):
+    """MCP benchmark operation implementation"""
+
+    def __init__(self):
+        super().__init__("mcp-bench")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register mcp-bench CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "mcp-bench",
+        help="Measure MCP server cold-start latency",
+        description="Start each MCP server repeatedly over stdio and time initialize and tools/list",
+        epilog="""
+Examples:
+  SuperClaude.py mcp-bench --source stub              # Offline run against the bundled stand-in server
+  SuperClaude.py mcp-bench --runs 10                  # Servers SuperClaude installs
+  SuperClaude.py mcp-bench --source installed --json  # Servers in ~/.claude.json, machine-readable
+  SuperClaude.py mcp-bench --servers context7 magic   # Only some servers
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "--source",
+        choices=["registry", "installed", "stub"],
+        default="registry",
+        help="Servers to benchmark: SuperClaude's server list, the user MCP config, or the bundled stub (default: registry)"
+    )
+
+    parser.add_argument(
+        "--servers",
+        type=str,
+        nargs="+",
+        help="Only benchmark these server names"
+    )
+
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Cold starts per server (default: 5)"
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="Seconds a single start may take before it counts as failed (default: 60)"
+    )
+
+    parser.add_argument(
+        "--stub-delay",
+        type=float,
+        default=0.0,
+        help="Startup delay the stub server simulates, in seconds"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON on stdout (log messages go to stderr)"
+    )
+
+    return parser
+
+
+def get_servers(args: argparse.Namespace) -> Dict[str, Tuple[List[str], Dict[str, str]]]:
+    """
+    Collect server command lines to benchmark
+
+    Returns:
+        Dict of server name to (argument list, extra environment)
+    """
+    servers: Dict[str, Tuple[List[str], Dict[str, str]]] = {}
+
+    if args.source == "stub":
+        command = [sys.executable, str(Path(mcp_stub.__file__).resolve())]
+        if args.stub_delay:
+            command += ["--delay", str(args.stub_delay)]
+        servers["stub"] = (command, {})
+
+    elif args.source == "installed":
+        for name, entry in MCPConfigFile().list_servers().items():
+            if "command" not in entry:
+                continue  # Remote (HTTP/SSE) servers have no process to start
+            servers[name] = ([entry["command"], *entry.get("args", [])], dict(entry.get("env", {})))
+
+    else:
+        for name, server_info in MCPComponent().mcp_servers.items():
+            command = server_info.get("command", f"npx {server_info['npm_package']}")
+            servers[name] = (shlex.split(command), {})
+
+    if args.servers:
+        servers = {name: servers[name] for name in args.servers if name in servers}
+
+    return servers
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    """Format a latency for the results table"""
+    return format_duration(value) if value is not None else "-"
+
+
+def display_results(results: Dict[str, Dict[str, Any]]) -> None:
+    """Display benchmark results as a table"""
+    rows = []
+    for name, result in results.items():
+        rows.append([
+            name,
+            f"{result['ok']}/{result['runs']}",
+            _format_seconds(result["initialize_p50"]),
+            _format_seconds(result["initialize_p95"]),
+            _format_seconds(result["tools_list_p50"]),
+            _format_seconds(result["tools_list_p95"]),
+            format_size(result["peak_rss"]) if result["peak_rss"] else "n/a",
+            str(result["tools"]) if result["tools"] is not None else "-"
+        ])
+
+    display_table(
+        ["Server", "OK", "init p50", "init p95", "tools p50", "tools p95", "Peak RSS", "Tools"],
+        rows,
+        "MCP Server Cold Start"
+    )
+
+    for name, result in results.items():
+        if result["error"]:
+            display_warning(f"{name}: {result['error']}")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute mcp-bench operation with parsed arguments"""
+    operation = MCPBenchOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        if not args.quiet and not args.json:
+            display_header(
+                "SuperClaude MCP Benchmark v3.0",
+                "Measuring MCP server cold-start latency"
+            )
+
+        if args.runs < 1:
+            logger.error("--runs must be at least 1")
+            return 1
+
+        servers = get_servers(args)
+        if not servers:
+            logger.error("No MCP servers to benchmark")
+            return 1
+
+        benchmark = MCPBenchmark(timeout=args.timeout)
+        results = {}
+        for name, (command, env) in servers.items():
+            logger.info(f"Benchmarking {name} ({args.runs} runs): {' '.join(command)}")
+            results[name] = benchmark.run(command, runs=args.runs, env=env)
+
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            display_results(results)
+
+        return 0 if all(result["ok"] for result in results.values()) else 1
+
+    except KeyboardInterrupt:
+        logger.warning("Benchmark cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("mcp-bench", e)
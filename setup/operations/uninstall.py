@@ -12,9 +12,14 @@ import argparse
 from ..core.registry import ComponentRegistry
 from ..core.settings_manager import SettingsManager
 from ..core.file_manager import FileManager
+from ..core.manifest import InstallManifest
+from ..core.journal import InstallJournal
+from ..core.staging import StagedInstall
+from ..core.probe import ProbeCache
+from ..core.framework_store import FrameworkStore
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors
+    display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ..utils.logger import get_logger
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
@@ -58,7 +63,7 @@ Examples:
     parser.add_argument(
         "--complete",
         action="store_true",
-        help="Complete uninstall (remove all files and directories)"
+        help="Complete uninstall (remove every file SuperClaude installed and its bookkeeping)"
     )
     
     # Data preservation options
@@ -74,10 +79,11 @@ Examples:
         help="Keep log files during uninstall"
     )
     
+    # Deprecated: settings.json is never removed, only SuperClaude's own files
     parser.add_argument(
         "--keep-settings",
         action="store_true",
-        help="Keep user settings during uninstall"
+        help="Deprecated, has no effect: settings.json and other files SuperClaude did not install are always kept"
     )
     
     # Safety options
@@ -93,7 +99,8 @@ Examples:
 def check_installation_exists(install_dir: Path) -> bool:
     """Check if SuperClaude is installed"""
     settings_file = install_dir / "settings.json"
-    return settings_file.exists() and install_dir.exists()
+    metadata_file = install_dir / ".superclaude-metadata.json"
+    return install_dir.exists() and (settings_file.exists() or metadata_file.exists())
 
 
 def get_installed_components(install_dir: Path) -> Dict[str, str]:
@@ -110,17 +117,30 @@ def get_installed_components(install_dir: Path) -> Dict[str, str]:
                 if version:
                     components[component_name] = version
         
+        # Components register themselves in the metadata components section
+        for component_name, component_info in settings_manager.get_installed_components().items():
+            version = component_info.get("version")
+            if version and component_name not in components:
+                components[component_name] = version
+        
         return components
     except Exception:
         return {}
 
 
 def get_installation_info(install_dir: Path) -> Dict[str, Any]:
-    """Get detailed installation information"""
+    """
+    Get detailed installation information
+    
+    File counts and sizes come from the install manifest, so this costs
+    O(installed files) no matter what else lives in the install directory.
+    """
     info = {
         "install_dir": install_dir,
         "exists": False,
+        "tracked": False,
         "components": {},
+        "component_files": {},
         "directories": [],
         "files": [],
         "total_size": 0
@@ -132,16 +152,17 @@ def get_installation_info(install_dir: Path) -> Dict[str, Any]:
     info["exists"] = True
     info["components"] = get_installed_components(install_dir)
     
-    # Scan installation directory
-    try:
-        for item in install_dir.rglob("*"):
-            if item.is_file():
-                info["files"].append(item)
-                info["total_size"] += item.stat().st_size
-            elif item.is_dir():
-                info["directories"].append(item)
-    except Exception:
-        pass
+    manifest = InstallManifest(install_dir)
+    info["tracked"] = bool(manifest.entries)
+    info["files"] = manifest.files_for()
+    info["total_size"] = manifest.size_of()
+    info["directories"] = sorted({
+        file_path.parent for file_path in info["files"] if file_path.parent != install_dir
+    })
+    info["component_files"] = {
+        component: (len(manifest.files_for(component)), manifest.size_of(component))
+        for component in info["components"]
+    }
     
     return info
 
@@ -160,13 +181,21 @@ def display_uninstall_info(info: Dict[str, Any]) -> None:
     if info["components"]:
         print(f"{Colors.BLUE}Installed Components:{Colors.RESET}")
         for component, version in info["components"].items():
-            print(f"  {component}: v{version}")
+            file_count, size = info["component_files"].get(component, (0, 0))
+            if file_count:
+                print(f"  {component}: v{version} ({file_count} files, {format_size(size)})")
+            else:
+                print(f"  {component}: v{version}")
+    
+    if not info["tracked"]:
+        print(f"{Colors.BLUE}Files:{Colors.RESET} not tracked (installed before the install manifest)")
+        print()
+        return
     
     print(f"{Colors.BLUE}Files:{Colors.RESET} {len(info['files'])}")
     print(f"{Colors.BLUE}Directories:{Colors.RESET} {len(info['directories'])}")
     
     if info["total_size"] > 0:
-        from ..utils.ui import format_size
         print(f"{Colors.BLUE}Total Size:{Colors.RESET} {format_size(info['total_size'])}")
     
     print()
@@ -202,7 +231,7 @@ def interactive_uninstall_selection(installed_components: Dict[str, str]) -> Opt
     
     # Create menu options
     preset_options = [
-        "Complete Uninstall (remove everything)",
+        "Complete Uninstall (remove all SuperClaude files)",
         "Remove Specific Components",
         "Cancel Uninstall"
     ]
@@ -246,20 +275,18 @@ def display_uninstall_plan(components: List[str], args: argparse.Namespace, info
             version = info["components"].get(component_name, "unknown")
             print(f"  {i}. {component_name} (v{version})")
     
-    # Show what will be preserved
-    preserved = []
+    # Show what will be preserved (only files SuperClaude installed are ever removed)
+    preserved = ["settings.json", "files SuperClaude did not install"]
     if args.keep_backups:
         preserved.append("backup files")
     if args.keep_logs:
         preserved.append("log files")
-    if args.keep_settings:
-        preserved.append("user settings")
     
-    if preserved:
-        print(f"{Colors.GREEN}Will preserve:{Colors.RESET} {', '.join(preserved)}")
+    print(f"{Colors.GREEN}Will preserve:{Colors.RESET} {', '.join(preserved)}")
     
     if args.complete:
-        print(f"{Colors.RED}WARNING: Complete uninstall will remove all SuperClaude files{Colors.RESET}")
+        print(f"{Colors.RED}WARNING: Complete uninstall will remove every file SuperClaude installed "
+              f"and its metadata, manifest and caches{Colors.RESET}")
     
     print()
 
@@ -322,27 +349,29 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         uninstalled_components = []
         failed_components = []
         
-        for i, component_name in enumerate(components):
-            progress.update(i, f"Uninstalling {component_name}")
+        # Metadata and settings changes from all components are written once
+        with SettingsManager(args.install_dir).session():
+            for i, component_name in enumerate(components):
+                progress.update(i, f"Uninstalling {component_name}")
             
-            try:
-                if component_name in component_instances:
-                    instance = component_instances[component_name]
-                    if instance.uninstall():
-                        uninstalled_components.append(component_name)
-                        logger.debug(f"Successfully uninstalled {component_name}")
+                try:
+                    if component_name in component_instances:
+                        instance = component_instances[component_name]
+                        if instance.uninstall():
+                            uninstalled_components.append(component_name)
+                            logger.debug(f"Successfully uninstalled {component_name}")
+                        else:
+                            failed_components.append(component_name)
+                            logger.error(f"Failed to uninstall {component_name}")
                     else:
-                        failed_components.append(component_name)
-                        logger.error(f"Failed to uninstall {component_name}")
-                else:
-                    logger.warning(f"Component {component_name} not found, skipping")
+                        logger.warning(f"Component {component_name} not found, skipping")
                     
-            except Exception as e:
-                logger.error(f"Error uninstalling {component_name}: {e}")
-                failed_components.append(component_name)
+                except Exception as e:
+                    logger.error(f"Error uninstalling {component_name}: {e}")
+                    failed_components.append(component_name)
             
-            progress.update(i + 1, f"Processed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
+                progress.update(i + 1, f"Processed {component_name}")
+                time.sleep(0.1)  # Brief pause for visual effect
         
         progress.finish("Uninstall complete")
         
@@ -370,43 +399,43 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
 
 
 def cleanup_installation_directory(install_dir: Path, args: argparse.Namespace) -> None:
-    """Clean up installation directory for complete uninstall"""
+    """
+    Remove SuperClaude's own bookkeeping after a complete uninstall
+    
+    Component files are already gone at this point. Only entries
+    SuperClaude creates are removed, so the install directory is never
+    scanned and everything else in it (project histories, Claude Code
+    settings) is left alone. Directories the components created are
+    removed only once they are empty.
+    """
     logger = get_logger()
-    file_manager = FileManager()
+    file_manager = FileManager(dry_run=args.dry_run)
     
     try:
-        # Preserve specific directories/files if requested
-        preserve_patterns = []
-        
-        if args.keep_backups:
-            preserve_patterns.append("backups/*")
-        if args.keep_logs:
-            preserve_patterns.append("logs/*")
-        if args.keep_settings and not args.complete:
-            preserve_patterns.append("settings.json")
-        
-        # Remove installation directory contents
-        if args.complete and not preserve_patterns:
-            # Complete removal
-            if file_manager.remove_directory(install_dir):
-                logger.info(f"Removed installation directory: {install_dir}")
-            else:
-                logger.warning(f"Could not remove installation directory: {install_dir}")
+        for name in (SettingsManager(install_dir).metadata_file.name,
+                     InstallManifest.MANIFEST_NAME, InstallJournal.JOURNAL_NAME):
+            file_manager.remove_file(install_dir / name)
+        
+        bookkeeping_dirs = [StagedInstall.STAGING_DIR, ProbeCache.CACHE_DIR, FrameworkStore.LINK_DIR]
+        if not args.keep_backups:
+            bookkeeping_dirs.append("backups")
+        if not args.keep_logs:
+            bookkeeping_dirs.append("logs")
+        
+        for name in bookkeeping_dirs:
+            if not file_manager.remove_directory(install_dir / name, recursive=True):
+                logger.warning(f"Could not remove {install_dir / name}")
+        
+        # Deepest first; non-empty directories hold user files and stay
+        for directory in (install_dir / "commands" / "sc", install_dir / "commands",
+                          install_dir / "hooks", install_dir):
+            if directory.is_dir() and not any(directory.iterdir()):
+                file_manager.remove_directory(directory)
+        
+        if install_dir.exists():
+            logger.info(f"Kept {install_dir}: it contains files SuperClaude did not install")
         else:
-            # Selective removal
-            for item in install_dir.iterdir():
-                should_preserve = False
-                
-                for pattern in preserve_patterns:
-                    if item.match(pattern):
-                        should_preserve = True
-                        break
-                
-                if not should_preserve:
-                    if item.is_file():
-                        file_manager.remove_file(item)
-                    elif item.is_dir():
-                        file_manager.remove_directory(item)
+            logger.info(f"Removed installation directory: {install_dir}")
                         
     except Exception as e:
         logger.error(f"Error during cleanup: {e}")
@@ -433,6 +462,9 @@ def run(args: argparse.Namespace) -> int:
                 "Removing SuperClaude framework components"
             )
         
+        if args.keep_settings:
+            logger.warning("--keep-settings is deprecated and has no effect: settings.json is never removed")
+        
         # Get installation information
         info = get_installation_info(args.install_dir)
         
@@ -461,7 +493,7 @@ def run(args: argparse.Namespace) -> int:
         # Confirmation
         if not args.no_confirm and not args.yes:
             if args.complete:
-                warning_msg = "This will completely remove SuperClaude. Continue?"
+                warning_msg = "This will remove all SuperClaude files (your own files and settings.json are kept). Continue?"
             else:
                 warning_msg = f"This will remove {len(components)} component(s). Continue?"
             
@@ -14,6 +14,7 @@ from ..core.registry import ComponentRegistry
 from ..core.config_manager import ConfigManager
 from ..core.settings_manager import SettingsManager
 from ..core.validator import Validator
+from ..core.probe import ProbeCache, get_probe_engine
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
@@ -76,6 +77,62 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Copy every file even if the installed copy is unchanged"
+    )
+    
+    parser.add_argument(
+        "--no-staging",
+        action="store_true",
+        help="Write files directly into the install directory instead of staging and swapping"
+    )
+    
+    parser.add_argument(
+        "--copy-mode",
+        choices=["auto", "hardlink", "plain"],
+        default="auto",
+        help="How to copy framework files: reflink/in-kernel copy when possible, hard links to the source (files must not be edited in place), or a plain byte copy (default: auto)"
+    )
+    
+    parser.add_argument(
+        "--store-dir",
+        type=Path,
+        help="Link framework and command files to a shared read-only store (e.g. /opt/superclaude) instead of copying them"
+    )
+    
+    parser.add_argument(
+        "--no-probe-cache",
+        action="store_true",
+        help="Re-run tool version probes instead of reusing cached results"
+    )
+    
+    parser.add_argument(
+        "--mcp-backend",
+        choices=["cli", "config"],
+        default=None,
+        help="Register MCP servers one at a time with the claude CLI, or write them all straight into ~/.claude.json in one batch (default: the backend used at install time)"
+    )
+    
+    parser.add_argument(
+        "--mcp-prefetch",
+        action="store_true",
+        help="Download MCP server packages into the npm cache during update"
+    )
+    
+    parser.add_argument(
+        "--npm-cache",
+        type=Path,
+        help="npm cache directory for pre-fetched MCP packages (also used by the servers at runtime)"
+    )
+    
+    parser.add_argument(
+        "--mcp-package-dir",
+        type=Path,
+        help="Install MCP servers offline from npm tarballs in this directory (implies --mcp-prefetch)"
+    )
+    
     # Update options
     parser.add_argument(
         "--reinstall",
@@ -89,7 +146,8 @@ Examples:
 def check_installation_exists(install_dir: Path) -> bool:
     """Check if SuperClaude is installed"""
     settings_file = install_dir / "settings.json"
-    return settings_file.exists()
+    metadata_file = install_dir / ".superclaude-metadata.json"
+    return settings_file.exists() or metadata_file.exists()
 
 
 def get_installed_components(install_dir: Path) -> Dict[str, str]:
@@ -106,6 +164,12 @@ def get_installed_components(install_dir: Path) -> Dict[str, str]:
                 if version:
                     components[component_name] = version
         
+        # Components register themselves in the metadata components section
+        for component_name, component_info in settings_manager.get_installed_components().items():
+            version = component_info.get("version")
+            if version and component_name not in components:
+                components[component_name] = version
+        
         return components
     except Exception:
         return {}
@@ -287,7 +351,15 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
             "force": args.force,
             "backup": backup,
             "dry_run": args.dry_run,
-            "update_mode": True
+            "update_mode": True,
+            "incremental": not args.no_incremental,
+            "staged": not args.no_staging,
+            "copy_mode": args.copy_mode,
+            "store_dir": args.store_dir,
+            "mcp_backend": args.mcp_backend,
+            "mcp_prefetch": args.mcp_prefetch,
+            "npm_cache": args.npm_cache,
+            "mcp_package_dir": args.mcp_package_dir
         }
         
         success = installer.update_components(components, config)
@@ -357,6 +429,10 @@ def run(args: argparse.Namespace) -> int:
             logger.info("Use 'SuperClaude.py install' to install SuperClaude first")
             return 1
         
+        # Reuse tool probe results from earlier runs while the tools are unchanged
+        if not args.no_probe_cache and not args.dry_run:
+            get_probe_engine().use_cache(ProbeCache.for_install_dir(args.install_dir))
+        
         # Create component registry
         logger.info("Checking for available updates...")
         
@@ -1,14 +1,18 @@
 """Utility modules for SuperClaude installation system"""
 
-from .ui import ProgressBar, Menu, confirm, Colors
-from .logger import Logger
-from .security import SecurityValidator
-
-__all__ = [
-    'ProgressBar',
-    'Menu', 
-    'confirm',
-    'Colors',
-    'Logger',
-    'SecurityValidator'
-]
\ No newline at end of file
+from .lazy import lazy_exports
+
+# Public name -> defining submodule. Submodules are imported on first use,
+# so importing one module of this package does not load all of them.
+_EXPORTS = {
+    'ProgressBar': 'ui',
+    'Menu': 'ui',
+    'confirm': 'ui',
+    'Colors': 'ui',
+    'Logger': 'logger',
+    'SecurityValidator': 'security'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,267 @@
+"""
+Compression codecs for SuperClaude backup archives
+Pluggable stdlib codecs, optional zstd, and multi-threaded gzip
+"""
+
+import bz2
+import gzip
+import lzma
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, BinaryIO
+from pathlib import Path
+
+# Try to import zstandard for fast multi-threaded compression
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class Codec:
+    """Description of one compression codec"""
+
+    def __init__(self, name: str, extension: str, magic: bytes,
+                 default_level: Optional[int], level_range: Optional[range],
+                 threaded: bool = False):
+        """
+        Initialize codec description
+
+        Args:
+            name: Codec name used on the command line
+            extension: Archive file extension
+            magic: Leading bytes identifying the compressed stream
+            default_level: Compression level used when none is given
+            level_range: Valid compression levels (None if not tunable)
+            threaded: Whether the codec can compress with several threads
+        """
+        self.name = name
+        self.extension = extension
+        self.magic = magic
+        self.default_level = default_level
+        self.level_range = level_range
+        self.threaded = threaded
+
+
+CODECS: Dict[str, Codec] = {
+    "gzip": Codec("gzip", ".tar.gz", b"\x1f\x8b", 9, range(0, 10), threaded=True),
+    "bzip2": Codec("bzip2", ".tar.bz2", b"BZh", 9, range(1, 10)),
+    "xz": Codec("xz", ".tar.xz", b"\xfd7zXZ\x00", 6, range(0, 10)),
+    "zstd": Codec("zstd", ".tar.zst", b"\x28\xb5\x2f\xfd", 3, range(1, 23), threaded=True),
+    "none": Codec("none", ".tar", b"", None, None),
+}
+
+
+def available_codecs() -> List[str]:
+    """
+    Get names of codecs usable in this environment
+
+    Returns:
+        List of codec names
+    """
+    return [name for name in CODECS if name != "zstd" or ZSTD_AVAILABLE]
+
+
+def archive_extensions() -> List[str]:
+    """Get every archive extension any codec can produce"""
+    return [codec.extension for codec in CODECS.values()]
+
+
+def detect_codec(file_path: Path) -> str:
+    """
+    Detect the codec of a file from its magic bytes
+
+    Args:
+        file_path: Compressed file path
+
+    Returns:
+        Codec name ("none" if no known magic matches)
+    """
+    with open(file_path, 'rb') as f:
+        header = f.read(8)
+
+    for codec in CODECS.values():
+        if codec.magic and header.startswith(codec.magic):
+            return codec.name
+    return "none"
+
+
+def resolve_level(codec_name: str, level: Optional[int]) -> Optional[int]:
+    """
+    Validate a compression level for a codec
+
+    Args:
+        codec_name: Codec name
+        level: Requested level or None for the codec default
+
+    Returns:
+        Level to use
+
+    Raises:
+        ValueError: If codec is unknown or level out of range
+    """
+    if codec_name not in CODECS:
+        raise ValueError(f"Unknown compression method: {codec_name}")
+
+    codec = CODECS[codec_name]
+    if level is None or codec.level_range is None:
+        return codec.default_level
+    if level not in codec.level_range:
+        raise ValueError(
+            f"Compression level {level} out of range for {codec_name} "
+            f"({codec.level_range.start}-{codec.level_range.stop - 1})"
+        )
+    return level
+
+
+class ParallelGzipWriter:
+    """
+    Multi-threaded gzip writer
+
+    Input is cut into fixed-size blocks, each compressed as an independent
+    gzip member in a thread pool (zlib releases the GIL). Members are written
+    in order; concatenated members form a valid gzip stream readable by any
+    gzip decoder. At most 2 * threads blocks are in flight, so memory stays
+    bounded.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, fileobj: BinaryIO, level: int = 9, threads: int = 2):
+        """
+        Initialize parallel gzip writer
+
+        Args:
+            fileobj: Destination file object (left open on close)
+            level: zlib compression level
+            threads: Number of compression threads
+        """
+        self._fileobj = fileobj
+        self._level = level
+        self._threads = max(1, threads)
+        self._pool = ThreadPoolExecutor(max_workers=self._threads)
+        self._pending = deque()
+        self._buffer = bytearray()
+        self.closed = False
+
+    def _compress_block(self, block: bytes) -> bytes:
+        """Compress one block as a standalone gzip member"""
+        return gzip.compress(block, compresslevel=self._level, mtime=0)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._pool.submit(self._compress_block, block))
+        while len(self._pending) > self._threads * 2:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def write(self, data) -> int:
+        """Buffer data and dispatch full blocks for compression"""
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.BLOCK_SIZE:
+            self._submit(bytes(self._buffer[:self.BLOCK_SIZE]))
+            del self._buffer[:self.BLOCK_SIZE]
+        return len(data)
+
+    def flush(self) -> None:
+        """Nothing to flush until close - blocks must stay whole"""
+
+    def close(self) -> None:
+        """Compress remaining data and write all pending members in order"""
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self._pending:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            self._pool.shutdown(wait=True)
+            self.closed = True
+
+
+def open_writer(fileobj: BinaryIO, codec_name: str, level: Optional[int] = None,
+                threads: int = 1) -> BinaryIO:
+    """
+    Wrap a binary file object in a compressing writer
+
+    The returned writer must be closed; closing it does not close fileobj.
+
+    Args:
+        fileobj: Destination file object
+        codec_name: Codec name
+        level: Compression level (None for codec default)
+        threads: Compression threads (gzip and zstd only)
+
+    Returns:
+        Writable binary file object
+
+    Raises:
+        ValueError: If codec is unknown, unavailable or level invalid
+    """
+    level = resolve_level(codec_name, level)
+
+    if codec_name == "gzip":
+        if threads > 1:
+            return ParallelGzipWriter(fileobj, level=level, threads=threads)
+        return gzip.GzipFile(fileobj=fileobj, mode='wb', compresslevel=level, mtime=0)
+    if codec_name == "bzip2":
+        return bz2.BZ2File(fileobj, mode='wb', compresslevel=level)
+    if codec_name == "xz":
+        return lzma.LZMAFile(fileobj, mode='wb', preset=level)
+    if codec_name == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        compressor = zstandard.ZstdCompressor(level=level, threads=threads if threads > 1 else 0)
+        return compressor.stream_writer(fileobj, closefd=False)
+    return _Passthrough(fileobj)
+
+
+def open_reader(fileobj: BinaryIO, codec_name: str) -> BinaryIO:
+    """
+    Wrap a binary file object in a decompressing reader
+
+    Args:
+        fileobj: Source file object
+        codec_name: Codec name (see detect_codec)
+
+    Returns:
+        Readable binary file object
+
+    Raises:
+        ValueError: If codec is unknown or unavailable
+    """
+    if codec_name == "gzip":
+        # GzipFile reads concatenated members written by ParallelGzipWriter
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')
+    if codec_name == "bzip2":
+        return bz2.BZ2File(fileobj, mode='rb')
+    if codec_name == "xz":
+        return lzma.LZMAFile(fileobj, mode='rb')
+    if codec_name == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Archive is zstd compressed but the 'zstandard' package is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False)
+    if codec_name == "none":
+        return _Passthrough(fileobj)
+    raise ValueError(f"Unknown compression method: {codec_name}")
+
+
+class _Passthrough:
+    """File wrapper whose close() leaves the underlying file open"""
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+
+    def write(self, data) -> int:
+        return self._fileobj.write(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._fileobj.read(size)
+
+    def flush(self) -> None:
+        self._fileobj.flush()
+
+    def close(self) -> None:
+        if self._fileobj.writable():
+            self._fileobj.flush()
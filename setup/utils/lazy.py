@@ -0,0 +1,39 @@
+"""
+Lazy package exports for SuperClaude installation system
+Lets a package __init__ name its public classes without importing the
+submodules that define them until they are first used
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build the module-level __getattr__ and __dir__ for a package
+
+    Usage in a package __init__:
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+    Args:
+        package: Name of the package (its __name__)
+        exports: Public name -> submodule (relative to the package) defining it
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions for the package
+    """
+    def __getattr__(name: str) -> object:
+        """Import the submodule defining a public name on first access"""
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{module_name}", package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -4,6 +4,7 @@ Logging system for SuperClaude installation suite
 
 import logging
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -39,6 +40,7 @@ class Logger:
         self.console_level = console_level
         self.file_level = file_level
         self.session_start = datetime.now()
+        self._format_lock = threading.Lock()
         
         # Create logger
         self.logger = logging.getLogger(name)
@@ -174,14 +176,17 @@ class Logger:
         if self.logger.handlers:
             console_handler = self.logger.handlers[0]
             if hasattr(console_handler, 'formatter'):
-                original_format = console_handler.formatter.format
-                
                 def success_format(record):
                     return f"{Colors.GREEN}[✓] {record.getMessage()}{Colors.RESET}"
                 
-                console_handler.formatter.format = success_format
-                self.logger.info(message, **kwargs)
-                console_handler.formatter.format = original_format
+                # Formatter swap must not interleave with other threads
+                with self._format_lock:
+                    original_format = console_handler.formatter.format
+                    console_handler.formatter.format = success_format
+                    try:
+                        self.logger.info(message, **kwargs)
+                    finally:
+                        console_handler.formatter.format = original_format
             else:
                 self.logger.info(f"SUCCESS: {message}", **kwargs)
         else:
@@ -247,6 +252,11 @@ class Logger:
         if self.logger.handlers:
             self.logger.handlers[0].setLevel(level.value)
     
+    def set_console_stream(self, stream) -> None:
+        """Send console output to another stream (stderr when stdout carries data)"""
+        if self.logger.handlers:
+            self.logger.handlers[0].setStream(stream)
+    
     def set_file_level(self, level: LogLevel) -> None:
         """Change file logging level"""
         self.file_level = level
@@ -282,12 +292,17 @@ class Logger:
 _global_logger: Optional[Logger] = None
 
 
-def get_logger(name: str = "superclaude") -> Logger:
-    """Get or create global logger instance"""
+def get_logger(name: Optional[str] = None) -> Logger:
+    """
+    Get or create global logger instance
+    
+    Without a name the logger configured by setup_logging() is returned,
+    so its console level (--quiet/--verbose) and stream apply everywhere.
+    """
     global _global_logger
     
-    if _global_logger is None or _global_logger.name != name:
-        _global_logger = Logger(name)
+    if _global_logger is None or (name is not None and _global_logger.name != name):
+        _global_logger = Logger(name or "superclaude")
     
     return _global_logger
 
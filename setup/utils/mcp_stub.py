@@ -0,0 +1,80 @@
+"""
+Stand-in MCP server for SuperClaude benchmarks
+Speaks the MCP stdio transport (newline-delimited JSON-RPC) with no dependencies
+
+Run as: python setup/utils/mcp_stub.py [--delay SECONDS] [--tools N]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+
+PROTOCOL_VERSION = "2024-11-05"
+
+
+def _respond(request_id, result) -> None:
+    """Write one JSON-RPC response line"""
+    sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}) + "\n")
+    sys.stdout.flush()
+
+
+def _error(request_id, code: int, message: str) -> None:
+    """Write one JSON-RPC error line"""
+    sys.stdout.write(json.dumps({
+        "jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}
+    }) + "\n")
+    sys.stdout.flush()
+
+
+def main(argv=None) -> int:
+    """Serve initialize, tools/list and ping until stdin closes"""
+    parser = argparse.ArgumentParser(description="Stand-in MCP server")
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Seconds to sleep before serving (simulates startup cost)")
+    parser.add_argument("--tools", type=int, default=3,
+                        help="Number of tools to advertise")
+    args = parser.parse_args(argv)
+
+    if args.delay > 0:
+        time.sleep(args.delay)
+
+    tools = [
+        {
+            "name": f"stub_tool_{i}",
+            "description": f"Stand-in tool {i}",
+            "inputSchema": {"type": "object", "properties": {}}
+        }
+        for i in range(args.tools)
+    ]
+
+    for line in sys.stdin:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+
+        method = message.get("method")
+        request_id = message.get("id")
+        if request_id is None:
+            continue  # Notification - nothing to answer
+
+        if method == "initialize":
+            _respond(request_id, {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "superclaude-mcp-stub", "version": "1.0.0"}
+            })
+        elif method == "tools/list":
+            _respond(request_id, {"tools": tools})
+        elif method == "ping":
+            _respond(request_id, {})
+        else:
+            _error(request_id, -32601, f"Method not found: {method}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Process utilities for SuperClaude installation system
+Liveness checks for processes that own locks or transactions
+"""
+
+import os
+import sys
+
+
+def pid_alive(pid: int) -> bool:
+    """
+    Check whether a process with this id is running
+
+    The current process counts as not alive: anything it finds under its
+    own pid was left by an earlier process that had the same id.
+
+    Args:
+        pid: Process id
+
+    Returns:
+        True if another process with this id exists, False otherwise
+    """
+    if pid <= 0 or pid == os.getpid():
+        return False
+
+    if sys.platform == "win32":
+        # os.kill(pid, 0) would terminate the process on Windows
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    except OSError:
+        return False
+    return True
@@ -532,8 +532,13 @@ class SecurityValidator:
             if not is_safe:
                 errors.append(f"Invalid source path {source}: {msg}")
             
-            # Validate target path
-            is_safe, msg = cls.validate_path(target, base_target_dir)
+            # Validate target path. A symlinked target (e.g. a link into a shared
+            # framework store) is replaced, never written through, so only the
+            # directory holding the link has to be inside the target directory
+            if target.is_symlink():
+                is_safe, msg = cls.validate_path(target.parent, base_target_dir)
+            else:
+                is_safe, msg = cls.validate_path(target, base_target_dir)
             if not is_safe:
                 errors.append(f"Invalid target path {target}: {msg}")
             
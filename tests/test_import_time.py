@@ -0,0 +1,93 @@
+"""
+Import-time checks for the SuperClaude CLI
+
+Runs SuperClaude.py under `python -X importtime` and checks which setup
+modules each invocation loads: --help and --version must not import any
+operation or core module, and `<operation> --help` only the modules that
+operation needs.
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CLI = REPO_ROOT / "SuperClaude.py"
+
+
+def import_times(*cli_args: str) -> Dict[str, int]:
+    """
+    Run the CLI under -X importtime
+
+    Returns:
+        Dict of imported setup module name to cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(CLI), *cli_args],
+        capture_output=True,
+        text=True,
+        cwd=str(REPO_ROOT),
+        timeout=60
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cumulative.isdigit() and (name == "setup" or name.startswith("setup.")):
+            modules[name] = int(cumulative)
+    return modules
+
+
+class ImportTimeTest(unittest.TestCase):
+    """CLI startup imports only what the selected operation needs"""
+
+    def assert_not_imported(self, modules: Dict[str, int], prefixes: List[str]):
+        loaded = sorted(name for name in modules if any(name.startswith(p) for p in prefixes))
+        self.assertEqual(loaded, [], f"unexpected imports (cumulative us): {modules}")
+
+    def test_help_imports_no_operations(self):
+        for args in (["--help"], ["--version"]):
+            with self.subTest(args=args):
+                modules = import_times(*args)
+                self.assertIn("setup", modules)
+                self.assert_not_imported(modules, ["setup.operations", "setup.core", "setup.base"])
+
+    def test_operation_help_imports_only_that_operation(self):
+        modules = import_times("backup", "--help")
+        self.assertIn("setup.operations.backup", modules)
+        self.assert_not_imported(modules, [
+            "setup.operations.install",
+            "setup.operations.update",
+            "setup.operations.uninstall",
+            "setup.operations.mcp_bench",
+            "setup.base",
+            "setup.components",
+            "setup.core.registry",
+            "setup.core.validator",
+            "setup.core.config_manager",
+            "setup.core.mcp_bench",
+            "setup.core.manifest",
+        ])
+
+    def test_core_package_is_lazy(self):
+        # Importing one core module must not drag in the rest of the package
+        code = (
+            "import sys; import setup.core.settings_manager; "
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('setup.core.'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, cwd=str(REPO_ROOT), timeout=60
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(
+            result.stdout.split(),
+            ["setup.core.copy_strategy", "setup.core.file_manager", "setup.core.settings_manager"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
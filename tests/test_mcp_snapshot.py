@@ -0,0 +1,128 @@
+"""
+Tests for the MCP component's `claude mcp list` snapshot
+
+Runs MCPComponent against the fake claude CLI in tests/fakes, which logs
+every invocation, so the number of CLI calls per operation can be checked.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FAKES_DIR = REPO_ROOT / "tests" / "fakes"
+sys.path.insert(0, str(REPO_ROOT))
+
+from setup.components.mcp import MCPComponent  # noqa: E402
+
+
+@unittest.skipIf(sys.platform == "win32", "fake claude CLI is a POSIX script")
+class MCPSnapshotTest(unittest.TestCase):
+    """One `claude mcp list` per operation, refreshed after mutations"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmp.name)
+        self.install_dir = tmp / "claude"
+        self.install_dir.mkdir()
+        self.state_file = tmp / "servers.json"
+        self.log_file = tmp / "calls.log"
+
+        env = {
+            "PATH": f"{FAKES_DIR}{os.pathsep}{os.environ.get('PATH', '')}",
+            "FAKE_CLAUDE_STATE": str(self.state_file),
+            "FAKE_CLAUDE_LOG": str(self.log_file),
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def make_component(self) -> MCPComponent:
+        component = MCPComponent(self.install_dir)
+        # node/npm are not part of this test; the snapshot only talks to claude
+        component.validate_prerequisites = lambda: (True, [])
+        return component
+
+    def calls(self, prefix: str) -> int:
+        if not self.log_file.exists():
+            return 0
+        lines = self.log_file.read_text(encoding="utf-8").splitlines()
+        return sum(1 for line in lines if line.startswith(prefix))
+
+    def reset_calls(self):
+        if self.log_file.exists():
+            self.log_file.unlink()
+
+    def registered(self):
+        return json.loads(self.state_file.read_text(encoding="utf-8"))
+
+    def test_install_lists_once(self):
+        component = self.make_component()
+        self.assertTrue(component.install({"jobs": 4}))
+
+        self.assertEqual(self.calls("mcp list"), 1)
+        self.assertEqual(self.calls("mcp add"), len(component.mcp_servers))
+        self.assertEqual(set(self.registered()), set(component.mcp_servers))
+
+    def test_snapshot_tracks_successful_mutations(self):
+        component = self.make_component()
+        self.assertTrue(component.install({"jobs": 4}))
+
+        # The adds were applied to the snapshot; nothing is listed again
+        state = component._get_mcp_state()
+        self.assertEqual(set(state), set(component.mcp_servers))
+        self.assertEqual(state["context7"], "npx @context7/mcp")
+        valid, errors = component.validate_installation()
+        self.assertTrue(valid, errors)
+        self.assertEqual(self.calls("mcp list"), 1)
+
+    def test_failed_mutation_refreshes_snapshot(self):
+        component = self.make_component()
+        with mock.patch.dict(os.environ, {"FAKE_CLAUDE_FAIL_ADD": "magic"}):
+            self.assertTrue(component.install({"jobs": 1}))  # magic is optional
+
+        # The failed add invalidated the snapshot, so verification listed again
+        self.assertEqual(self.calls("mcp list"), 2)
+        state = component._get_mcp_state()
+        self.assertNotIn("magic", state)
+        self.assertEqual(set(state), set(self.registered()))
+        self.assertEqual(self.calls("mcp list"), 2)
+
+    def test_uninstall_lists_once(self):
+        self.assertTrue(self.make_component().install({"jobs": 4}))
+        self.reset_calls()
+
+        component = self.make_component()
+        self.assertTrue(component.uninstall())
+
+        self.assertEqual(self.calls("mcp list"), 1)
+        self.assertEqual(self.calls("mcp remove"), len(component.mcp_servers))
+        self.assertEqual(self.registered(), {})
+        self.assertEqual(component._get_mcp_state(), {})
+        self.assertEqual(self.calls("mcp list"), 1)
+
+    def test_second_install_skips_registered_servers(self):
+        self.assertTrue(self.make_component().install({"jobs": 4}))
+        self.reset_calls()
+
+        self.assertTrue(self.make_component().install({"jobs": 4}))
+        self.assertEqual(self.calls("mcp list"), 1)
+        self.assertEqual(self.calls("mcp add"), 0)
+
+    def test_add_passes_name_before_env(self):
+        component = self.make_component()
+        npm_cache = Path(self._tmp.name) / "npm-cache"
+        self.assertTrue(component.install({"jobs": 4, "npm_cache": str(npm_cache)}))
+
+        server = self.registered()["context7"]
+        self.assertEqual(server["command"], ["npx", "@context7/mcp"])
+        self.assertEqual(server["env"], {"npm_config_cache": str(npm_cache.resolve())})
+
+
+if __name__ == "__main__":
+    unittest.main()